@@ -0,0 +1,108 @@
+"""Offline debate benchmark: no network or API keys needed.
+
+Examples:
+    uv run python scripts/benchmark.py
+    uv run python scripts/benchmark.py --latency 0.5 --sigma 0.3 --concurrency 16
+    uv run python scripts/benchmark.py --json > baseline.json
+    uv run python scripts/benchmark.py --baseline baseline.json --tolerance 0.2
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import sys
+
+from llm_fight_club.benchmark import benchmark_debates
+from llm_fight_club.clients.fake import FakeLLM
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark FightClubGroupChat against a fake LLM")
+    parser.add_argument("--debates", type=int, default=20, help="Debates to run (default: 20)")
+    parser.add_argument("--rounds", type=int, default=8, help="Rounds per debate (default: 8)")
+    parser.add_argument("--concurrency", type=int, default=4, help="Debates at once (default: 4)")
+    parser.add_argument("--latency", type=float, default=0.0, help="Median response latency in seconds")
+    parser.add_argument("--sigma", type=float, default=0.0, help="Log-normal latency sigma")
+    parser.add_argument("--chunk-interval", type=float, default=0.0, help="Seconds between stream chunks")
+    parser.add_argument("--tokens", type=int, default=64, help="Completion tokens per response")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of calls failing with 503")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument("--no-stream", action="store_true", help="Use run() instead of stream()")
+    parser.add_argument(
+        "--scheduler",
+        choices=["llm", "round_robin", "mention"],
+        default="llm",
+        help="Speaker selection (default: llm)",
+    )
+    parser.add_argument(
+        "--speculate",
+        action="store_true",
+        help="Start the likely next speaker while the orchestrator decides",
+    )
+    parser.add_argument("--memory", action="store_true", help="Measure peak memory (slower)")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    parser.add_argument("--baseline", type=str, default=None, help="JSON results to compare against")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="Allowed throughput drop vs. the baseline (default: 0.2)",
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    # The orchestrator logs an error whenever a debate hits its round limit
+    logging.getLogger("agent_framework").setLevel(logging.CRITICAL)
+
+    llm = FakeLLM(
+        latency=args.latency,
+        latency_sigma=args.sigma,
+        chunk_interval=args.chunk_interval,
+        completion_tokens=args.tokens,
+        error_rate=args.error_rate,
+        seed=args.seed,
+    )
+    result = asyncio.run(
+        benchmark_debates(
+            llm,
+            debates=args.debates,
+            rounds=args.rounds,
+            concurrency=args.concurrency,
+            stream=not args.no_stream,
+            measure_memory=args.memory,
+            scheduler=None if args.scheduler == "llm" else args.scheduler,
+            speculate=args.speculate,
+        )
+    )
+
+    if args.json:
+        print(json.dumps(result.to_dict(), indent=2))
+    else:
+        print(f"Debates:      {result.debates} ({result.errors} failed)")
+        print(f"Elapsed:      {result.elapsed_seconds:.2f}s")
+        print(f"Debates/sec:  {result.debates_per_second:.2f}")
+        print(f"Turns:        {result.turns} ({result.ms_per_turn:.2f} ms/turn)")
+        print(f"LLM calls:    {result.llm_calls}")
+        if result.speculation_launched:
+            print(f"Speculation:  {result.speculation_hits}/{result.speculation_launched} hits")
+        if result.peak_memory_bytes is not None:
+            print(f"Peak memory:  {result.peak_memory_bytes / 1024 / 1024:.1f} MiB")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        floor = baseline["debates_per_second"] * (1 - args.tolerance)
+        if result.debates_per_second < floor:
+            print(
+                f"Regression: {result.debates_per_second:.2f} debates/sec "
+                f"< {floor:.2f} (baseline {baseline['debates_per_second']:.2f})",
+                file=sys.stderr,
+            )
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
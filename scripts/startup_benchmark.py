@@ -0,0 +1,108 @@
+"""Measure CLI cold-start cost with ``python -X importtime``.
+
+Each run imports the module in a fresh interpreter, like a serverless cold
+start, and reports the median import time plus the packages that cost most.
+
+Examples:
+    uv run python scripts/startup_benchmark.py
+    uv run python scripts/startup_benchmark.py --module llm_fight_club.workflows.group_chat
+    uv run python scripts/startup_benchmark.py --json > startup.json
+    uv run python scripts/startup_benchmark.py --baseline startup.json --tolerance 0.2
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark import time of the CLI")
+    parser.add_argument("--module", type=str, default="llm_fight_club.main", help="Module to import")
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters to start (default: 5)")
+    parser.add_argument("--top", type=int, default=10, help="Slowest top-level packages to list")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    parser.add_argument("--baseline", type=str, default=None, help="JSON results to compare against")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="Allowed import time increase vs. the baseline (default: 0.2)",
+    )
+    return parser.parse_args()
+
+
+def measure(module: str) -> tuple[float, float, dict[str, float]]:
+    """Import ``module`` in a new interpreter.
+
+    Returns:
+        Wall-clock seconds for the whole process, the module's cumulative
+        import seconds, and self import seconds per top-level package.
+    """
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    wall = time.perf_counter() - start
+
+    cumulative = 0.0
+    packages: dict[str, float] = defaultdict(float)
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        name = name.strip()
+        packages[name.split(".")[0]] += int(self_us) / 1e6
+        if name == module:
+            cumulative = int(cumulative_us) / 1e6
+    return wall, cumulative, dict(packages)
+
+
+def main() -> None:
+    args = parse_args()
+    runs = [measure(args.module) for _ in range(args.runs)]
+    packages: dict[str, float] = defaultdict(float)
+    for _, _, per_package in runs:
+        for name, seconds in per_package.items():
+            packages[name] += seconds / len(runs)
+    slowest = sorted(packages.items(), key=lambda item: item[1], reverse=True)[: args.top]
+
+    result = {
+        "module": args.module,
+        "runs": args.runs,
+        "wall_ms": statistics.median(wall for wall, _, _ in runs) * 1000,
+        "import_ms": statistics.median(cumulative for _, cumulative, _ in runs) * 1000,
+        "packages_ms": {name: seconds * 1000 for name, seconds in slowest},
+    }
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        print(f"Module:       {args.module} ({args.runs} runs, median)")
+        print(f"Import time:  {result['import_ms']:.1f} ms")
+        print(f"Process time: {result['wall_ms']:.1f} ms (interpreter start included)")
+        print("Slowest packages (self time):")
+        for name, ms in result["packages_ms"].items():
+            print(f"  {name:<24} {ms:8.1f} ms")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        ceiling = baseline["import_ms"] * (1 + args.tolerance)
+        if result["import_ms"] > ceiling:
+            print(
+                f"Regression: {result['import_ms']:.1f} ms import "
+                f"> {ceiling:.1f} ms (baseline {baseline['import_ms']:.1f} ms)",
+                file=sys.stderr,
+            )
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
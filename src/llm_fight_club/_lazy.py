@@ -0,0 +1,40 @@
+"""Lazy attribute loading for package ``__init__`` modules.
+
+litellm alone takes seconds to import, so packages re-export their public
+names through a module-level ``__getattr__`` and a submodule is imported
+only when one of its names is first used.
+"""
+
+import sys
+from collections.abc import Callable
+from importlib import import_module
+from typing import Any
+
+
+def lazy_exports(
+    package: str,
+    exports: dict[str, str],
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Build ``__getattr__`` and ``__dir__`` for a package.
+
+    Args:
+        package: ``__name__`` of the package
+        exports: Public name -> submodule (relative to the package) defining it
+
+    Returns:
+        Functions to assign to the package's ``__getattr__`` and ``__dir__``
+    """
+
+    def __getattr__(name: str) -> Any:
+        submodule = exports.get(name)
+        if submodule is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(import_module(f"{package}.{submodule}"), name)
+        # Later lookups find the name directly and skip this hook
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted({*vars(sys.modules[package]), *exports})
+
+    return __getattr__, __dir__
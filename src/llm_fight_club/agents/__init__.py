@@ -1,33 +1,48 @@
 """LLM Fight Club agents."""
 
-from llm_fight_club.agents.base import AgentResponse, BaseAgent, Message
-from llm_fight_club.agents.claude import ClaudeAgent
-from llm_fight_club.agents.gemini import GeminiAgent
-from llm_fight_club.agents.gpt import GPTAgent
-from llm_fight_club.agents.grok import GrokAgent
-from llm_fight_club.agents.maf_agents import (
-    create_all_agents,
-    create_claude_agent,
-    create_gemini_agent,
-    create_gpt_agent,
-    create_grok_agent,
-    create_orchestrator_client,
-)
-from llm_fight_club.agents.orchestrator import OrchestratorAgent
+from typing import TYPE_CHECKING
 
-__all__ = [
-    "BaseAgent",
-    "Message",
-    "AgentResponse",
-    "GeminiAgent",
-    "GrokAgent",
-    "ClaudeAgent",
-    "GPTAgent",
-    "OrchestratorAgent",
-    "create_gpt_agent",
-    "create_claude_agent",
-    "create_gemini_agent",
-    "create_grok_agent",
-    "create_orchestrator_client",
-    "create_all_agents",
-]
+from llm_fight_club._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llm_fight_club.agents.base import AgentResponse, BaseAgent, Message
+    from llm_fight_club.agents.claude import ClaudeAgent
+    from llm_fight_club.agents.gemini import GeminiAgent
+    from llm_fight_club.agents.gpt import GPTAgent
+    from llm_fight_club.agents.grok import GrokAgent
+    from llm_fight_club.agents.maf_agents import (
+        create_all_agents,
+        create_claude_agent,
+        create_gemini_agent,
+        create_gpt_agent,
+        create_grok_agent,
+        create_history_compactor,
+        create_orchestrator_client,
+    )
+    from llm_fight_club.agents.orchestrator import OrchestratorAgent
+    from llm_fight_club.agents.registry import AgentRegistry, agent_registry
+
+# Public name -> submodule; submodules are imported on first use
+_EXPORTS = {
+    "BaseAgent": "base",
+    "Message": "base",
+    "AgentResponse": "base",
+    "GeminiAgent": "gemini",
+    "GrokAgent": "grok",
+    "ClaudeAgent": "claude",
+    "GPTAgent": "gpt",
+    "OrchestratorAgent": "orchestrator",
+    "create_gpt_agent": "maf_agents",
+    "create_claude_agent": "maf_agents",
+    "create_gemini_agent": "maf_agents",
+    "create_grok_agent": "maf_agents",
+    "create_orchestrator_client": "maf_agents",
+    "create_all_agents": "maf_agents",
+    "create_history_compactor": "maf_agents",
+    "AgentRegistry": "registry",
+    "agent_registry": "registry",
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
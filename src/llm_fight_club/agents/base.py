@@ -1,11 +1,14 @@
 """Base agent class for all LLM agents."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
 from typing import Any
 
-from litellm import acompletion
-
+from llm_fight_club.clients.cache import ResponseCache
+from llm_fight_club.clients.compaction import HistoryCompactor
+from llm_fight_club.clients.litellm_client import LiteLLMChatClient, to_litellm_messages
+from llm_fight_club.clients.retry import RetryPolicy, default_retry_policy
 from llm_fight_club.prompts import get_system_prompt
 
 
@@ -35,10 +38,19 @@ class BaseAgent(ABC):
     personality: str = ""
     model: str = ""
     prompt_name: str = ""  # Name of the YAML file (without .yaml)
+    retry_policy: RetryPolicy = default_retry_policy
+    compactor: HistoryCompactor | None = None
+    completion_fn: Callable[..., Awaitable[Any]] | None = None  # None = litellm.acompletion
 
-    def __init__(self, api_key: str | None = None):
+    def __init__(
+        self,
+        api_key: str | None = None,
+        cache: ResponseCache | None = None,
+    ):
         self.api_key = api_key
+        self.cache = cache
         self._system_prompt: str | None = None
+        self._client: LiteLLMChatClient | None = None
 
     @property
     def system_prompt(self) -> str:
@@ -55,27 +67,37 @@ class BaseAgent(ABC):
             return {"api_key": self.api_key}
         return {}
 
+    @property
+    def client(self) -> LiteLLMChatClient:
+        """Transport the agent calls through, created from its settings on first use.
+
+        Caching, rate limiting, retries, metrics and history
+        compaction are applied by the client exactly as for the Agent
+        Framework participants.
+        """
+        if self._client is None:
+            self._client = LiteLLMChatClient(
+                model=self.model,
+                cache=self.cache,
+                retry_policy=self.retry_policy,
+                agent_name=self.name,
+                compactor=self.compactor,
+                completion_fn=self.completion_fn,
+                **self.get_api_key_param(),
+                **self.get_extra_params(),
+            )
+        return self._client
+
     async def respond(
         self,
         message: str,
         history: list[Message] | None = None,
     ) -> AgentResponse:
-        messages = self._build_messages(message, history)
-
-        params = {
-            "model": self.model,
-            "messages": messages,
-            **self.get_api_key_param(),
-            **self.get_extra_params(),
-        }
-
-        response = await acompletion(**params)
-        content = response.choices[0].message.content
-
+        response = await self.client.get_response(self._build_messages(message, history))
         return AgentResponse(
-            content=content,
+            content=response.text,
             agent_name=self.name,
-            raw_response=response,
+            raw_response=response.raw_representation,
         )
 
     def _build_messages(
@@ -83,17 +105,11 @@ class BaseAgent(ABC):
         message: str,
         history: list[Message] | None = None,
     ) -> list[dict[str, str]]:
-        messages = [{"role": "system", "content": self.system_prompt}]
-
-        if history:
-            for msg in history:
-                msg_dict = {"role": msg.role, "content": msg.content}
-                if msg.name:
-                    msg_dict["content"] = f"[{msg.name}]: {msg.content}"
-                messages.append(msg_dict)
-
-        messages.append({"role": "user", "content": message})
-        return messages
+        return to_litellm_messages([
+            {"role": "system", "content": self.system_prompt},
+            *(history or ()),
+            {"role": "user", "content": message},
+        ])
 
     def __repr__(self) -> str:
         return f"{self.emoji} {self.name}"
@@ -3,6 +3,7 @@
 from typing import Any
 
 from llm_fight_club.agents.base import BaseAgent
+from llm_fight_club.clients.cache import ResponseCache
 from llm_fight_club.config import config
 
 
@@ -15,8 +16,12 @@ class ClaudeAgent(BaseAgent):
     model = "anthropic/claude-3-5-haiku-20241022"
     prompt_name = "claude"
 
-    def __init__(self, api_key: str | None = None):
-        super().__init__(api_key or config.anthropic_api_key)
+    def __init__(
+        self,
+        api_key: str | None = None,
+        cache: ResponseCache | None = None,
+    ):
+        super().__init__(api_key or config.anthropic_api_key, cache=cache)
 
     def get_extra_params(self) -> dict[str, Any]:
         """Extra parameters for Claude."""
@@ -1,17 +1,77 @@
 """MAF-based agents for LLM Fight Club."""
 
+from typing import Any
+
 from agent_framework import ChatAgent
 
-from llm_fight_club.clients import LiteLLMChatClient
+from llm_fight_club.clients import (
+    HistoryCompactor,
+    LiteLLMChatClient,
+    LLMSummarizer,
+    ResponseCache,
+)
+from llm_fight_club.clients.litellm_client import CompletionFn
+from llm_fight_club.clients.routing import ModelRouter, parse_routes
 from llm_fight_club.config import config
 from llm_fight_club.prompts import get_system_prompt
 
+# Model tiers per agent: the first model, then a fallback on another
+# provider. Override with <AGENT>_MODELS (see clients.routing.parse_routes).
+DEFAULT_MODEL_ROUTES = {
+    "gpt": "openai/gpt-4o,anthropic/claude-3-5-haiku-20241022",
+    "claude": "anthropic/claude-3-5-haiku-20241022,openai/gpt-4o-mini",
+    "gemini": "gemini/gemini-2.0-flash,openai/gpt-4o-mini",
+    "grok": "xai/grok-2-latest,openai/gpt-4o-mini",
+    "orchestrator": "openai/gpt-4o-mini,gemini/gemini-2.0-flash",
+}
+
+# p95 seconds after which a model is avoided, unless <AGENT>_MAX_LATENCY is set
+DEFAULT_MAX_LATENCY = 30.0
+
+
+def create_router(agent: str) -> ModelRouter:
+    """Build an agent's model router from DEFAULT_MODEL_ROUTES and the config."""
+    slo = config.route_slos.get(agent, {})
+    routes = parse_routes(
+        config.model_routes.get(agent, DEFAULT_MODEL_ROUTES[agent]),
+        api_key_for=config.api_key,
+        max_latency=slo.get("max_latency", DEFAULT_MAX_LATENCY),
+        max_cost=slo.get("max_cost"),
+    )
+    return ModelRouter(routes)
+
+
+def create_routed_client(agent: str, **kwargs: Any) -> LiteLLMChatClient:
+    """Create a client that calls the agent's healthiest model.
+
+    Args:
+        agent: Key of DEFAULT_MODEL_ROUTES
+        **kwargs: Further LiteLLMChatClient arguments
 
-def create_gpt_agent() -> ChatAgent:
+    Returns:
+        Client for the agent's primary model that falls back along its route.
+    """
+    router = create_router(agent)
+    primary = router.primary
+    return LiteLLMChatClient(
+        model=primary.model,
+        api_key=primary.api_key,
+        router=router if len(router.routes) > 1 else None,
+        **kwargs,
+    )
+
+
+def create_gpt_agent(
+    cache: ResponseCache | None = None,
+    compactor: HistoryCompactor | None = None,
+    completion_fn: CompletionFn | None = None,
+) -> ChatAgent:
     """Create GPT agent using MAF ChatAgent."""
-    client = LiteLLMChatClient(
-        model="openai/gpt-4o",
-        api_key=config.openai_api_key,
+    client = create_routed_client(
+        "gpt",
+        cache=cache,
+        compactor=compactor,
+        completion_fn=completion_fn,
     )
     return ChatAgent(
         chat_client=client,
@@ -21,11 +81,17 @@ def create_gpt_agent() -> ChatAgent:
     )
 
 
-def create_claude_agent() -> ChatAgent:
+def create_claude_agent(
+    cache: ResponseCache | None = None,
+    compactor: HistoryCompactor | None = None,
+    completion_fn: CompletionFn | None = None,
+) -> ChatAgent:
     """Create Claude agent using MAF ChatAgent."""
-    client = LiteLLMChatClient(
-        model="anthropic/claude-3-5-haiku-20241022",
-        api_key=config.anthropic_api_key,
+    client = create_routed_client(
+        "claude",
+        cache=cache,
+        compactor=compactor,
+        completion_fn=completion_fn,
     )
     return ChatAgent(
         chat_client=client,
@@ -35,11 +101,17 @@ def create_claude_agent() -> ChatAgent:
     )
 
 
-def create_gemini_agent() -> ChatAgent:
+def create_gemini_agent(
+    cache: ResponseCache | None = None,
+    compactor: HistoryCompactor | None = None,
+    completion_fn: CompletionFn | None = None,
+) -> ChatAgent:
     """Create Gemini agent using MAF ChatAgent."""
-    client = LiteLLMChatClient(
-        model="gemini/gemini-2.0-flash",
-        api_key=config.google_api_key,
+    client = create_routed_client(
+        "gemini",
+        cache=cache,
+        compactor=compactor,
+        completion_fn=completion_fn,
     )
     return ChatAgent(
         chat_client=client,
@@ -49,11 +121,17 @@ def create_gemini_agent() -> ChatAgent:
     )
 
 
-def create_grok_agent() -> ChatAgent:
+def create_grok_agent(
+    cache: ResponseCache | None = None,
+    compactor: HistoryCompactor | None = None,
+    completion_fn: CompletionFn | None = None,
+) -> ChatAgent:
     """Create Grok agent using MAF ChatAgent."""
-    client = LiteLLMChatClient(
-        model="xai/grok-2-latest",
-        api_key=config.xai_api_key,
+    client = create_routed_client(
+        "grok",
+        cache=cache,
+        compactor=compactor,
+        completion_fn=completion_fn,
     )
     return ChatAgent(
         chat_client=client,
@@ -63,19 +141,53 @@ def create_grok_agent() -> ChatAgent:
     )
 
 
-def create_orchestrator_client() -> LiteLLMChatClient:
+def create_orchestrator_client(
+    cache: ResponseCache | None = None,
+    compactor: HistoryCompactor | None = None,
+    completion_fn: CompletionFn | None = None,
+) -> LiteLLMChatClient:
     """Create orchestrator chat client for GroupChatBuilder manager."""
-    return LiteLLMChatClient(
+    return create_routed_client(
+        "orchestrator",
+        cache=cache,
+        agent_name="Orchestrator",
+        compactor=compactor,
+        completion_fn=completion_fn,
+    )
+
+
+def create_history_compactor(
+    cache: ResponseCache | None = None,
+    completion_fn: CompletionFn | None = None,
+) -> HistoryCompactor | None:
+    """Create a compactor summarizing old history with the orchestrator model.
+
+    Returns None when compaction is disabled (HISTORY_TOKEN_BUDGET=0).
+    """
+    if config.history_token_budget <= 0:
+        return None
+    summarizer_client = LiteLLMChatClient(
         model="openai/gpt-4o-mini",
         api_key=config.openai_api_key,
+        cache=cache,
+        agent_name="Summarizer",
+        completion_fn=completion_fn,
+    )
+    return HistoryCompactor(
+        max_tokens=config.history_token_budget,
+        summarizer=LLMSummarizer(summarizer_client, get_system_prompt("summarizer")),
     )
 
 
-def create_all_agents() -> list[ChatAgent]:
+def create_all_agents(
+    cache: ResponseCache | None = None,
+    compactor: HistoryCompactor | None = None,
+    completion_fn: CompletionFn | None = None,
+) -> list[ChatAgent]:
     """Create all participant agents."""
     return [
-        create_gpt_agent(),
-        create_claude_agent(),
-        create_gemini_agent(),
-        create_grok_agent(),
+        create_gpt_agent(cache, compactor, completion_fn),
+        create_claude_agent(cache, compactor, completion_fn),
+        create_gemini_agent(cache, compactor, completion_fn),
+        create_grok_agent(cache, compactor, completion_fn),
     ]
@@ -3,6 +3,7 @@
 from typing import Any
 
 from llm_fight_club.agents.base import BaseAgent, Message
+from llm_fight_club.clients.cache import ResponseCache
 from llm_fight_club.config import config
 
 
@@ -15,8 +16,12 @@ class OrchestratorAgent(BaseAgent):
     model = "openai/gpt-4o-mini"
     prompt_name = "orchestrator"
 
-    def __init__(self, api_key: str | None = None):
-        super().__init__(api_key or config.openai_api_key)
+    def __init__(
+        self,
+        api_key: str | None = None,
+        cache: ResponseCache | None = None,
+    ):
+        super().__init__(api_key or config.openai_api_key, cache=cache)
 
     def get_api_key_param(self) -> dict[str, str]:
         """Return OpenAI specific parameters."""
@@ -0,0 +1,97 @@
+"""Process-wide registry of reusable MAF agents and clients."""
+
+from agent_framework import ChatAgent
+
+from llm_fight_club.agents.maf_agents import (
+    create_all_agents,
+    create_history_compactor,
+    create_orchestrator_client,
+)
+from llm_fight_club.clients import HistoryCompactor, LiteLLMChatClient, ResponseCache
+from llm_fight_club.clients.litellm_client import CompletionFn
+from llm_fight_club.prompts import prompt_registry
+
+
+class AgentRegistry:
+    """Builds the participant agents and orchestrator client once and reuses them.
+
+    Agents hold no per-discussion state (the Magentic workflow keeps each
+    participant's history), so the same instances can serve any number of
+    discussions, including concurrent ones. One set is kept per response
+    cache so that cached and uncached runs do not share clients.
+
+    Participants and the orchestrator share one history compactor per
+    cache, so a summary of the debate so far is produced once and reused
+    by every agent.
+
+    Editing a prompt file rebuilds everything on the next lookup, so the
+    new personas apply to the next discussion without a restart.
+    """
+
+    def __init__(self, completion_fn: CompletionFn | None = None) -> None:
+        """Initialize an empty registry.
+
+        Args:
+            completion_fn: Replacement for ``litellm.acompletion`` used by
+                every client the registry builds (e.g. FakeLLM for benchmarks)
+        """
+        self.completion_fn = completion_fn
+        self._agents: dict[ResponseCache | None, list[ChatAgent]] = {}
+        self._orchestrator_clients: dict[ResponseCache | None, LiteLLMChatClient] = {}
+        self._compactors: dict[ResponseCache | None, HistoryCompactor | None] = {}
+        self._prompt_version = prompt_registry.version
+
+    def _check_prompts(self) -> None:
+        version = prompt_registry.version
+        if version != self._prompt_version:
+            self.refresh()
+            self._prompt_version = version
+
+    def _compactor(self, cache: ResponseCache | None) -> HistoryCompactor | None:
+        if cache not in self._compactors:
+            self._compactors[cache] = create_history_compactor(cache, self.completion_fn)
+        return self._compactors[cache]
+
+    def get_agents(self, cache: ResponseCache | None = None) -> list[ChatAgent]:
+        """Return the participant agents, creating them on first use.
+
+        Args:
+            cache: Optional response cache used by the agents' clients
+
+        Returns:
+            Participant agents (GPT, Claude, Gemini, Grok).
+        """
+        self._check_prompts()
+        if cache not in self._agents:
+            self._agents[cache] = create_all_agents(
+                cache, self._compactor(cache), self.completion_fn
+            )
+        return self._agents[cache]
+
+    def get_orchestrator_client(self, cache: ResponseCache | None = None) -> LiteLLMChatClient:
+        """Return the orchestrator client, creating it on first use.
+
+        Args:
+            cache: Optional response cache used by the client
+
+        Returns:
+            Chat client for the Magentic manager.
+        """
+        self._check_prompts()
+        if cache not in self._orchestrator_clients:
+            self._orchestrator_clients[cache] = create_orchestrator_client(
+                cache, self._compactor(cache), self.completion_fn
+            )
+        return self._orchestrator_clients[cache]
+
+    def refresh(self) -> None:
+        """Drop all instances so the next lookup rebuilds them.
+
+        Call this after changing prompts or API keys.
+        """
+        self._agents.clear()
+        self._orchestrator_clients.clear()
+        self._compactors.clear()
+
+
+agent_registry = AgentRegistry()
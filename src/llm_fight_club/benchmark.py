@@ -0,0 +1,131 @@
+"""Offline benchmark of the debate workflow against the fake LLM backend."""
+
+import asyncio
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+
+from llm_fight_club.agents import AgentRegistry
+from llm_fight_club.clients.fake import FakeLLM
+from llm_fight_club.workflows import FightClubGroupChat, SpeakerScheduler
+from llm_fight_club.workflows.speculation import SpeculationStats
+
+
+@dataclass
+class BenchmarkResult:
+    """Measurements for one benchmark run.
+
+    With a zero-latency FakeLLM every second measured is orchestration
+    overhead, so ``ms_per_turn`` is the per-turn cost of the framework.
+    """
+
+    debates: int
+    rounds: int
+    concurrency: int
+    elapsed_seconds: float
+    turns: int
+    llm_calls: int
+    errors: int
+    peak_memory_bytes: int | None = None
+    speculation_hits: int = 0
+    speculation_launched: int = 0
+
+    @property
+    def debates_per_second(self) -> float:
+        return self.debates / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+    @property
+    def ms_per_turn(self) -> float:
+        return self.elapsed_seconds * 1000 / self.turns if self.turns else 0.0
+
+    def to_dict(self) -> dict[str, float | int | None]:
+        """Return all measurements including derived rates."""
+        return {
+            **asdict(self),
+            "debates_per_second": self.debates_per_second,
+            "ms_per_turn": self.ms_per_turn,
+        }
+
+
+async def benchmark_debates(
+    llm: FakeLLM | None = None,
+    debates: int = 10,
+    rounds: int = 4,
+    concurrency: int = 4,
+    stream: bool = True,
+    measure_memory: bool = False,
+    scheduler: SpeakerScheduler | str | None = None,
+    speculate: bool = False,
+) -> BenchmarkResult:
+    """Run full debates against a fake backend and time them.
+
+    Args:
+        llm: Fake provider (defaults to zero latency)
+        debates: Number of debates to run
+        rounds: Maximum rounds per debate
+        concurrency: Debates running at once
+        stream: Consume debates through ``stream`` (token deltas) instead of ``run``
+        measure_memory: Track peak allocations with tracemalloc (slows the run)
+        scheduler: Rule-based speaker scheduler (None = orchestrator LLM)
+        speculate: Start the likely next speaker while the orchestrator decides
+
+    Returns:
+        Timing, turn counts and optionally peak memory.
+    """
+    llm = llm or FakeLLM()
+    registry = AgentRegistry(completion_fn=llm)
+    semaphore = asyncio.Semaphore(concurrency)
+    turns = 0
+    speculation = SpeculationStats()
+
+    async def run_one(index: int) -> None:
+        nonlocal turns
+        async with semaphore:
+            chat = FightClubGroupChat(
+                max_rounds=rounds,
+                registry=registry,
+                scheduler=scheduler,
+                speculate=speculate,
+            )
+            topic = f"benchmark topic {index}"
+            if stream:
+                async for _ in chat.stream(topic):
+                    pass
+            else:
+                await chat.run(topic)
+            turns += len(chat.conversation_history)
+            if chat.speculation_stats is not None:
+                speculation.hits += chat.speculation_stats.hits
+                speculation.launched += chat.speculation_stats.launched
+
+    # Build agents outside the timed region
+    registry.get_agents()
+    registry.get_orchestrator_client()
+    calls_before = llm.calls
+
+    if measure_memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        results = await asyncio.gather(
+            *(run_one(i) for i in range(debates)),
+            return_exceptions=True,
+        )
+        elapsed = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1] if measure_memory else None
+    finally:
+        if measure_memory:
+            tracemalloc.stop()
+
+    return BenchmarkResult(
+        debates=debates,
+        rounds=rounds,
+        concurrency=concurrency,
+        elapsed_seconds=elapsed,
+        turns=turns,
+        llm_calls=llm.calls - calls_before,
+        errors=sum(1 for r in results if isinstance(r, BaseException)),
+        peak_memory_bytes=peak,
+        speculation_hits=speculation.hits,
+        speculation_launched=speculation.launched,
+    )
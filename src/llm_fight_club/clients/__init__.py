@@ -1,5 +1,69 @@
 """LLM Fight Club custom clients."""
 
-from llm_fight_club.clients.litellm_client import LiteLLMChatClient
+from typing import TYPE_CHECKING
 
-__all__ = ["LiteLLMChatClient"]
+from llm_fight_club._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llm_fight_club.clients.cache import (
+        CacheStats,
+        InMemoryResponseCache,
+        ResponseCache,
+        SQLiteResponseCache,
+        make_cache_key,
+    )
+    from llm_fight_club.clients.compaction import HistoryCompactor, LLMSummarizer
+    from llm_fight_club.clients.fake import FakeLLM
+    from llm_fight_club.clients.litellm_client import LiteLLMChatClient, to_litellm_messages
+    from llm_fight_club.clients.rate_limit import (
+        AdaptiveConcurrency,
+        ProviderLimits,
+        ProviderRateLimiter,
+        TokenBucket,
+        default_rate_limiter,
+    )
+    from llm_fight_club.clients.retry import (
+        LatencyTracker,
+        RetryPolicy,
+        call_with_retry,
+        default_retry_policy,
+    )
+    from llm_fight_club.clients.routing import (
+        ModelHealthRegistry,
+        ModelRoute,
+        ModelRouter,
+        model_health,
+        parse_routes,
+    )
+
+# Public name -> submodule; submodules are imported on first use
+_EXPORTS = {
+    "LiteLLMChatClient": "litellm_client",
+    "to_litellm_messages": "litellm_client",
+    "ResponseCache": "cache",
+    "InMemoryResponseCache": "cache",
+    "SQLiteResponseCache": "cache",
+    "CacheStats": "cache",
+    "make_cache_key": "cache",
+    "ProviderRateLimiter": "rate_limit",
+    "ProviderLimits": "rate_limit",
+    "TokenBucket": "rate_limit",
+    "AdaptiveConcurrency": "rate_limit",
+    "default_rate_limiter": "rate_limit",
+    "RetryPolicy": "retry",
+    "LatencyTracker": "retry",
+    "call_with_retry": "retry",
+    "default_retry_policy": "retry",
+    "ModelRoute": "routing",
+    "ModelRouter": "routing",
+    "ModelHealthRegistry": "routing",
+    "model_health": "routing",
+    "parse_routes": "routing",
+    "HistoryCompactor": "compaction",
+    "LLMSummarizer": "compaction",
+    "FakeLLM": "fake",
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -0,0 +1,221 @@
+"""Response caches for LiteLLM completions."""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+# Parameters that do not influence the generated text
+_IGNORED_PARAMS = frozenset({"api_key", "stream"})
+
+
+def make_cache_key(params: dict[str, Any]) -> str:
+    """Build a canonical hash for a set of LiteLLM parameters.
+
+    Args:
+        params: Keyword arguments that would be passed to ``acompletion``
+
+    Returns:
+        Hex digest identifying the request.
+    """
+    relevant = {k: v for k, v in params.items() if k not in _IGNORED_PARAMS}
+    payload = json.dumps(
+        relevant,
+        sort_keys=True,
+        ensure_ascii=False,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class CacheStats:
+    """Hit/miss counters for a response cache."""
+
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class ResponseCache(ABC):
+    """Base class for completion response caches.
+
+    Cached values are plain JSON-serializable dicts.
+    """
+
+    def __init__(self, ttl: float | None = None):
+        """Initialize the cache.
+
+        Args:
+            ttl: Seconds before an entry expires (None = never)
+        """
+        self.ttl = ttl
+        self.stats = CacheStats()
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Look up a cached response and update the counters."""
+        value = self._get(key)
+        if value is None:
+            self.stats.misses += 1
+        else:
+            self.stats.hits += 1
+        return value
+
+    def set(self, key: str, value: dict[str, Any]) -> None:
+        """Store a response."""
+        self._set(key, value)
+
+    def update(
+        self, key: str, fn: Callable[[dict[str, Any] | None], dict[str, Any]]
+    ) -> dict[str, Any]:
+        """Replace an entry with ``fn(current entry or None)``.
+
+        Caches shared between processes make the read and the write one
+        atomic step, so concurrent updates are not lost.
+
+        Returns:
+            The stored value.
+        """
+        value = fn(self._get(key))
+        self._set(key, value)
+        return value
+
+    @abstractmethod
+    def _get(self, key: str) -> dict[str, Any] | None:
+        ...
+
+    @abstractmethod
+    def _set(self, key: str, value: dict[str, Any]) -> None:
+        ...
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove all entries."""
+
+
+class InMemoryResponseCache(ResponseCache):
+    """LRU cache with optional TTL held in process memory."""
+
+    def __init__(self, max_size: int = 1024, ttl: float | None = None):
+        """Initialize the cache.
+
+        Args:
+            max_size: Maximum number of entries kept
+            ttl: Seconds before an entry expires (None = never)
+        """
+        super().__init__(ttl=ttl)
+        self.max_size = max_size
+        self._entries: OrderedDict[str, tuple[float | None, dict[str, Any]]] = OrderedDict()
+
+    def _get(self, key: str) -> dict[str, Any] | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at is not None and time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def _set(self, key: str, value: dict[str, Any]) -> None:
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteResponseCache(ResponseCache):
+    """Persistent cache stored in a SQLite database."""
+
+    def __init__(self, path: str | Path, ttl: float | None = None):
+        """Initialize the cache.
+
+        Args:
+            path: Database file (created if missing)
+            ttl: Seconds before an entry expires (None = never)
+        """
+        super().__init__(ttl=ttl)
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, created_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    def _get(self, key: str) -> dict[str, Any] | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            value, created_at = row
+            if self.ttl is not None and time.time() - created_at >= self.ttl:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._conn.commit()
+                return None
+        return json.loads(value)
+
+    def _set(self, key: str, value: dict[str, Any]) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value, created_at) VALUES (?, ?, ?)",
+                (key, json.dumps(value, ensure_ascii=False), time.time()),
+            )
+            self._conn.commit()
+
+    def update(
+        self, key: str, fn: Callable[[dict[str, Any] | None], dict[str, Any]]
+    ) -> dict[str, Any]:
+        with self._lock:
+            # Take the write lock before reading so other processes wait
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute(
+                    "SELECT value, created_at FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None and self.ttl is not None and time.time() - row[1] >= self.ttl:
+                    row = None
+                value = fn(json.loads(row[0]) if row is not None else None)
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, value, created_at) VALUES (?, ?, ?)",
+                    (key, json.dumps(value, ensure_ascii=False), time.time()),
+                )
+            except BaseException:
+                self._conn.rollback()
+                raise
+            self._conn.commit()
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self._conn.close()
@@ -0,0 +1,211 @@
+"""Conversation history compaction for long debates."""
+
+import asyncio
+import hashlib
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from functools import lru_cache
+from typing import Any
+
+import litellm
+from agent_framework import ChatMessage
+
+from llm_fight_club.clients.rate_limit import estimate_tokens
+
+# (previous summary or None, messages to fold in) -> new summary
+Summarizer = Callable[[str | None, list[dict[str, str]]], Awaitable[str]]
+
+SUMMARY_PREFIX = "これまでの議論の要約:\n"
+
+
+@lru_cache(maxsize=8192)
+def _count(model: str, content: str) -> int:
+    try:
+        return litellm.token_counter(model=model, text=content)
+    except Exception:
+        return estimate_tokens([{"content": content}])
+
+
+def count_message_tokens(model: str, message: dict[str, str]) -> int:
+    """Tokens one chat message takes, including per-message overhead."""
+    return _count(model, message.get("content") or "") + 4
+
+
+def _chain_hashes(messages: list[dict[str, str]]) -> list[str]:
+    """Hash of every prefix: ``hashes[i]`` identifies ``messages[:i + 1]``."""
+    hashes = []
+    digest = b""
+    for msg in messages:
+        h = hashlib.sha256(digest)
+        h.update(f"{msg.get('role')}\0{msg.get('content') or ''}\0".encode())
+        digest = h.digest()
+        hashes.append(digest.hex())
+    return hashes
+
+
+class HistoryCompactor:
+    """Keep prompts under a token budget with a sliding window and rolling summaries.
+
+    Leading system messages and the final message are always kept. When the
+    prompt exceeds the budget, the oldest history is folded into a summary
+    (or just dropped without a summarizer) and only the most recent messages
+    are sent verbatim.
+
+    Summaries are keyed on the content of the summarized prefix, so agents
+    that see the same conversation share them, and each new summary extends
+    the longest one already produced instead of starting over. Cuts are made
+    so that the verbatim window shrinks to ``window_ratio`` of what fits,
+    which lets following turns reuse the same summary until the window
+    fills up again.
+    """
+
+    def __init__(
+        self,
+        max_tokens: int = 6000,
+        summarizer: Summarizer | None = None,
+        summary_tokens: int = 500,
+        window_ratio: float = 0.5,
+        max_summaries: int = 256,
+    ):
+        """Initialize the compactor.
+
+        Args:
+            max_tokens: Token budget for the whole prompt
+            summarizer: Produces rolling summaries (None = sliding window only)
+            summary_tokens: Budget reserved for the summary message
+            window_ratio: Share of the free budget the window is cut back to
+            max_summaries: Number of summaries kept for reuse
+        """
+        self.max_tokens = max_tokens
+        self.summarizer = summarizer
+        self.summary_tokens = summary_tokens if summarizer else 0
+        self.window_ratio = window_ratio
+        self.max_summaries = max_summaries
+        self._summaries: OrderedDict[str, str] = OrderedDict()
+        self._pending: dict[str, asyncio.Future[str]] = {}
+
+    async def compact(
+        self,
+        messages: list[dict[str, str]],
+        model: str,
+    ) -> list[dict[str, str]]:
+        """Return ``messages`` reduced to fit the token budget.
+
+        Args:
+            messages: LiteLLM-format messages, oldest first
+            model: Model used to count tokens
+
+        Returns:
+            The original list if it fits, otherwise a compacted copy.
+        """
+        head_len = 0
+        while head_len < len(messages) - 1 and messages[head_len].get("role") == "system":
+            head_len += 1
+        head, body, tail = messages[:head_len], messages[head_len:-1], messages[-1:]
+        if not body:
+            return messages
+
+        counts = [count_message_tokens(model, m) for m in messages]
+        if sum(counts) <= self.max_tokens:
+            return messages
+
+        body_counts = counts[head_len:-1]
+        available = max(
+            0,
+            self.max_tokens - sum(counts[:head_len]) - counts[-1] - self.summary_tokens,
+        )
+        # suffix[k] = tokens of body[k:]
+        suffix = [0] * (len(body) + 1)
+        for i in range(len(body) - 1, -1, -1):
+            suffix[i] = suffix[i + 1] + body_counts[i]
+
+        cut = self._choose_cut(body, suffix, available)
+        window = body[cut:]
+        if self.summarizer is None or cut == 0:
+            return [*head, *window, *tail]
+
+        try:
+            summary = await self._summary(body, cut)
+        except Exception:
+            # A failed summary should not fail the turn; fall back to the window
+            return [*head, *window, *tail]
+        return [*head, {"role": "system", "content": SUMMARY_PREFIX + summary}, *window, *tail]
+
+    def _choose_cut(self, body: list[dict[str, str]], suffix: list[int], available: int) -> int:
+        """Index of the first body message kept verbatim."""
+        fits = next(k for k in range(len(suffix)) if suffix[k] <= available)
+        if self.summarizer is None:
+            return fits
+
+        hashes = _chain_hashes(body)
+        for k in range(max(fits, 1), len(body) + 1):
+            if hashes[k - 1] in self._summaries:
+                return k
+
+        target = available * self.window_ratio
+        return next(k for k in range(fits, len(suffix)) if suffix[k] <= target)
+
+    async def _summary(self, body: list[dict[str, str]], cut: int) -> str:
+        """Summary of ``body[:cut]``, extending the longest cached prefix."""
+        hashes = _chain_hashes(body[:cut])
+        key = hashes[-1]
+        if key in self._summaries:
+            self._summaries.move_to_end(key)
+            return self._summaries[key]
+        if key in self._pending:
+            return await asyncio.shield(self._pending[key])
+
+        start, previous = 0, None
+        for j in range(cut - 1, 0, -1):
+            if hashes[j - 1] in self._summaries:
+                start, previous = j, self._summaries[hashes[j - 1]]
+                break
+
+        future: asyncio.Future[str] = asyncio.get_running_loop().create_future()
+        self._pending[key] = future
+        try:
+            summary = await self.summarizer(previous, body[start:cut])
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # Mark retrieved when nobody else is waiting
+            raise
+        finally:
+            del self._pending[key]
+
+        future.set_result(summary)
+        self._summaries[key] = summary
+        while len(self._summaries) > self.max_summaries:
+            self._summaries.popitem(last=False)
+        return summary
+
+
+class LLMSummarizer:
+    """Summarizer backed by a chat client (normally the cheap orchestrator model)."""
+
+    def __init__(self, client: Any, instructions: str, max_tokens: int = 500):
+        """Initialize the summarizer.
+
+        Args:
+            client: Chat client with ``get_response`` (e.g. LiteLLMChatClient)
+            instructions: System prompt for the summarizer
+            max_tokens: Maximum length of a summary
+        """
+        self.client = client
+        self.instructions = instructions
+        self.max_tokens = max_tokens
+
+    async def __call__(self, previous: str | None, messages: list[dict[str, str]]) -> str:
+        transcript = "\n\n".join(f"{m['role']}: {m.get('content') or ''}" for m in messages)
+        if previous:
+            prompt = f"## これまでの要約\n{previous}\n\n## 新しい発言\n{transcript}"
+        else:
+            prompt = f"## 発言\n{transcript}"
+
+        response = await self.client.get_response(
+            [
+                ChatMessage(role="system", text=self.instructions),
+                ChatMessage(role="user", text=prompt),
+            ],
+            max_tokens=self.max_tokens,
+        )
+        return response.text
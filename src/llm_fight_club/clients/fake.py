@@ -0,0 +1,163 @@
+"""Offline fake LLM backend for benchmarks and tests.
+
+``FakeLLM`` is a drop-in replacement for ``litellm.acompletion``: pass it as
+``completion_fn`` to LiteLLMChatClient, BaseAgent or AgentRegistry to run
+debates without network access or API keys.
+"""
+
+import asyncio
+import json
+import random
+import re
+from collections.abc import AsyncIterator, Callable
+from itertools import count
+from types import SimpleNamespace
+from typing import Any
+
+from llm_fight_club.clients.rate_limit import estimate_tokens
+
+_NEXT_SPEAKER = re.compile(r"Who should speak next\? \(select from: ([^)]*)\)")
+
+
+class FakeServiceUnavailableError(Exception):
+    """Injected transient failure (retried like a provider 503)."""
+
+    status_code = 503
+
+
+def debate_responder(params: dict[str, Any], completion_tokens: int) -> str:
+    """Produce plausible replies for a Magentic debate.
+
+    Progress ledger prompts get valid ledger JSON that never declares the
+    task satisfied and rotates through the participants, so a debate runs
+    for exactly ``max_rounds`` rounds. Every other prompt gets filler text
+    of about ``completion_tokens`` tokens.
+    """
+    messages = params["messages"]
+    prompt = (messages[-1].get("content") or "") if messages else ""
+
+    match = _NEXT_SPEAKER.search(prompt)
+    if match:
+        names = [name.strip() for name in match.group(1).split(",")]
+        speaker = names[len(messages) % len(names)]
+
+        def item(answer: Any) -> dict[str, Any]:
+            return {"reason": "fake", "answer": answer}
+
+        return json.dumps({
+            "is_request_satisfied": item(False),
+            "is_in_loop": item(False),
+            "is_progress_being_made": item(True),
+            "next_speaker": item(speaker),
+            "instruction_or_question": item(f"{speaker}, share your view."),
+        })
+
+    return " ".join(["lorem"] * completion_tokens)
+
+
+class FakeLLM:
+    """Simulated LLM provider with configurable latency, streaming and errors.
+
+    Latencies are drawn from a log-normal distribution around the configured
+    medians (``latency_sigma=0`` gives fixed latencies), all randomness comes
+    from a seeded generator, and token counts are reported in ``usage``.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        latency_sigma: float = 0.0,
+        first_token_latency: float | None = None,
+        chunk_interval: float = 0.0,
+        tokens_per_chunk: int = 4,
+        completion_tokens: int = 64,
+        error_rate: float = 0.0,
+        seed: int = 0,
+        responder: Callable[[dict[str, Any], int], str] = debate_responder,
+    ):
+        """Initialize the fake provider.
+
+        Args:
+            latency: Median seconds for a non-streaming response
+            latency_sigma: Log-normal sigma applied to every latency
+            first_token_latency: Median seconds before the first streamed
+                chunk (defaults to ``latency``)
+            chunk_interval: Median seconds between streamed chunks
+            tokens_per_chunk: Completion tokens per streamed chunk
+            completion_tokens: Completion tokens per response
+            error_rate: Probability that a call fails with a 503
+            seed: Seed for latencies and injected errors
+            responder: Builds the response text from the request parameters
+        """
+        self.latency = latency
+        self.latency_sigma = latency_sigma
+        self.first_token_latency = latency if first_token_latency is None else first_token_latency
+        self.chunk_interval = chunk_interval
+        self.tokens_per_chunk = tokens_per_chunk
+        self.completion_tokens = completion_tokens
+        self.error_rate = error_rate
+        self.responder = responder
+        self.calls = 0
+        self._random = random.Random(seed)
+        self._ids = count()
+
+    def _sample(self, median: float) -> float:
+        if median <= 0:
+            return 0.0
+        if self.latency_sigma <= 0:
+            return median
+        return self._random.lognormvariate(0.0, self.latency_sigma) * median
+
+    def _usage(self, params: dict[str, Any], text: str) -> SimpleNamespace:
+        prompt_tokens = estimate_tokens(params["messages"])
+        completion_tokens = len(text.split())
+        return SimpleNamespace(
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            total_tokens=prompt_tokens + completion_tokens,
+        )
+
+    async def __call__(self, **params: Any) -> Any:
+        """Answer a request with the same shape ``litellm.acompletion`` returns."""
+        self.calls += 1
+        response_id = f"fake-{next(self._ids)}"
+        text = self.responder(params, self.completion_tokens)
+        fail = self._random.random() < self.error_rate
+
+        if params.get("stream"):
+            await asyncio.sleep(self._sample(self.first_token_latency))
+            if fail:
+                raise FakeServiceUnavailableError("fake provider unavailable")
+            return self._stream(params, response_id, text)
+
+        await asyncio.sleep(self._sample(self.latency))
+        if fail:
+            raise FakeServiceUnavailableError("fake provider unavailable")
+        return SimpleNamespace(
+            id=response_id,
+            model=params["model"],
+            choices=[SimpleNamespace(message=SimpleNamespace(content=text))],
+            usage=self._usage(params, text),
+        )
+
+    async def _stream(
+        self,
+        params: dict[str, Any],
+        response_id: str,
+        text: str,
+    ) -> AsyncIterator[SimpleNamespace]:
+        words = text.split(" ")
+        for i in range(0, len(words), self.tokens_per_chunk):
+            if i:
+                await asyncio.sleep(self._sample(self.chunk_interval))
+            piece = " ".join(words[i:i + self.tokens_per_chunk])
+            yield SimpleNamespace(
+                id=response_id,
+                choices=[SimpleNamespace(delta=SimpleNamespace(content=piece + " "))],
+                usage=None,
+            )
+        yield SimpleNamespace(
+            id=response_id,
+            choices=[SimpleNamespace(delta=SimpleNamespace(content=None))],
+            usage=self._usage(params, text),
+        )
@@ -1,11 +1,160 @@
 """LiteLLM Chat Client for Microsoft Agent Framework."""
 
-from collections.abc import AsyncIterable
+import asyncio
+import sys
+import time
+from collections.abc import AsyncIterable, Awaitable, Callable, Sequence
+from contextlib import AsyncExitStack
+from dataclasses import replace
 from typing import Any
 
-from agent_framework import ChatMessage, ChatResponse, ChatResponseUpdate
+import litellm
+from agent_framework import ChatMessage, ChatResponse, ChatResponseUpdate, UsageDetails
 from litellm import acompletion
 
+from llm_fight_club.clients.cache import ResponseCache, make_cache_key
+from llm_fight_club.clients.compaction import HistoryCompactor
+from llm_fight_club.clients.rate_limit import (
+    ProviderRateLimiter,
+    default_rate_limiter,
+    estimate_tokens,
+)
+from llm_fight_club.clients.retry import (
+    LatencyTracker,
+    RetryPolicy,
+    call_with_retry,
+    default_retry_policy,
+    is_transient_error,
+)
+from llm_fight_club.clients.routing import ModelRoute, ModelRouter
+from llm_fight_club.metrics import CallMetrics, MetricsCollector, current_debate, default_metrics
+from llm_fight_club.tracing import Span, Tracer, default_tracer
+
+# Anything with the signature of litellm.acompletion (e.g. FakeLLM)
+CompletionFn = Callable[..., Awaitable[Any]]
+
+# Providers that cache prompts only up to explicit ``cache_control``
+# breakpoints; OpenAI, xAI and Gemini cache repeated prefixes automatically
+CACHE_CONTROL_PROVIDERS = frozenset({"anthropic"})
+
+# Providers that report usage on a stream only when asked to
+_STREAM_USAGE_PROVIDERS = frozenset({"openai", "xai"})
+
+# What callers may pass as a conversation: Agent Framework messages, LiteLLM
+# dicts, or anything with role/content/name attributes (agents.base.Message)
+Messages = str | ChatMessage | Sequence[Any]
+
+
+def _to_litellm_message(msg: Any) -> dict[str, str]:
+    if isinstance(msg, str):
+        return {"role": "user", "content": msg}
+    if isinstance(msg, dict):
+        return msg
+    if isinstance(msg, ChatMessage):
+        return {"role": msg.role.value, "content": msg.text or ""}
+    content = msg.content
+    name = getattr(msg, "name", None)
+    return {"role": msg.role, "content": f"[{name}]: {content}" if name else content}
+
+
+def to_litellm_messages(messages: Messages) -> list[dict[str, str]]:
+    """Convert a conversation to the message dicts ``acompletion`` expects.
+
+    This is the one conversion used by every call path. Dicts already in
+    LiteLLM form are passed through unchanged, and messages carrying a
+    ``name`` get it as a ``[name]: `` prefix so speakers stay
+    distinguishable in a single-assistant conversation.
+
+    Args:
+        messages: A single message or a sequence of messages
+
+    Returns:
+        LiteLLM messages in the original order.
+    """
+    if isinstance(messages, (str, ChatMessage)):
+        return [_to_litellm_message(messages)]
+    return [_to_litellm_message(msg) for msg in messages]
+
+
+def mark_cache_breakpoints(messages: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Return a copy of ``messages`` with prompt-cache breakpoints.
+
+    Two prefixes repeat from one debate turn to the next: the system prompt
+    and the transcript up to (but excluding) the newest message. The
+    message ending each gets ``cache_control``, so the provider reads both
+    prefixes from its cache instead of processing them again. Prefixes
+    shorter than the provider's minimum are simply not cached.
+    """
+    marked = list(messages)
+    breakpoints = {len(messages) - 2}
+    system = 0
+    while system < len(messages) and messages[system].get("role") == "system":
+        system += 1
+    breakpoints.add(system - 1)
+    for index in breakpoints:
+        if 0 <= index < len(messages) - 1 and isinstance(messages[index].get("content"), str):
+            message = messages[index]
+            marked[index] = {**message, "content": [{
+                "type": "text",
+                "text": message["content"],
+                "cache_control": {"type": "ephemeral"},
+            }]}
+    return marked
+
+
+def _usage_count(obj: Any, name: str) -> int:
+    value = getattr(obj, name, None)
+    return value if isinstance(value, int) else 0
+
+
+def cached_prompt_tokens(usage: Any) -> tuple[int, int]:
+    """Return (read, written) prompt-cache tokens of a provider usage report."""
+    read = _usage_count(getattr(usage, "prompt_tokens_details", None), "cached_tokens")
+    read = read or _usage_count(usage, "cache_read_input_tokens")
+    return read, _usage_count(usage, "cache_creation_input_tokens")
+
+
+def usage_and_cost(
+    model: str,
+    messages: list[dict[str, str]],
+    usage: Any = None,
+    completion: str = "",
+) -> tuple[int, int, int, float]:
+    """Return (prompt_tokens, completion_tokens, cached_prompt_tokens, cost) of a call.
+
+    Uses the provider-reported usage when present and otherwise counts
+    tokens locally (streamed responses often carry no usage). Prompt
+    tokens read from or written to the provider's prompt cache are priced
+    at their own rates. Cost is 0.0 for models missing from LiteLLM's
+    price map.
+    """
+    cache_read, cache_written = cached_prompt_tokens(usage)
+    prompt_tokens = getattr(usage, "prompt_tokens", None)
+    completion_tokens = getattr(usage, "completion_tokens", None)
+    if not isinstance(prompt_tokens, int) or not isinstance(completion_tokens, int):
+        prompt_tokens = completion_tokens = None
+    try:
+        if prompt_tokens is None:
+            prompt_tokens = litellm.token_counter(model=model, messages=messages)
+        if completion_tokens is None:
+            completion_tokens = litellm.token_counter(model=model, text=completion) if completion else 0
+    except Exception:
+        prompt_tokens = prompt_tokens or 0
+        completion_tokens = completion_tokens or 0
+
+    try:
+        prompt_cost, completion_cost = litellm.cost_per_token(
+            model=model,
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            cache_read_input_tokens=cache_read,
+            cache_creation_input_tokens=cache_written,
+        )
+        cost = prompt_cost + completion_cost
+    except Exception:
+        cost = 0.0
+    return prompt_tokens, completion_tokens, cache_read, cost
+
 
 class LiteLLMChatClient:
     """Custom chat client that uses LiteLLM to support multiple LLM providers."""
@@ -14,6 +163,16 @@ class LiteLLMChatClient:
         self,
         model: str,
         api_key: str | None = None,
+        cache: ResponseCache | None = None,
+        rate_limiter: ProviderRateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        agent_name: str | None = None,
+        metrics: MetricsCollector | None = None,
+        compactor: HistoryCompactor | None = None,
+        completion_fn: CompletionFn | None = None,
+        router: ModelRouter | None = None,
+        prompt_caching: bool = True,
+        tracer: Tracer | None = None,
         **kwargs: Any,
     ):
         """Initialize LiteLLM chat client.
@@ -21,113 +180,406 @@ class LiteLLMChatClient:
         Args:
             model: Model identifier (e.g., "openai/gpt-4o", "anthropic/claude-3-5-haiku")
             api_key: API key for the provider
+            cache: Optional cache for identical requests
+            rate_limiter: Per-provider limiter (defaults to the process-wide one)
+            retry_policy: Timeouts, retries and hedging for each call
+            agent_name: Name calls are attributed to in metrics (set by
+                ChatAgent when the client is attached to an agent)
+            metrics: Collector for per-call metrics (defaults to the process-wide one)
+            compactor: Keeps long conversations under a token budget
+            completion_fn: Replacement for ``litellm.acompletion`` (e.g. FakeLLM)
+            router: Chooses among several models by health and falls back
+                to the next one when a call fails (``model`` and ``api_key``
+                then only apply to calls that name a model explicitly)
+            prompt_caching: Mark the stable prefix of each request for
+                providers that cache prompts only when asked to
+            tracer: Records a span per call (defaults to the process-wide one)
             **kwargs: Additional LiteLLM parameters
         """
         self.model = model
         self.api_key = api_key
+        self.cache = cache
+        self.rate_limiter = rate_limiter or default_rate_limiter
+        self.retry_policy = retry_policy or default_retry_policy
+        self.agent_name = agent_name
+        self.metrics = metrics or default_metrics
+        self.compactor = compactor
+        self.completion_fn = completion_fn
+        self.router = router
+        self.prompt_caching = prompt_caching
+        self.tracer = tracer or default_tracer
         self.default_kwargs = kwargs
+        self._latency = LatencyTracker()
 
     @property
     def additional_properties(self) -> dict[str, Any]:
         """Return additional properties for the client."""
         return {
             "model": self.model,
-            "provider": self.model.split("/")[0] if "/" in self.model else "openai",
+            "provider": self._provider(self.model),
         }
 
+    @staticmethod
+    def _provider(model: str) -> str:
+        """Return the provider prefix of a LiteLLM model identifier."""
+        return model.split("/")[0] if "/" in model else "openai"
+
+    def _update_agent_name(self, agent_name: str | None) -> None:
+        """Adopt the name of the agent this client is attached to."""
+        if agent_name and not self.agent_name:
+            self.agent_name = agent_name
+
+    def _record_metrics(
+        self,
+        params: dict[str, Any],
+        start: float,
+        *,
+        usage: Any = None,
+        completion: str = "",
+        time_to_first_token: float | None = None,
+        cached: bool = False,
+        error: BaseException | None = None,
+        span: Span | None = None,
+    ) -> None:
+        """Record one finished call with the metrics collector (and its span)."""
+        call = CallMetrics(
+            model=params["model"],
+            provider=self._provider(params["model"]),
+            agent=self.agent_name,
+            latency=time.perf_counter() - start,
+            time_to_first_token=time_to_first_token,
+            cached=cached,
+            error=type(error).__name__ if error is not None else None,
+        )
+        debate = current_debate()
+        if debate is not None:
+            call.debate_id = debate.debate_id
+            call.round = debate.round
+        if error is None and not cached:
+            (
+                call.prompt_tokens,
+                call.completion_tokens,
+                call.cached_prompt_tokens,
+                call.cost,
+            ) = usage_and_cost(params["model"], params["messages"], usage, completion)
+        if self.router is not None and not cached:
+            self.router.record(call)
+        self.metrics.record(call)
+        if span is not None:
+            self.tracer.finish(
+                span,
+                model=call.model,
+                cached=cached,
+                error=call.error,
+                prompt_tokens=call.prompt_tokens,
+                completion_tokens=call.completion_tokens,
+                time_to_first_token=time_to_first_token,
+            )
+
+    def _request(self, params: dict[str, Any]) -> dict[str, Any]:
+        """Return the arguments actually sent to the provider for ``params``.
+
+        Adds prompt-cache breakpoints and, for streams, asks for usage so
+        cached-token counts are reported. Kept out of ``params`` so cache
+        keys, rate-limit estimates and metrics see plain messages.
+        """
+        provider = self._provider(params["model"])
+        request = params
+        if self.prompt_caching and provider in CACHE_CONTROL_PROVIDERS:
+            request = {**params, "messages": mark_cache_breakpoints(params["messages"])}
+        if params.get("stream") and provider in _STREAM_USAGE_PROVIDERS:
+            request = {**request, "stream_options": {"include_usage": True}}
+        return request
+
+    def _routes(self, model: str | None) -> list[ModelRoute]:
+        """Models to try for one call, in order."""
+        if model is not None or self.router is None:
+            return [ModelRoute(model or self.model, self.api_key)]
+        return self.router.candidates()
+
+    def _route_policy(self, last: bool) -> RetryPolicy:
+        """Retry policy for one route; routes with a fallback get the router's shorter deadline."""
+        if last or self.router is None or self.router.fallback_timeout is None:
+            return self.retry_policy
+        timeout = self.router.fallback_timeout
+        if self.retry_policy.timeout is not None:
+            timeout = min(timeout, self.retry_policy.timeout)
+        return replace(self.retry_policy, timeout=timeout)
+
+    def _falls_back(self, route: ModelRoute, error: Exception) -> bool:
+        """Whether a failed route should give way to the next one.
+
+        Only errors another provider may not hit (timeouts, rate limits,
+        outages) or a model the router has ejected move the call on; other
+        errors are the caller's to see.
+        """
+        return is_transient_error(error) or not self.router.health.available(route.model)
+
     async def get_response(
         self,
-        messages: str | ChatMessage | list[str] | list[ChatMessage],
+        messages: Messages,
         *,
         model: str | None = None,
         temperature: float | None = None,
         max_tokens: int | None = None,
         **kwargs: Any,
     ) -> ChatResponse:
-        """Get a non-streaming response from LiteLLM."""
-        litellm_messages = self._convert_messages(messages)
+        """Get a non-streaming response from LiteLLM.
 
-        params: dict[str, Any] = {
-            "model": model or self.model,
-            "messages": litellm_messages,
-            **self.default_kwargs,
-        }
+        With a router and no explicit ``model``, each routed model is
+        retried under the retry policy and, if it still fails with a
+        transient error or has been ejected, the next one is tried.
+        """
+        *fallbacks, last = self._routes(model)
+        for route in fallbacks:
+            try:
+                return await self._get_response(
+                    messages, route, self._route_policy(False), temperature, max_tokens
+                )
+            except Exception as e:
+                if not self._falls_back(route, e):
+                    raise
+        return await self._get_response(messages, last, self._route_policy(True), temperature, max_tokens)
 
-        if self.api_key:
-            params["api_key"] = self.api_key
-        if temperature is not None:
-            params["temperature"] = temperature
-        if max_tokens is not None:
-            params["max_tokens"] = max_tokens
+    async def _get_response(
+        self,
+        messages: Messages,
+        route: ModelRoute,
+        policy: RetryPolicy,
+        temperature: float | None,
+        max_tokens: int | None,
+    ) -> ChatResponse:
+        """Call one model without fallback."""
+        params = self._build_params(messages, route.model, temperature, max_tokens, route.api_key)
+        if self.compactor is not None:
+            params["messages"] = await self.compactor.compact(params["messages"], params["model"])
+        start = time.perf_counter()
+        span = self.tracer.start("llm_call", "llm", track=self.agent_name or "llm")
 
-        response = await acompletion(**params)
+        cache_key = make_cache_key(params) if self.cache is not None else None
+        if cache_key:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                self._record_metrics(params, start, cached=True, span=span)
+                return self._response_from_cache(cached)
 
-        return self._convert_response(response)
+        provider = self._provider(params["model"])
+        estimated = estimate_tokens(params["messages"], max_tokens)
+
+        request = self._request(params)
+
+        async def complete() -> Any:
+            async with self.rate_limiter.throttle(provider, estimated):
+                return await (self.completion_fn or acompletion)(**request)
+
+        try:
+            response = await call_with_retry(complete, policy, self._latency)
+        except Exception as e:
+            self._record_metrics(params, start, error=e, span=span)
+            raise
+
+        usage = getattr(response, "usage", None)
+        if usage is not None and getattr(usage, "total_tokens", None):
+            self.rate_limiter.record_usage(provider, usage.total_tokens, estimated)
+
+        chat_response = self._convert_response(response)
+        self._record_metrics(params, start, usage=usage, completion=chat_response.text, span=span)
+
+        if cache_key:
+            self.cache.set(cache_key, {
+                "content": chat_response.text,
+                "response_id": chat_response.response_id,
+                "model_id": chat_response.model_id,
+            })
+
+        return chat_response
 
     async def get_streaming_response(
         self,
-        messages: str | ChatMessage | list[str] | list[ChatMessage],
+        messages: Messages,
         *,
         model: str | None = None,
         temperature: float | None = None,
         max_tokens: int | None = None,
         **kwargs: Any,
     ) -> AsyncIterable[ChatResponseUpdate]:
-        """Get a streaming response from LiteLLM."""
-        litellm_messages = self._convert_messages(messages)
+        """Get a streaming response from LiteLLM.
+
+        Opening the stream is retried under the retry policy (without
+        hedging); once text has been yielded, the policy's timeout applies
+        to the gap between chunks and errors are no longer retried. With a
+        router and no explicit ``model``, a transient failure (or an
+        ejected model) before the first chunk moves on to the next routed
+        model.
+        """
+        routes = self._routes(model)
+        for index, route in enumerate(routes):
+            last = index == len(routes) - 1
+            started = False
+            try:
+                async for update in self._get_streaming_response(
+                    messages, route, self._route_policy(last), temperature, max_tokens
+                ):
+                    started = True
+                    yield update
+                return
+            except Exception as e:
+                if started or last or not self._falls_back(route, e):
+                    raise
+
+    async def _get_streaming_response(
+        self,
+        messages: Messages,
+        route: ModelRoute,
+        policy: RetryPolicy,
+        temperature: float | None,
+        max_tokens: int | None,
+    ) -> AsyncIterable[ChatResponseUpdate]:
+        """Stream from one model without fallback."""
+        params = self._build_params(messages, route.model, temperature, max_tokens, route.api_key)
+        if self.compactor is not None:
+            params["messages"] = await self.compactor.compact(params["messages"], params["model"])
+        start = time.perf_counter()
+        span = self.tracer.start("llm_call", "llm", track=self.agent_name or "llm", stream=True)
+
+        cache_key = make_cache_key(params) if self.cache is not None else None
+        if cache_key:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                self._record_metrics(params, start, cached=True, span=span)
+                yield ChatResponseUpdate(
+                    text=cached["content"],
+                    response_id=cached.get("response_id"),
+                )
+                return
+
+        params["stream"] = True
+        provider = self._provider(params["model"])
+        estimated = estimate_tokens(params["messages"], max_tokens)
+
+        request = self._request(params)
+
+        async def open_stream() -> tuple[AsyncExitStack, Any]:
+            # Each attempt takes its own slot, so none is held through
+            # backoff; a successful one keeps it until the stream ends
+            slot = AsyncExitStack()
+            await slot.enter_async_context(self.rate_limiter.throttle(provider, estimated))
+            try:
+                return slot, await (self.completion_fn or acompletion)(**request)
+            except BaseException:
+                await slot.__aexit__(*sys.exc_info())
+                raise
+
+        chunks: list[str] = []
+        response_id = None
+        usage = None
+        first_token: float | None = None
+        convert_seconds = 0.0  # Spent in _convert_streaming_chunk
+        try:
+            # Never hedged: the losing stream would be left open and billed
+            slot, response = await call_with_retry(open_stream, replace(policy, hedge=False))
+            async with slot:
+                iterator = response.__aiter__()
+                while True:
+                    try:
+                        chunk = await asyncio.wait_for(iterator.__anext__(), policy.timeout)
+                    except StopAsyncIteration:
+                        break
+                    converting = time.perf_counter()
+                    update = self._convert_streaming_chunk(chunk)
+                    convert_seconds += time.perf_counter() - converting
+                    if update.text and first_token is None:
+                        first_token = time.perf_counter() - start
+                    chunks.append(update.text)
+                    response_id = response_id or update.response_id
+                    usage = getattr(chunk, "usage", None) or usage
+                    yield update
+        except Exception as e:
+            self._record_metrics(params, start, time_to_first_token=first_token, error=e, span=span)
+            raise
+
+        if usage is not None and getattr(usage, "total_tokens", None):
+            self.rate_limiter.record_usage(provider, usage.total_tokens, estimated)
+        if span is not None:
+            span.attributes.update(chunks=len(chunks), convert_seconds=convert_seconds)
+        self._record_metrics(
+            params,
+            start,
+            usage=usage,
+            completion="".join(chunks),
+            time_to_first_token=first_token,
+            span=span,
+        )
 
+        if cache_key:
+            self.cache.set(cache_key, {
+                "content": "".join(chunks),
+                "response_id": response_id,
+                "model_id": params["model"],
+            })
+
+    def _build_params(
+        self,
+        messages: Messages,
+        model: str | None,
+        temperature: float | None,
+        max_tokens: int | None,
+        api_key: str | None = None,
+    ) -> dict[str, Any]:
+        """Build the keyword arguments for ``acompletion``."""
+        model = model or self.model
+        debate = current_debate()
+        if debate is not None:
+            model = debate.models.get(model, model)
         params: dict[str, Any] = {
-            "model": model or self.model,
-            "messages": litellm_messages,
-            "stream": True,
+            "model": model,
+            "messages": self._convert_messages(messages),
             **self.default_kwargs,
         }
 
-        if self.api_key:
-            params["api_key"] = self.api_key
+        api_key = api_key or self.api_key
+        if api_key:
+            params["api_key"] = api_key
         if temperature is not None:
             params["temperature"] = temperature
         if max_tokens is not None:
             params["max_tokens"] = max_tokens
 
-        response = await acompletion(**params)
+        return params
 
-        async for chunk in response:
-            yield self._convert_streaming_chunk(chunk)
-
-    def _convert_messages(
-        self,
-        messages: str | ChatMessage | list[str] | list[ChatMessage],
-    ) -> list[dict[str, str]]:
+    def _convert_messages(self, messages: Messages) -> list[dict[str, str]]:
         """Convert Agent Framework messages to LiteLLM format."""
-        if isinstance(messages, str):
-            return [{"role": "user", "content": messages}]
-
-        if isinstance(messages, ChatMessage):
-            return [{"role": str(messages.role), "content": messages.text or ""}]
-
-        if isinstance(messages, list):
-            litellm_messages = []
-            for msg in messages:
-                if isinstance(msg, str):
-                    litellm_messages.append({"role": "user", "content": msg})
-                elif isinstance(msg, ChatMessage):
-                    litellm_messages.append({
-                        "role": str(msg.role),
-                        "content": msg.text or "",
-                    })
-            return litellm_messages
-
-        return []
+        return to_litellm_messages(messages)
 
     def _convert_response(self, litellm_response: Any) -> ChatResponse:
         """Convert LiteLLM response to Agent Framework ChatResponse."""
         content = litellm_response.choices[0].message.content or ""
 
+        usage_details = None
+        usage = getattr(litellm_response, "usage", None)
+        if usage is not None:
+            cache_read, _ = cached_prompt_tokens(usage)
+            usage_details = UsageDetails(
+                input_token_count=getattr(usage, "prompt_tokens", None),
+                output_token_count=getattr(usage, "completion_tokens", None),
+                total_token_count=getattr(usage, "total_tokens", None),
+                **({"cached_input_token_count": cache_read} if cache_read else {}),
+            )
+
         return ChatResponse(
             messages=[ChatMessage(role="assistant", text=content)],
             response_id=getattr(litellm_response, "id", None),
             model_id=getattr(litellm_response, "model", self.model),
+            usage_details=usage_details,
+            raw_representation=litellm_response,
+        )
+
+    def _response_from_cache(self, cached: dict[str, Any]) -> ChatResponse:
+        """Rebuild a ChatResponse from a cached entry."""
+        return ChatResponse(
+            messages=[ChatMessage(role="assistant", text=cached["content"])],
+            response_id=cached.get("response_id"),
+            model_id=cached.get("model_id", self.model),
         )
 
     def _convert_streaming_chunk(self, chunk: Any) -> ChatResponseUpdate:
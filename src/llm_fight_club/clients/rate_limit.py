@@ -0,0 +1,269 @@
+"""Per-provider rate limiting and adaptive concurrency for LLM calls."""
+
+import asyncio
+import time
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any
+
+from llm_fight_club.config import Config, config
+
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    """Return True if the error is a provider 429 / rate limit response."""
+    if getattr(error, "status_code", None) == 429:
+        return True
+    return type(error).__name__ == "RateLimitError"
+
+
+def estimate_tokens(messages: list[dict[str, Any]], max_tokens: int | None = None) -> int:
+    """Roughly estimate the tokens a request will consume.
+
+    Uses ~4 characters per token for the prompt plus the completion budget,
+    which is what providers reserve against tokens-per-minute limits.
+    """
+    chars = 0
+    for message in messages:
+        content = message.get("content") or ""
+        if isinstance(content, str):
+            chars += len(content)
+        else:  # Content blocks, e.g. with prompt-cache breakpoints
+            chars += sum(len(block.get("text") or "") for block in content)
+    return chars // 4 + 1 + (max_tokens or 0)
+
+
+@dataclass
+class ProviderLimits:
+    """Rate limits for one provider."""
+
+    requests_per_minute: float | None = None
+    tokens_per_minute: float | None = None
+    initial_concurrency: int = 16
+    max_concurrency: int = 64
+    min_concurrency: int = 1
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at a per-minute rate."""
+
+    def __init__(self, rate_per_minute: float, capacity: float | None = None):
+        """Initialize the bucket full.
+
+        Args:
+            rate_per_minute: Refill rate
+            capacity: Burst size (defaults to one minute's worth)
+        """
+        self.rate = rate_per_minute / 60.0
+        self.capacity = capacity if capacity is not None else rate_per_minute
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    @property
+    def available(self) -> float:
+        """Tokens currently available (may be negative after overdraft)."""
+        self._refill()
+        return self._tokens
+
+    async def acquire(self, amount: float = 1.0) -> None:
+        """Wait until ``amount`` tokens are available and take them."""
+        amount = min(amount, self.capacity)
+        while True:
+            self._refill()
+            if self._tokens >= amount:
+                self._tokens -= amount
+                return
+            await asyncio.sleep((amount - self._tokens) / self.rate)
+
+    def consume(self, amount: float) -> None:
+        """Take (or with a negative amount, return) tokens without waiting."""
+        self._refill()
+        self._tokens = min(self.capacity, self._tokens - amount)
+
+
+class AdaptiveConcurrency:
+    """Concurrency limit adjusted with AIMD.
+
+    The limit grows by roughly one slot per window of successful calls and
+    is multiplied by ``decrease_factor`` whenever the provider throttles.
+    """
+
+    def __init__(
+        self,
+        initial: int = 16,
+        minimum: int = 1,
+        maximum: int = 64,
+        decrease_factor: float = 0.5,
+    ):
+        """Initialize the limiter.
+
+        Args:
+            initial: Starting number of concurrent calls
+            minimum: Lower bound for the limit
+            maximum: Upper bound for the limit
+            decrease_factor: Multiplier applied on throttling
+        """
+        self.minimum = minimum
+        self.maximum = maximum
+        self.decrease_factor = decrease_factor
+        self.limit = float(max(minimum, min(initial, maximum)))
+        self.in_flight = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+
+    @property
+    def slots(self) -> int:
+        """Current whole number of concurrent calls allowed."""
+        return max(self.minimum, int(self.limit))
+
+    async def acquire(self) -> None:
+        """Wait for a free slot."""
+        while self.in_flight >= self.slots:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            finally:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+        self.in_flight += 1
+
+    def release(self) -> None:
+        """Free a slot and wake waiters that now fit."""
+        self.in_flight -= 1
+        self._wake()
+
+    def on_success(self) -> None:
+        """Additive increase."""
+        self.limit = min(self.maximum, self.limit + 1.0 / self.limit)
+        self._wake()
+
+    def on_throttle(self) -> None:
+        """Multiplicative decrease."""
+        self.limit = max(self.minimum, self.limit * self.decrease_factor)
+
+    def _wake(self) -> None:
+        free = self.slots - self.in_flight
+        while free > 0 and self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                free -= 1
+
+
+class _ProviderState:
+    """Buckets and concurrency limiter for one provider."""
+
+    def __init__(self, limits: ProviderLimits):
+        self.requests = (
+            TokenBucket(limits.requests_per_minute) if limits.requests_per_minute else None
+        )
+        self.tokens = TokenBucket(limits.tokens_per_minute) if limits.tokens_per_minute else None
+        self.concurrency = AdaptiveConcurrency(
+            initial=limits.initial_concurrency,
+            minimum=limits.min_concurrency,
+            maximum=limits.max_concurrency,
+        )
+        self.throttled = 0
+
+
+class ProviderRateLimiter:
+    """Shared limiter keyed on the provider prefix of the model name."""
+
+    def __init__(
+        self,
+        limits: dict[str, ProviderLimits] | None = None,
+        default: ProviderLimits | None = None,
+    ):
+        """Initialize the limiter.
+
+        Args:
+            limits: Limits per provider (e.g. {"openai": ProviderLimits(...)})
+            default: Limits for providers not listed
+        """
+        self.limits = limits or {}
+        self.default = default or ProviderLimits()
+        self._states: dict[str, _ProviderState] = {}
+
+    @classmethod
+    def from_config(cls, cfg: Config = config) -> "ProviderRateLimiter":
+        """Build a limiter from the rate limits in the configuration."""
+        limits: dict[str, ProviderLimits] = {}
+        for provider, settings in cfg.rate_limits.items():
+            provider_limits = ProviderLimits(
+                requests_per_minute=settings.get("requests_per_minute"),
+                tokens_per_minute=settings.get("tokens_per_minute"),
+            )
+            if "max_concurrency" in settings:
+                max_concurrency = int(settings["max_concurrency"])
+                provider_limits.max_concurrency = max_concurrency
+                provider_limits.initial_concurrency = min(
+                    provider_limits.initial_concurrency, max_concurrency
+                )
+            limits[provider] = provider_limits
+        return cls(limits)
+
+    def _state(self, provider: str) -> _ProviderState:
+        if provider not in self._states:
+            self._states[provider] = _ProviderState(self.limits.get(provider, self.default))
+        return self._states[provider]
+
+    @asynccontextmanager
+    async def throttle(self, provider: str, estimated_tokens: int = 0) -> AsyncIterator[None]:
+        """Hold a rate-limited slot for one call to ``provider``.
+
+        Waits for request and token budget, then for a concurrency slot.
+        A 429 raised inside the block halves the provider's concurrency.
+
+        Args:
+            provider: Provider prefix (e.g. "openai")
+            estimated_tokens: Tokens to reserve against the TPM budget
+        """
+        state = self._state(provider)
+        if state.requests:
+            await state.requests.acquire()
+        if state.tokens and estimated_tokens:
+            await state.tokens.acquire(estimated_tokens)
+
+        await state.concurrency.acquire()
+        try:
+            yield
+        except Exception as e:
+            if is_rate_limit_error(e):
+                self.report_throttle(provider)
+            raise
+        else:
+            state.concurrency.on_success()
+        finally:
+            state.concurrency.release()
+
+    def report_throttle(self, provider: str) -> None:
+        """Shrink the provider's concurrency after a 429."""
+        state = self._state(provider)
+        state.throttled += 1
+        state.concurrency.on_throttle()
+
+    def record_usage(self, provider: str, actual_tokens: int, estimated_tokens: int) -> None:
+        """Correct the token budget once the real usage is known."""
+        state = self._state(provider)
+        if state.tokens:
+            state.tokens.consume(actual_tokens - estimated_tokens)
+
+    def stats(self) -> dict[str, dict[str, float]]:
+        """Return current limiter state per provider."""
+        return {
+            provider: {
+                "concurrency_limit": state.concurrency.limit,
+                "in_flight": state.concurrency.in_flight,
+                "throttled": state.throttled,
+            }
+            for provider, state in self._states.items()
+        }
+
+
+default_rate_limiter = ProviderRateLimiter.from_config()
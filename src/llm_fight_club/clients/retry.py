@@ -0,0 +1,163 @@
+"""Timeouts, retries and hedged requests for LLM calls."""
+
+import asyncio
+import random
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import TypeVar
+
+from llm_fight_club.clients.rate_limit import is_rate_limit_error
+
+T = TypeVar("T")
+
+_TRANSIENT_STATUS_CODES = frozenset({408, 409, 429, 500, 502, 503, 504, 529})
+_TRANSIENT_ERROR_NAMES = frozenset({
+    "APIConnectionError",
+    "InternalServerError",
+    "ServiceUnavailableError",
+    "Timeout",
+})
+
+
+def is_transient_error(error: BaseException) -> bool:
+    """Return True if the call may succeed when repeated."""
+    if isinstance(error, (TimeoutError, ConnectionError)):
+        return True
+    if is_rate_limit_error(error):
+        return True
+    if getattr(error, "status_code", None) in _TRANSIENT_STATUS_CODES:
+        return True
+    return type(error).__name__ in _TRANSIENT_ERROR_NAMES
+
+
+class LatencyTracker:
+    """Sliding window of recent call latencies."""
+
+    def __init__(self, window: int = 100):
+        self._samples: deque[float] = deque(maxlen=window)
+
+    def record(self, seconds: float) -> None:
+        """Add a latency sample."""
+        self._samples.append(seconds)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def percentile(self, q: float) -> float | None:
+        """Return the q-th quantile (0-1) of the window, or None if empty."""
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, int(q * len(ordered)))
+        return ordered[index]
+
+
+@dataclass
+class RetryPolicy:
+    """How a single LLM call is bounded and repeated.
+
+    Attributes:
+        max_attempts: Total attempts including the first one
+        timeout: Deadline per attempt in seconds (None = no deadline)
+        base_delay: Backoff base in seconds
+        max_delay: Backoff ceiling in seconds
+        hedge: Fire a duplicate request when the first one is slow
+        hedge_delay: Fixed hedge threshold; when None the tracked
+            ``hedge_percentile`` latency is used once enough samples exist
+        hedge_percentile: Latency quantile used as the hedge threshold
+        hedge_min_samples: Samples required before percentile hedging starts
+    """
+
+    max_attempts: int = 3
+    timeout: float | None = 120.0
+    base_delay: float = 0.5
+    max_delay: float = 8.0
+    hedge: bool = False
+    hedge_delay: float | None = None
+    hedge_percentile: float = 0.95
+    hedge_min_samples: int = 10
+
+    def backoff(self, attempt: int) -> float:
+        """Full-jitter exponential backoff before retry number ``attempt``."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2**attempt))
+
+    def hedge_after(self, tracker: LatencyTracker | None) -> float | None:
+        """Seconds to wait before hedging, or None to not hedge."""
+        if not self.hedge:
+            return None
+        if self.hedge_delay is not None:
+            return self.hedge_delay
+        if tracker is None or len(tracker) < self.hedge_min_samples:
+            return None
+        return tracker.percentile(self.hedge_percentile)
+
+
+async def _race(
+    call: Callable[[], Awaitable[T]],
+    hedge_after: float,
+) -> T:
+    """Run ``call``; if it has not finished after ``hedge_after`` seconds,
+    start a duplicate and return whichever succeeds first."""
+    primary = asyncio.ensure_future(call())
+    pending = {primary}
+    try:
+        done, pending = await asyncio.wait(pending, timeout=hedge_after)
+        if done:
+            return primary.result()
+
+        pending.add(asyncio.ensure_future(call()))
+        error: BaseException | None = None
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    return task.result()
+                error = task.exception()
+        raise error
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def call_with_retry(
+    call: Callable[[], Awaitable[T]],
+    policy: RetryPolicy,
+    tracker: LatencyTracker | None = None,
+    on_retry: Callable[[BaseException], None] | None = None,
+) -> T:
+    """Call ``call`` under the policy's deadline, hedging and retry rules.
+
+    Args:
+        call: Zero-argument coroutine factory performing one request
+        policy: Retry policy to apply
+        tracker: Latency samples used for percentile hedging (updated on success)
+        on_retry: Callback for each error that is about to be retried
+
+    Returns:
+        The first successful result.
+
+    Raises:
+        The last error once attempts are exhausted or a non-transient error occurs.
+    """
+    loop = asyncio.get_running_loop()
+    for attempt in range(policy.max_attempts):
+        hedge_after = policy.hedge_after(tracker)
+        attempt_call = call if hedge_after is None else (lambda: _race(call, hedge_after))
+        start = loop.time()
+        try:
+            result = await asyncio.wait_for(attempt_call(), policy.timeout)
+        except Exception as e:
+            if attempt + 1 >= policy.max_attempts or not is_transient_error(e):
+                raise
+            if on_retry:
+                on_retry(e)
+            await asyncio.sleep(policy.backoff(attempt))
+            continue
+        if tracker is not None:
+            tracker.record(loop.time() - start)
+        return result
+    raise RuntimeError("RetryPolicy.max_attempts must be at least 1")
+
+
+default_retry_policy = RetryPolicy()
@@ -0,0 +1,218 @@
+"""Per-agent model routing with health-based fallback.
+
+Every agent has an ordered list of model tiers. A ``ModelRouter`` offers the
+routes of the best tier that is healthy, fastest first, followed by the
+remaining routes as fallbacks. Health is tracked per model and shared by
+every router in the process (``model_health``), so a provider that starts
+failing or answering slowly is avoided by all agents at once, then probed
+again after a cooldown.
+"""
+
+import time
+from collections import deque
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+
+from llm_fight_club.clients.retry import LatencyTracker
+from llm_fight_club.metrics import CallMetrics
+
+
+@dataclass
+class ModelRoute:
+    """A model an agent may use and the service level it has to meet."""
+
+    model: str
+    api_key: str | None = None
+    tier: int = 0  # Lower tiers are preferred; routes of one tier compete on latency
+    max_latency: float | None = None  # p95 seconds (time to first token when streaming)
+    max_cost: float | None = None  # Mean USD per call
+
+
+class ModelHealth:
+    """Recent latency, cost and errors of one model."""
+
+    def __init__(self, window: int = 50):
+        self.latency = LatencyTracker(window)
+        self.costs: deque[float] = deque(maxlen=window)
+        self.failures = 0  # Consecutive errors
+        self.unavailable_until = 0.0
+
+    @property
+    def mean_cost(self) -> float | None:
+        return sum(self.costs) / len(self.costs) if self.costs else None
+
+
+class ModelHealthRegistry:
+    """Live health of every model, fed by the clients' call metrics."""
+
+    def __init__(
+        self,
+        failure_threshold: int = 3,
+        cooldown: float = 30.0,
+        min_samples: int = 5,
+        window: int = 50,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the registry.
+
+        Args:
+            failure_threshold: Consecutive errors after which a model is avoided
+            cooldown: Seconds an avoided model is skipped before being tried again
+            min_samples: Calls needed before latency and cost are judged
+            window: Calls kept per model for the statistics
+            clock: Time source (monotonic seconds)
+        """
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.min_samples = min_samples
+        self.window = window
+        self.clock = clock
+        self._models: dict[str, ModelHealth] = {}
+
+    def get(self, model: str) -> ModelHealth:
+        """Return the health record of a model, creating it on first use."""
+        if model not in self._models:
+            self._models[model] = ModelHealth(self.window)
+        return self._models[model]
+
+    def record(self, call: CallMetrics) -> None:
+        """Update the model's health with a finished (uncached) call."""
+        health = self.get(call.model)
+        if call.error is not None:
+            health.failures += 1
+            if health.failures >= self.failure_threshold:
+                self.eject(call.model)
+            return
+        health.failures = 0
+        latency = call.time_to_first_token if call.time_to_first_token is not None else call.latency
+        health.latency.record(latency)
+        health.costs.append(call.cost)
+
+    def eject(self, model: str) -> None:
+        """Skip a model for ``cooldown`` seconds and forget its statistics."""
+        health = self._models[model] = ModelHealth(self.window)
+        health.unavailable_until = self.clock() + self.cooldown
+
+    def available(self, model: str) -> bool:
+        """Whether the model is not cooling down after errors or SLO breaches."""
+        return self.clock() >= self.get(model).unavailable_until
+
+    def p95(self, model: str) -> float | None:
+        """p95 latency of the model once enough calls were measured."""
+        health = self.get(model)
+        return health.latency.percentile(0.95) if len(health.latency) >= self.min_samples else None
+
+    def meets_slo(self, route: ModelRoute) -> bool:
+        """Whether the model's measured latency and cost are within the route's limits."""
+        health = self.get(route.model)
+        if len(health.latency) < self.min_samples:
+            return True
+        if route.max_latency is not None and health.latency.percentile(0.95) > route.max_latency:
+            return False
+        if route.max_cost is not None and health.mean_cost > route.max_cost:
+            return False
+        return True
+
+    def clear(self) -> None:
+        """Forget every model's health."""
+        self._models.clear()
+
+
+model_health = ModelHealthRegistry()
+
+
+class ModelRouter:
+    """Chooses which of an agent's models to call."""
+
+    def __init__(
+        self,
+        routes: Sequence[ModelRoute],
+        health: ModelHealthRegistry | None = None,
+        fallback_timeout: float | None = 30.0,
+    ):
+        """Initialize the router.
+
+        Args:
+            routes: Models the agent may use, in order of preference
+            health: Shared model health (defaults to the process-wide one)
+            fallback_timeout: Deadline per attempt in seconds on a route that
+                has a fallback, so a slow model gives way to the next one
+                (None = the retry policy's own timeout)
+
+        Raises:
+            ValueError: If ``routes`` is empty
+        """
+        if not routes:
+            raise ValueError("ModelRouter needs at least one route")
+        self.routes = list(routes)
+        self.health = health or model_health
+        self.fallback_timeout = fallback_timeout
+
+    @property
+    def primary(self) -> ModelRoute:
+        """The route used when every model is healthy and unmeasured."""
+        return min(self.routes, key=lambda route: route.tier)
+
+    def candidates(self) -> list[ModelRoute]:
+        """Return the routes to try, in order.
+
+        Healthy routes come first, by tier and then by measured p95 latency
+        (unmeasured routes rank at their latency limit, keeping the
+        configured order). A route whose model breaches the route's SLO
+        sends the model into cooldown. Unhealthy routes follow as a last
+        resort, so a call is always attempted.
+        """
+        healthy, unhealthy = [], []
+        for index, route in enumerate(self.routes):
+            if self.health.available(route.model) and not self.health.meets_slo(route):
+                self.health.eject(route.model)
+            if self.health.available(route.model):
+                p95 = self.health.p95(route.model)
+                if p95 is None:
+                    p95 = route.max_latency if route.max_latency is not None else float("inf")
+                healthy.append(((route.tier, p95, index), route))
+            else:
+                unhealthy.append(((route.tier, index), route))
+        healthy.sort(key=lambda entry: entry[0])
+        unhealthy.sort(key=lambda entry: entry[0])
+        return [route for _, route in healthy] + [route for _, route in unhealthy]
+
+    def record(self, call: CallMetrics) -> None:
+        """Feed a finished call into the shared model health."""
+        self.health.record(call)
+
+
+def parse_routes(
+    spec: str,
+    api_key_for: Callable[[str], str | None] | None = None,
+    max_latency: float | None = None,
+    max_cost: float | None = None,
+) -> list[ModelRoute]:
+    """Build routes from a tier specification.
+
+    Tiers are separated by commas, models within a tier by ``|``:
+    ``"openai/gpt-4o|openai/gpt-4o-2024-11-20,anthropic/claude-3-5-haiku-20241022"``.
+
+    Args:
+        spec: Tier specification
+        api_key_for: Returns the API key for a provider prefix
+        max_latency: p95 latency limit applied to every route
+        max_cost: Mean cost limit applied to every route
+
+    Returns:
+        Routes in the order they were written.
+    """
+    routes = []
+    for tier, models in enumerate(part for part in spec.split(",") if part.strip()):
+        for model in (name.strip() for name in models.split("|")):
+            if not model:
+                continue
+            provider = model.split("/")[0] if "/" in model else "openai"
+            routes.append(ModelRoute(
+                model=model,
+                api_key=api_key_for(provider) if api_key_for else None,
+                tier=tier,
+                max_latency=max_latency,
+                max_cost=max_cost,
+            ))
+    return routes
@@ -1,7 +1,7 @@
 """Configuration and environment variable loading."""
 
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from dotenv import load_dotenv
 
@@ -24,6 +24,20 @@ class Config:
     # OpenAI GPT (also used for Orchestrator)
     openai_api_key: str = ""
 
+    # Per-provider rate limits from <PROVIDER>_RPM, _TPM and _MAX_CONCURRENCY
+    rate_limits: dict[str, dict[str, float]] = field(default_factory=dict)
+
+    # Token budget per prompt before history is compacted (0 = never compact)
+    history_token_budget: int = 6000
+
+    # Model tiers per agent from <AGENT>_MODELS, e.g.
+    # GPT_MODELS="openai/gpt-4o,anthropic/claude-3-5-haiku-20241022"
+    model_routes: dict[str, str] = field(default_factory=dict)
+
+    # Routing limits per agent from <AGENT>_MAX_LATENCY (p95 seconds) and
+    # <AGENT>_MAX_COST (mean USD per call)
+    route_slos: dict[str, dict[str, float]] = field(default_factory=dict)
+
     @classmethod
     def from_env(cls) -> "Config":
         """Load configuration from environment variables."""
@@ -32,8 +46,21 @@ class Config:
             xai_api_key=os.getenv("XAI_API_KEY", ""),
             anthropic_api_key=os.getenv("ANTHROPIC_API_KEY", ""),
             openai_api_key=os.getenv("OPENAI_API_KEY", ""),
+            rate_limits=_rate_limits_from_env(),
+            history_token_budget=int(os.getenv("HISTORY_TOKEN_BUDGET", "6000")),
+            model_routes=_model_routes_from_env(),
+            route_slos=_route_slos_from_env(),
         )
 
+    def api_key(self, provider: str) -> str:
+        """Return the API key for a LiteLLM provider prefix ("" if unknown)."""
+        return {
+            "openai": self.openai_api_key,
+            "anthropic": self.anthropic_api_key,
+            "gemini": self.google_api_key,
+            "xai": self.xai_api_key,
+        }.get(provider, "")
+
     def validate(self) -> list[str]:
         """Validate that required API keys are set.
 
@@ -52,4 +79,49 @@ class Config:
         return missing
 
 
+def _rate_limits_from_env() -> dict[str, dict[str, float]]:
+    """Collect rate limit settings for each provider that has any set."""
+    limits: dict[str, dict[str, float]] = {}
+    for provider in ("openai", "anthropic", "gemini", "xai"):
+        settings = {}
+        for suffix, key in (
+            ("RPM", "requests_per_minute"),
+            ("TPM", "tokens_per_minute"),
+            ("MAX_CONCURRENCY", "max_concurrency"),
+        ):
+            value = os.getenv(f"{provider.upper()}_{suffix}")
+            if value:
+                settings[key] = float(value)
+        if settings:
+            limits[provider] = settings
+    return limits
+
+
+ROUTED_AGENTS = ("gpt", "claude", "gemini", "grok", "orchestrator")
+
+
+def _model_routes_from_env() -> dict[str, str]:
+    """Collect the model tiers of each agent that has <AGENT>_MODELS set."""
+    routes = {}
+    for agent in ROUTED_AGENTS:
+        value = os.getenv(f"{agent.upper()}_MODELS")
+        if value:
+            routes[agent] = value
+    return routes
+
+
+def _route_slos_from_env() -> dict[str, dict[str, float]]:
+    """Collect routing limits for each agent that has any set."""
+    slos: dict[str, dict[str, float]] = {}
+    for agent in ROUTED_AGENTS:
+        settings = {}
+        for suffix, key in (("MAX_LATENCY", "max_latency"), ("MAX_COST", "max_cost")):
+            value = os.getenv(f"{agent.upper()}_{suffix}")
+            if value:
+                settings[key] = float(value)
+        if settings:
+            slos[agent] = settings
+    return slos
+
+
 config = Config.from_env()
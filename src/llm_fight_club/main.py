@@ -6,11 +6,25 @@ orchestrated by Microsoft Agent Framework (MAF).
 
 import argparse
 import asyncio
+import os
 import sys
-from typing import Sequence
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Iterator, Sequence
 
+from llm_fight_club.clients import SQLiteResponseCache
 from llm_fight_club.config import config
-from llm_fight_club.workflows import FightClubGroupChat
+from llm_fight_club.metrics import default_metrics, format_summary
+
+if TYPE_CHECKING:
+    from llm_fight_club.workflows import BatchResult, Budget, FightClubGroupChat
+
+# Same names as workflows.scheduler.SCHEDULERS, which cannot be imported
+# without loading agent_framework just to build the argument parser
+SCHEDULER_CHOICES = ("llm", "round_robin", "mention", "weighted")
+# Same as workflows.budget.BUDGET_ACTIONS
+BUDGET_ACTION_CHOICES = ("synthesize", "stop")
+# Same as workflows.semantic_cache.DEFAULT_THRESHOLD
+SEMANTIC_THRESHOLD = 0.68
 
 
 def print_message(agent: str, content: str) -> None:
@@ -19,12 +33,69 @@ def print_message(agent: str, content: str) -> None:
     print("-" * 40)
 
 
-async def run_discussion(topic: str, max_rounds: int) -> None:
+async def stream_discussion(
+    chat: "FightClubGroupChat",
+    topic: str,
+    resume: str | None = None,
+) -> str:
+    """Print a discussion token by token and return the final answer.
+
+    With ``resume`` set, continues that checkpointed debate instead of
+    starting one on ``topic``.
+    """
+    updates = chat.stream_resume(resume) if resume else chat.stream(topic)
+    current_turn = None
+    async for update in updates:
+        if update.turn_id != current_turn:
+            if current_turn is not None:
+                print("\n" + "-" * 40)
+            print(f"\n[{update.agent}]: ", end="")
+            current_turn = update.turn_id
+        print(update.delta, end="", flush=True)
+
+    if current_turn is not None:
+        print("\n" + "-" * 40)
+    return chat.final_result
+
+
+async def run_discussion(
+    topic: str | None,
+    max_rounds: int,
+    parallel_opening: bool = False,
+    cache_path: str | None = None,
+    stream: bool = False,
+    scheduler: str | None = None,
+    checkpoint_path: str | None = None,
+    resume: str | None = None,
+    speculate: bool = False,
+    budget: "Budget | None" = None,
+    transcript_path: str | None = None,
+    markdown_path: str | None = None,
+    result_cache_path: str | None = None,
+    result_ttl: float | None = None,
+    semantic_threshold: float | None = None,
+    refresh: bool = False,
+) -> None:
     """Run a group chat discussion on the given topic.
 
     Args:
         topic: The topic to discuss.
         max_rounds: Maximum discussion rounds.
+        parallel_opening: Collect opening statements concurrently.
+        cache_path: SQLite file for caching LLM responses.
+        stream: Print agent turns token by token.
+        scheduler: Rule-based speaker scheduler (None = orchestrator LLM).
+        checkpoint_path: SQLite file for debate checkpoints.
+        resume: Debate ID to continue from ``checkpoint_path``.
+        speculate: Start the likely next speaker early.
+        budget: Token, cost and time limits for the debate.
+        transcript_path: SQLite file the transcript is appended to.
+        markdown_path: File the transcript is written to as Markdown.
+        result_cache_path: SQLite file of finished debates to reuse.
+        result_ttl: Seconds a finished debate is reused (None = forever).
+        semantic_threshold: Also reuse debates on paraphrased topics at least
+            this similar (None = exact topics only).
+        refresh: Hold the debate even if ``result_cache_path`` has it.
     """
     missing = config.validate()
     if missing:
@@ -32,6 +103,30 @@ async def run_discussion(topic: str, max_rounds: int) -> None:
         print("Please set the required environment variables.")
         sys.exit(1)
 
+    # Deferred so that --help and argument errors never import the LLM stack
+    from llm_fight_club.workflows import (
+        FightClubGroupChat,
+        SQLiteCheckpointStorage,
+        SQLiteTranscriptStore,
+        open_result_cache,
+    )
+
+    cache = SQLiteResponseCache(cache_path) if cache_path else None
+    checkpoints = SQLiteCheckpointStorage(checkpoint_path) if checkpoint_path else None
+    transcripts = SQLiteTranscriptStore(transcript_path) if transcript_path else None
+    result_cache = (
+        open_result_cache(result_cache_path, result_ttl, semantic_threshold)
+        if result_cache_path
+        else None
+    )
+
+    if resume:
+        record = checkpoints.load_debate(resume) if checkpoints else None
+        if record is None:
+            print(f"Error: Unknown debate: {resume}")
+            sys.exit(1)
+        topic = record.topic
+
     print("\n" + "=" * 60)
     print("LLM FIGHT CLUB")
     print("Powered by Microsoft Agent Framework (MAF)")
@@ -41,30 +136,417 @@ async def run_discussion(topic: str, max_rounds: int) -> None:
 
     chat = FightClubGroupChat(
         max_rounds=max_rounds,
-        on_message=print_message,
+        on_message=None if stream else print_message,
+        parallel_opening=parallel_opening,
+        cache=cache,
+        scheduler=scheduler,
+        checkpoint_storage=checkpoints,
+        speculate=speculate,
+        budget=budget,
+        transcript_store=transcripts,
+        result_cache=result_cache,
+        refresh=refresh,
     )
 
     try:
-        result = await chat.run(topic)
+        if stream:
+            result = await stream_discussion(chat, topic, resume=resume)
+        elif resume:
+            result = await chat.resume(resume)
+        else:
+            result = await chat.run(topic)
 
         print(f"\n{'='*20} Final Summary {'='*20}\n")
         print(result)
         print("\n" + "=" * 60)
 
+        replayed = chat.cached_debate
+        if replayed is not None:
+            if replayed.similarity < 1.0:
+                print(
+                    f"Replayed the debate on {replayed.topic!r} "
+                    f"(similarity {replayed.similarity:.2f}; --refresh to debate again)"
+                )
+            else:
+                print("Replayed from the result cache (--refresh to debate again)")
+        if cache is not None:
+            print(f"Cache: {cache.stats.hits} hits, {cache.stats.misses} misses")
+        if checkpoints is not None or transcripts is not None:
+            print(f"Debate ID: {chat.debate_id}")
+        if markdown_path:
+            with open(markdown_path, "w", encoding="utf-8") as f:
+                f.writelines(chat.transcript.iter_markdown())
+            print(f"Transcript: {markdown_path}")
+        stats = chat.speculation_stats
+        if stats is not None:
+            print(
+                f"Speculation: {stats.hits}/{stats.launched} hits ({stats.hit_rate:.0%}), "
+                f"~{stats.wasted_tokens} tokens wasted"
+            )
+        usage = chat.budget_usage
+        if usage is not None:
+            print(
+                f"Budget: {usage.tokens} tokens, ${usage.cost:.4f}, {usage.seconds:.1f}s"
+                + (" (downgraded)" if usage.downgraded else "")
+                + (f", stopped at {usage.exceeded}" if usage.exceeded else "")
+            )
+
+        print("\nLLM calls by agent:")
+        print(format_summary(default_metrics.summary(by="agent", debate_id=chat.debate_id)))
+        print("\nLLM calls by round:")
+        print(format_summary(default_metrics.summary(by="round", debate_id=chat.debate_id)))
+
     except Exception as e:
         print(f"\nError during discussion: {e}")
+        if checkpoints is not None and chat.debate_id:
+            print(f"Continue with: --checkpoint {checkpoint_path} --resume {chat.debate_id}")
         sys.exit(1)
 
 
+def print_batch_result(result: "BatchResult") -> None:
+    """Print a one-line summary of a finished batch debate."""
+    status = f"error: {result.error}" if result.error else "ok"
+    print(f"[{result.id}] {status} ({result.elapsed_seconds:.1f}s) {result.topic}")
+
+
+async def run_batch_discussions(
+    input_path: str,
+    output_path: str,
+    max_rounds: int,
+    concurrency: int,
+    cache_path: str | None = None,
+    scheduler: str | None = None,
+    budget: "Budget | None" = None,
+    workers: int = 1,
+    result_cache_path: str | None = None,
+    result_ttl: float | None = None,
+    semantic_threshold: float | None = None,
+    refresh: bool = False,
+) -> None:
+    """Run every topic in a JSONL file and write results to another JSONL file.
+
+    Args:
+        input_path: JSONL file with topics.
+        output_path: JSONL file receiving results.
+        max_rounds: Maximum discussion rounds per debate.
+        concurrency: Maximum number of debates running at once.
+        cache_path: SQLite file for caching LLM responses.
+        scheduler: Rule-based speaker scheduler (None = orchestrator LLM).
+        budget: Token, cost and time limits applied to each debate.
+        workers: Worker processes sharing the debates (1 = run in this process).
+        result_cache_path: SQLite file of finished debates to reuse.
+        result_ttl: Seconds a finished debate is reused (None = forever).
+        semantic_threshold: Also reuse debates on paraphrased topics at least
+            this similar (None = exact topics only).
+        refresh: Hold every debate even if ``result_cache_path`` has it.
+    """
+    missing = config.validate()
+    if missing:
+        print(f"Error: Missing API keys: {', '.join(missing)}")
+        print("Please set the required environment variables.")
+        sys.exit(1)
+
+    from llm_fight_club.workflows import load_topics, open_result_cache, run_batch, run_batch_workers
+
+    topics = load_topics(input_path)
+    result_cache = None
+
+    if workers > 1:
+        print(f"Running {len(topics)} debates ({workers} workers, concurrency: {concurrency} each)")
+        results = await run_batch_workers(
+            topics,
+            output_path,
+            workers=workers,
+            max_concurrency=concurrency,
+            max_rounds=max_rounds,
+            cache_path=cache_path,
+            on_result=print_batch_result,
+            scheduler=scheduler,
+            budget=budget,
+            result_cache_path=result_cache_path,
+            result_ttl=result_ttl,
+            semantic_threshold=semantic_threshold,
+            refresh=refresh,
+        )
+    else:
+        if result_cache_path:
+            result_cache = open_result_cache(result_cache_path, result_ttl, semantic_threshold)
+        print(f"Running {len(topics)} debates (concurrency: {concurrency})")
+        results = await run_batch(
+            topics,
+            output_path,
+            max_concurrency=concurrency,
+            max_rounds=max_rounds,
+            cache=SQLiteResponseCache(cache_path) if cache_path else None,
+            on_result=print_batch_result,
+            scheduler=scheduler,
+            budget=budget,
+            result_cache=result_cache,
+            refresh=refresh,
+        )
+
+    failed = sum(1 for r in results if r.error)
+    print(f"Done: {len(results) - failed} succeeded, {failed} failed -> {output_path}")
+    if result_cache is not None:
+        stats = result_cache.stats
+        print(
+            f"Result cache: {stats.exact_hits} exact, {stats.semantic_hits} similar, "
+            f"{stats.misses} misses ({stats.hit_rate:.0%} hit rate)"
+        )
+    print("\nLLM calls by agent:")
+    print(format_summary(default_metrics.summary(by="agent")))
+
+
+def weights_type(text: str) -> str:
+    """Validate ``--weights`` (e.g. "GPT=3,Claude=2") for argparse."""
+    from llm_fight_club.workflows.scheduler import parse_weights
+
+    try:
+        parse_weights(text)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e)) from None
+    return text
+
+
+def add_scheduler_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the speaker scheduling options to a parser."""
+    parser.add_argument(
+        "--scheduler",
+        choices=SCHEDULER_CHOICES,
+        default="llm",
+        help="How the next speaker is chosen: by the orchestrator LLM every round "
+        "(default) or locally, calling the LLM only for the final summary",
+    )
+    parser.add_argument(
+        "--weights",
+        type=weights_type,
+        default=None,
+        metavar="NAME=WEIGHT,...",
+        help="Share of turns per participant for --scheduler weighted, e.g. GPT=3,Claude=2 "
+        "(unlisted participants weigh 1)",
+    )
+
+
+def scheduler_from_args(parser: argparse.ArgumentParser, parsed: argparse.Namespace) -> str | None:
+    """Name of the scheduler selected on the command line (None = orchestrator LLM)."""
+    if parsed.weights and parsed.scheduler != "weighted":
+        parser.error("--weights requires --scheduler weighted")
+    if parsed.scheduler == "llm":
+        return None
+    return f"weighted:{parsed.weights}" if parsed.weights else parsed.scheduler
+
+
+def add_budget_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the per-debate budget options to a parser."""
+    parser.add_argument(
+        "--max-tokens",
+        type=int,
+        default=None,
+        help="End a debate once its LLM calls used this many tokens",
+    )
+    parser.add_argument(
+        "--max-cost",
+        type=float,
+        default=None,
+        metavar="USD",
+        help="End a debate once its LLM calls cost this much",
+    )
+    parser.add_argument(
+        "--max-seconds",
+        type=float,
+        default=None,
+        help="End a debate after this many seconds",
+    )
+    parser.add_argument(
+        "--on-budget",
+        choices=BUDGET_ACTION_CHOICES,
+        default="synthesize",
+        help="At a limit, summarize the debate so far (default) or stop without a summary; "
+        "models are downgraded to cheaper ones at 80%% of a limit",
+    )
+
+
+def add_result_cache_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the finished-debate cache options to a parser."""
+    parser.add_argument(
+        "--result-cache",
+        type=str,
+        default=None,
+        metavar="PATH",
+        help="Reuse finished debates on the same topic with the same prompts, models "
+        "and settings from a SQLite file",
+    )
+    parser.add_argument(
+        "--result-ttl",
+        type=float,
+        default=None,
+        metavar="SECONDS",
+        help="How long a finished debate is reused (default: forever)",
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Debate again even if --result-cache has the topic, and store the new result",
+    )
+    parser.add_argument(
+        "--semantic",
+        type=float,
+        nargs="?",
+        const=SEMANTIC_THRESHOLD,
+        default=None,
+        metavar="MIN_SIMILARITY",
+        help="Also replay debates on paraphrased topics from --result-cache "
+        f"(cosine similarity of local embeddings, default: {SEMANTIC_THRESHOLD})",
+    )
+
+
+def add_trace_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the span tracing options to a parser."""
+    parser.add_argument(
+        "--trace",
+        type=str,
+        default=None,
+        metavar="PATH",
+        help="Write a timeline of the debate (workflow events, LLM calls, callbacks) "
+        "as Chrome trace JSON, viewable in https://ui.perfetto.dev",
+    )
+    parser.add_argument(
+        "--otlp-endpoint",
+        type=str,
+        default=None,
+        metavar="URL",
+        help="Send the same spans to an OpenTelemetry collector over OTLP/HTTP "
+        "(e.g. http://localhost:4318/v1/traces)",
+    )
+
+
+@contextmanager
+def tracing_from_args(parsed: argparse.Namespace) -> Iterator[None]:
+    """Trace the block if requested on the command line, exporting even on failure."""
+    if not parsed.trace and not parsed.otlp_endpoint:
+        yield
+        return
+    from llm_fight_club.tracing import default_tracer
+
+    default_tracer.enabled = True
+    try:
+        yield
+    finally:
+        if parsed.trace:
+            default_tracer.write_chrome_trace(parsed.trace)
+            print(f"Trace: {len(default_tracer.spans)} spans -> {parsed.trace}")
+        if parsed.otlp_endpoint:
+            try:
+                default_tracer.export_otlp(parsed.otlp_endpoint)
+            except OSError as e:
+                print(f"Could not export spans to {parsed.otlp_endpoint}: {e}")
+
+
+def budget_from_args(parsed: argparse.Namespace) -> "Budget | None":
+    """Build the Budget selected on the command line, if any."""
+    if parsed.max_tokens is None and parsed.max_cost is None and parsed.max_seconds is None:
+        return None
+    from llm_fight_club.workflows.budget import Budget
+
+    return Budget(
+        max_tokens=parsed.max_tokens,
+        max_cost=parsed.max_cost,
+        max_seconds=parsed.max_seconds,
+        on_exceeded=parsed.on_budget,
+    )
+
+
+def batch_main(args: Sequence[str]) -> None:
+    """Entry point for the ``batch`` subcommand."""
+    parser = argparse.ArgumentParser(
+        prog="llm_fight_club.main batch",
+        description="Run many debates from a JSONL file of topics",
+    )
+    parser.add_argument(
+        "input",
+        type=str,
+        help="JSONL file with one topic per line",
+    )
+    parser.add_argument(
+        "--output",
+        "-o",
+        type=str,
+        default="results.jsonl",
+        help="JSONL file for results (default: results.jsonl)",
+    )
+    parser.add_argument(
+        "--rounds",
+        "-r",
+        type=int,
+        default=5,
+        help="Maximum discussion rounds (default: 5)",
+    )
+    parser.add_argument(
+        "--concurrency",
+        "-c",
+        type=int,
+        default=4,
+        help="Maximum debates running at once, per worker (default: 4)",
+    )
+    parser.add_argument(
+        "--workers",
+        "-w",
+        type=int,
+        default=1,
+        help="Worker processes to spread the debates over, each with its own "
+        "event loop (default: 1 = run in this process; 0 = one per CPU)",
+    )
+    parser.add_argument(
+        "--cache",
+        type=str,
+        default=None,
+        metavar="PATH",
+        help="Cache LLM responses in a SQLite file",
+    )
+    add_scheduler_arguments(parser)
+    add_budget_arguments(parser)
+    add_result_cache_arguments(parser)
+    add_trace_arguments(parser)
+
+    parsed = parser.parse_args(args)
+    if parsed.semantic is not None and not parsed.result_cache:
+        parser.error("--semantic requires --result-cache")
+
+    with tracing_from_args(parsed):
+        asyncio.run(
+            run_batch_discussions(
+                parsed.input,
+                parsed.output,
+                max_rounds=parsed.rounds,
+                concurrency=parsed.concurrency,
+                cache_path=parsed.cache,
+                scheduler=scheduler_from_args(parser, parsed),
+                budget=budget_from_args(parsed),
+                workers=parsed.workers or os.cpu_count() or 1,
+                result_cache_path=parsed.result_cache,
+                result_ttl=parsed.result_ttl,
+                semantic_threshold=parsed.semantic,
+                refresh=parsed.refresh,
+            )
+        )
+
+
 def main(args: Sequence[str] | None = None) -> None:
     """Main entry point for the CLI."""
+    argv = list(sys.argv[1:] if args is None else args)
+    if argv and argv[0] == "batch":
+        batch_main(argv[1:])
+        return
+
     parser = argparse.ArgumentParser(
         description="LLM Fight Club - Watch AIs debate!",
+        epilog="Run many topics at once with: batch TOPICS.jsonl -o RESULTS.jsonl",
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
     parser.add_argument(
         "topic",
         type=str,
+        nargs="?",
         help="The topic for the AIs to discuss",
     )
     parser.add_argument(
@@ -74,10 +556,91 @@ def main(args: Sequence[str] | None = None) -> None:
         default=5,
         help="Maximum discussion rounds (default: 5)",
     )
+    parser.add_argument(
+        "--parallel-opening",
+        action="store_true",
+        help="Let all agents give opening statements concurrently",
+    )
+    parser.add_argument(
+        "--cache",
+        type=str,
+        default=None,
+        metavar="PATH",
+        help="Cache LLM responses in a SQLite file",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Show agent replies token by token as they are generated",
+    )
+    add_scheduler_arguments(parser)
+    parser.add_argument(
+        "--checkpoint",
+        type=str,
+        default=None,
+        metavar="PATH",
+        help="Checkpoint the debate to a SQLite file so it can be resumed",
+    )
+    parser.add_argument(
+        "--resume",
+        type=str,
+        default=None,
+        metavar="DEBATE_ID",
+        help="Continue an interrupted debate from its last completed turn (needs --checkpoint)",
+    )
+    parser.add_argument(
+        "--speculate",
+        action="store_true",
+        help="Start the likely next speaker while the orchestrator decides "
+        "(faster rounds, some wasted tokens)",
+    )
+    add_budget_arguments(parser)
+    parser.add_argument(
+        "--transcripts",
+        type=str,
+        default=None,
+        metavar="PATH",
+        help="Append the debate transcript (timestamps, token counts) to a SQLite file",
+    )
+    parser.add_argument(
+        "--markdown",
+        type=str,
+        default=None,
+        metavar="PATH",
+        help="Write the debate transcript to a Markdown file",
+    )
+    add_result_cache_arguments(parser)
+    add_trace_arguments(parser)
 
-    parsed = parser.parse_args(args)
+    parsed = parser.parse_args(argv)
+    if parsed.resume and not parsed.checkpoint:
+        parser.error("--resume requires --checkpoint")
+    if not parsed.topic and not parsed.resume:
+        parser.error("a topic is required unless --resume is given")
+    if parsed.semantic is not None and not parsed.result_cache:
+        parser.error("--semantic requires --result-cache")
 
-    asyncio.run(run_discussion(parsed.topic, max_rounds=parsed.rounds))
+    with tracing_from_args(parsed):
+        asyncio.run(
+            run_discussion(
+                parsed.topic,
+                max_rounds=parsed.rounds,
+                parallel_opening=parsed.parallel_opening,
+                cache_path=parsed.cache,
+                stream=parsed.stream,
+                scheduler=scheduler_from_args(parser, parsed),
+                checkpoint_path=parsed.checkpoint,
+                resume=parsed.resume,
+                speculate=parsed.speculate,
+                budget=budget_from_args(parsed),
+                transcript_path=parsed.transcripts,
+                markdown_path=parsed.markdown,
+                result_cache_path=parsed.result_cache,
+                result_ttl=parsed.result_ttl,
+                semantic_threshold=parsed.semantic,
+                refresh=parsed.refresh,
+            )
+        )
 
 
 if __name__ == "__main__":
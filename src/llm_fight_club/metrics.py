@@ -0,0 +1,266 @@
+"""Latency, token and cost metrics for LLM calls."""
+
+from collections import deque
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager, suppress
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+
+@dataclass
+class DebateContext:
+    """Identifies the debate (and round) that LLM calls belong to."""
+
+    debate_id: str
+    round: int = 0
+    models: dict[str, str] = field(default_factory=dict)  # Model substitutions, e.g. budget downgrades
+
+
+_current_debate: ContextVar[DebateContext | None] = ContextVar("current_debate", default=None)
+
+
+@contextmanager
+def debate_context(debate_id: str) -> Iterator[DebateContext]:
+    """Attribute LLM calls made inside the block to a debate.
+
+    The yielded context is mutable so the workflow can advance ``round``
+    or substitute ``models`` while calls are in flight.
+    """
+    ctx = DebateContext(debate_id=debate_id)
+    token = _current_debate.set(ctx)
+    try:
+        yield ctx
+    finally:
+        # An abandoned async generator may be finalized from another context
+        with suppress(ValueError):
+            _current_debate.reset(token)
+
+
+def current_debate() -> DebateContext | None:
+    """Return the debate the current task is working on, if any."""
+    return _current_debate.get()
+
+
+@dataclass
+class CallMetrics:
+    """Measurements for a single LLM call."""
+
+    model: str
+    provider: str
+    agent: str | None = None
+    debate_id: str | None = None
+    round: int | None = None
+    latency: float = 0.0
+    time_to_first_token: float | None = None
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    cached_prompt_tokens: int = 0  # Part of prompt_tokens read from the provider's prompt cache
+    cost: float = 0.0
+    cached: bool = False
+    error: str | None = None
+
+
+@dataclass
+class MetricsSummary:
+    """Aggregate of several calls."""
+
+    calls: int = 0
+    errors: int = 0
+    cached: int = 0
+    total_latency: float = 0.0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    cached_prompt_tokens: int = 0
+    cost: float = 0.0
+    _ttfts: list[float] = field(default_factory=list, repr=False)
+
+    def add(self, call: CallMetrics) -> None:
+        """Include a call in the aggregate."""
+        self.calls += 1
+        self.errors += call.error is not None
+        self.cached += call.cached
+        self.total_latency += call.latency
+        self.prompt_tokens += call.prompt_tokens
+        self.completion_tokens += call.completion_tokens
+        self.cached_prompt_tokens += call.cached_prompt_tokens
+        self.cost += call.cost
+        if call.time_to_first_token is not None:
+            self._ttfts.append(call.time_to_first_token)
+
+    @property
+    def avg_latency(self) -> float:
+        """Mean latency per call in seconds."""
+        return self.total_latency / self.calls if self.calls else 0.0
+
+    @property
+    def prompt_cache_hit_rate(self) -> float:
+        """Share of prompt tokens served from provider prompt caches."""
+        return self.cached_prompt_tokens / self.prompt_tokens if self.prompt_tokens else 0.0
+
+    @property
+    def avg_time_to_first_token(self) -> float | None:
+        """Mean time to first token over streamed calls."""
+        return sum(self._ttfts) / len(self._ttfts) if self._ttfts else None
+
+
+MetricsHook = Callable[[CallMetrics], None]
+
+
+class MetricsCollector:
+    """Collects CallMetrics and forwards them to registered hooks."""
+
+    def __init__(self, max_calls: int = 10_000):
+        """Initialize the collector.
+
+        Args:
+            max_calls: Number of most recent calls kept for summaries
+        """
+        self.calls: deque[CallMetrics] = deque(maxlen=max_calls)
+        self._hooks: list[MetricsHook] = []
+
+    def add_hook(self, hook: MetricsHook) -> None:
+        """Call ``hook`` for every recorded call."""
+        self._hooks.append(hook)
+
+    def remove_hook(self, hook: MetricsHook) -> None:
+        """Stop calling ``hook``."""
+        self._hooks.remove(hook)
+
+    @contextmanager
+    def hooked(self, hook: MetricsHook) -> Iterator[None]:
+        """Call ``hook`` for every call recorded inside the block."""
+        self.add_hook(hook)
+        try:
+            yield
+        finally:
+            self.remove_hook(hook)
+
+    def record(self, call: CallMetrics) -> None:
+        """Store a call and notify hooks."""
+        self.calls.append(call)
+        for hook in self._hooks:
+            hook(call)
+
+    def summary(
+        self,
+        by: str = "agent",
+        debate_id: str | None = None,
+    ) -> dict[Any, MetricsSummary]:
+        """Aggregate recorded calls.
+
+        Args:
+            by: CallMetrics field to group by ("agent", "round", "debate_id", "model", ...)
+            debate_id: Only include calls from this debate
+
+        Returns:
+            Summary per group value.
+        """
+        groups: dict[Any, MetricsSummary] = {}
+        for call in self.calls:
+            if debate_id is not None and call.debate_id != debate_id:
+                continue
+            key = getattr(call, by)
+            groups.setdefault(key, MetricsSummary()).add(call)
+        return groups
+
+    def clear(self) -> None:
+        """Forget all recorded calls."""
+        self.calls.clear()
+
+
+def format_summary(summaries: dict[Any, MetricsSummary]) -> str:
+    """Render summaries as a plain-text table."""
+    lines = [
+        f"{'':<14}{'calls':>6}{'avg s':>8}{'ttft s':>8}{'in tok':>9}{'cached':>9}{'out tok':>9}"
+        f"{'cost $':>10}"
+    ]
+    total = MetricsSummary()
+    for key, summary in summaries.items():
+        ttft = summary.avg_time_to_first_token
+        lines.append(
+            f"{str(key):<14}{summary.calls:>6}{summary.avg_latency:>8.2f}"
+            f"{(f'{ttft:.2f}' if ttft is not None else '-'):>8}"
+            f"{summary.prompt_tokens:>9}{summary.cached_prompt_tokens:>9}"
+            f"{summary.completion_tokens:>9}{summary.cost:>10.4f}"
+        )
+        total.calls += summary.calls
+        total.prompt_tokens += summary.prompt_tokens
+        total.cached_prompt_tokens += summary.cached_prompt_tokens
+        total.completion_tokens += summary.completion_tokens
+        total.cost += summary.cost
+    lines.append(
+        f"{'Total':<14}{total.calls:>6}{'':>8}{'':>8}"
+        f"{total.prompt_tokens:>9}{total.cached_prompt_tokens:>9}"
+        f"{total.completion_tokens:>9}{total.cost:>10.4f}"
+    )
+    return "\n".join(lines)
+
+
+class PrometheusExporter:
+    """Metrics hook publishing to prometheus_client (optional dependency)."""
+
+    def __init__(self, namespace: str = "llm_fight_club"):
+        try:
+            from prometheus_client import Counter, Histogram
+        except ImportError as e:
+            raise ImportError(
+                "PrometheusExporter requires prometheus_client: pip install prometheus-client"
+            ) from e
+
+        labels = ["agent", "provider", "model"]
+        self.latency = Histogram(f"{namespace}_call_latency_seconds", "LLM call latency", labels)
+        self.ttft = Histogram(
+            f"{namespace}_time_to_first_token_seconds", "Time to first streamed token", labels
+        )
+        self.tokens = Counter(f"{namespace}_tokens_total", "Tokens used", [*labels, "kind"])
+        self.cost = Counter(f"{namespace}_cost_dollars_total", "Estimated cost", labels)
+        self.errors = Counter(f"{namespace}_errors_total", "Failed calls", labels)
+
+    def __call__(self, call: CallMetrics) -> None:
+        labels = (call.agent or "", call.provider, call.model)
+        self.latency.labels(*labels).observe(call.latency)
+        if call.time_to_first_token is not None:
+            self.ttft.labels(*labels).observe(call.time_to_first_token)
+        self.tokens.labels(*labels, "prompt").inc(call.prompt_tokens)
+        self.tokens.labels(*labels, "completion").inc(call.completion_tokens)
+        self.tokens.labels(*labels, "cached_prompt").inc(call.cached_prompt_tokens)
+        self.cost.labels(*labels).inc(call.cost)
+        if call.error is not None:
+            self.errors.labels(*labels).inc()
+
+
+class OpenTelemetryExporter:
+    """Metrics hook publishing through the OpenTelemetry metrics API."""
+
+    def __init__(self, meter_name: str = "llm_fight_club"):
+        try:
+            from opentelemetry import metrics
+        except ImportError as e:
+            raise ImportError(
+                "OpenTelemetryExporter requires opentelemetry-api: pip install opentelemetry-api"
+            ) from e
+
+        meter = metrics.get_meter(meter_name)
+        self.latency = meter.create_histogram("llm.call.latency", unit="s")
+        self.ttft = meter.create_histogram("llm.call.time_to_first_token", unit="s")
+        self.tokens = meter.create_counter("llm.tokens")
+        self.cost = meter.create_counter("llm.cost", unit="USD")
+
+    def __call__(self, call: CallMetrics) -> None:
+        attributes = {
+            "agent": call.agent or "",
+            "provider": call.provider,
+            "model": call.model,
+            "error": call.error is not None,
+        }
+        self.latency.record(call.latency, attributes)
+        if call.time_to_first_token is not None:
+            self.ttft.record(call.time_to_first_token, attributes)
+        self.tokens.add(call.prompt_tokens, {**attributes, "kind": "prompt"})
+        self.tokens.add(call.completion_tokens, {**attributes, "kind": "completion"})
+        self.tokens.add(call.cached_prompt_tokens, {**attributes, "kind": "cached_prompt"})
+        self.cost.add(call.cost, attributes)
+
+
+default_metrics = MetricsCollector()
@@ -1,12 +1,141 @@
-"""Prompt loader for YAML-based prompt management."""
+"""Prompt loader for YAML-based prompt management.
 
+Prompts are parsed once and cached by ``prompt_registry``; a file is parsed
+again only after its modification time changes, so edits to
+``prompts/*.yaml`` take effect without a restart. System prompts may use
+``$name`` placeholders (e.g. ``$topic``, ``$participants``) that are filled
+in by ``get_system_prompt(name, **variables)``; ``$participants`` defaults
+to the standard roster when no value is given.
+"""
+
+import copy
+import threading
+import time
+from dataclasses import dataclass
 from pathlib import Path
+from string import Template
+from typing import Any
 
 import yaml
 
 
 PROMPTS_DIR = Path(__file__).parent.parent.parent / "prompts"
 
+# Placeholder values used when a caller gives none; the roster is the
+# participants of the default AgentRegistry, in speaking order
+DEFAULT_VARIABLES = {"participants": " → ".join(("GPT", "Claude", "Gemini", "Grok"))}
+
+
+@dataclass
+class _Prompt:
+    config: dict[str, Any]
+    template: Template
+    mtime_ns: int
+
+
+class PromptRegistry:
+    """Process-wide cache of parsed prompt files with mtime-based reload."""
+
+    def __init__(
+        self,
+        directory: str | Path = PROMPTS_DIR,
+        check_interval: float = 1.0,
+        defaults: dict[str, Any] | None = None,
+    ):
+        """Initialize the registry.
+
+        Args:
+            directory: Folder containing ``<name>.yaml`` prompt files
+            check_interval: Seconds between modification-time checks of a
+                file (0 = check on every lookup)
+            defaults: Placeholder values used when a caller gives none
+                (defaults to ``DEFAULT_VARIABLES``)
+        """
+        self.directory = Path(directory)
+        self.check_interval = check_interval
+        self.defaults = DEFAULT_VARIABLES if defaults is None else defaults
+        self._prompts: dict[str, _Prompt] = {}
+        self._checked: dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._version = 0
+
+    def _path(self, name: str) -> Path:
+        return self.directory / f"{name}.yaml"
+
+    def _load(self, name: str) -> _Prompt:
+        path = self._path(name)
+        try:
+            mtime_ns = path.stat().st_mtime_ns
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Prompt file not found: {path}") from None
+        with open(path, "r", encoding="utf-8") as f:
+            config = yaml.safe_load(f) or {}
+        return _Prompt(config, Template(config.get("system_prompt", "")), mtime_ns)
+
+    def _get(self, name: str) -> _Prompt:
+        now = time.monotonic()
+        cached = self._prompts.get(name)
+        if cached is not None and now - self._checked.get(name, 0.0) < self.check_interval:
+            return cached
+        with self._lock:
+            cached = self._prompts.get(name)
+            try:
+                stale = cached is None or self._path(name).stat().st_mtime_ns != cached.mtime_ns
+            except FileNotFoundError:
+                stale = True
+            if stale:
+                if cached is not None:
+                    self._version += 1
+                cached = self._prompts[name] = self._load(name)
+            self._checked[name] = now
+        return cached
+
+    def load(self, name: str) -> dict[str, Any]:
+        """Return the parsed YAML of a prompt file (a copy, safe to modify)."""
+        return copy.deepcopy(self._get(name).config)
+
+    def system_prompt(self, name: str, **variables: Any) -> str:
+        """Return a system prompt with ``$placeholders`` filled in.
+
+        Values missing from ``variables`` come from ``defaults``;
+        placeholders with neither are left as they are.
+        """
+        template = self._get(name).template
+        values = {**self.defaults, **variables}
+        return template.safe_substitute({key: str(value) for key, value in values.items()})
+
+    def load_all(self) -> list[str]:
+        """Parse every prompt file in the directory; return their names."""
+        names = sorted(path.stem for path in self.directory.glob("*.yaml"))
+        for name in names:
+            self._get(name)
+        return names
+
+    @property
+    def version(self) -> int:
+        """Counter that increases whenever a loaded prompt file changed.
+
+        Reading it re-checks the files already loaded (subject to
+        ``check_interval``), so callers holding objects built from prompts
+        can compare versions to decide when to rebuild them.
+        """
+        for name in list(self._prompts):
+            try:
+                self._get(name)
+            except FileNotFoundError:
+                pass
+        return self._version
+
+    def clear(self) -> None:
+        """Forget every cached prompt."""
+        with self._lock:
+            self._prompts.clear()
+            self._checked.clear()
+            self._version += 1
+
+
+prompt_registry = PromptRegistry()
+
 
 def load_prompt(agent_name: str) -> dict:
     """Load prompt configuration for an agent from YAML.
@@ -17,23 +146,17 @@ def load_prompt(agent_name: str) -> dict:
     Returns:
         Dictionary with prompt configuration.
     """
-    yaml_path = PROMPTS_DIR / f"{agent_name}.yaml"
-
-    if not yaml_path.exists():
-        raise FileNotFoundError(f"Prompt file not found: {yaml_path}")
-
-    with open(yaml_path, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+    return prompt_registry.load(agent_name)
 
 
-def get_system_prompt(agent_name: str) -> str:
+def get_system_prompt(agent_name: str, **variables: Any) -> str:
     """Get the system prompt for an agent.
 
     Args:
         agent_name: Name of the agent (e.g., 'gemini', 'grok')
+        **variables: Values for ``$placeholders`` in the prompt
 
     Returns:
         System prompt string.
     """
-    config = load_prompt(agent_name)
-    return config.get("system_prompt", "")
+    return prompt_registry.system_prompt(agent_name, **variables)
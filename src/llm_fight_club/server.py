@@ -0,0 +1,534 @@
+"""HTTP API for running group debates, streamed over Server-Sent Events.
+
+Endpoints:
+    POST /debates              {"topic": ..., "max_rounds": 5, "scheduler": null}
+                               (scheduler: "round_robin", "mention" or
+                               "weighted:GPT=3,Claude=2")
+                               -> 202 {"id": ..., "status": "queued", "position": N}
+                               -> 429 with Retry-After when the queue is full
+    GET  /debates/{id}         Status, history and result of a debate
+    GET  /debates/{id}/events  SSE stream: ``update`` per text delta, then
+                               ``result`` or ``error`` (past events are replayed)
+    GET  /debates/{id}/transcript
+                               Transcript as Markdown (also for debates that
+                               left memory, when a transcript store is set)
+    GET  /stats                Queue depth, in-flight debates and totals
+    GET  /health               Liveness probe
+
+Built on ``asyncio`` streams only, so it adds no dependencies. Run with:
+    uv run python -m llm_fight_club.server --port 8000 --concurrency 8
+"""
+
+import argparse
+import asyncio
+import json
+import time
+import uuid
+from collections.abc import AsyncIterator, Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+from llm_fight_club.agents import AgentRegistry
+from llm_fight_club.clients import ResponseCache, SQLiteResponseCache
+from llm_fight_club.config import config
+from llm_fight_club.workflows import FightClubGroupChat
+from llm_fight_club.workflows.scheduler import SCHEDULERS, get_scheduler
+from llm_fight_club.workflows.transcript import (
+    DEFAULT_WINDOW,
+    SQLiteTranscriptStore,
+    Transcript,
+    iter_markdown,
+)
+
+_REASONS = {
+    200: "OK",
+    202: "Accepted",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+    429: "Too Many Requests",
+}
+_MAX_BODY = 64 * 1024
+_KEEPALIVE_SECONDS = 15.0
+
+
+class QueueFullError(Exception):
+    """Raised when a debate is submitted while the queue is full."""
+
+
+@dataclass
+class DebateJob:
+    """A debate submitted to the service and everything it has produced."""
+
+    id: str
+    topic: str
+    max_rounds: int
+    scheduler: str | None = None
+    status: str = "queued"  # queued, running, finished or failed
+    result: str = ""
+    error: str | None = None
+    transcript: Transcript | None = None
+    events: list[tuple[str, dict[str, Any]]] = field(default_factory=list)
+    created_at: float = field(default_factory=time.time)
+    started_at: float | None = None
+    finished_at: float | None = None
+    _changed: asyncio.Event = field(default_factory=asyncio.Event, repr=False)
+    _subscribers: int = field(default=0, repr=False)
+
+    @property
+    def done(self) -> bool:
+        return self.status in ("finished", "failed")
+
+    def publish(self, event: str, data: dict[str, Any]) -> None:
+        """Append an event and wake every subscriber."""
+        self.events.append((event, data))
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    async def subscribe(self, timeout: float | None = None) -> AsyncIterator[tuple[str, dict[str, Any]] | None]:
+        """Yield past and future events until the debate ends.
+
+        Args:
+            timeout: Seconds to wait for a new event before yielding None
+                (lets the caller send a keep-alive)
+        """
+        index = 0
+        self._subscribers += 1
+        try:
+            while True:
+                changed = self._changed
+                while index < len(self.events):
+                    yield self.events[index]
+                    index += 1
+                if self.done:
+                    return
+                try:
+                    await asyncio.wait_for(changed.wait(), timeout)
+                except asyncio.TimeoutError:
+                    yield None
+        finally:
+            self._subscribers -= 1
+            self.compact()
+
+    def compact(self) -> None:
+        """Merge a finished debate's text deltas into one ``update`` per turn.
+
+        Replaying the compacted events yields the same text, while a
+        finished job holds one event per message instead of one per token.
+        Deferred while a subscriber is still reading the events.
+        """
+        if not self.done or self._subscribers:
+            return
+        events: list[tuple[str, dict[str, Any]]] = []
+        for event, data in self.events:
+            if event == "update" and events and events[-1][0] == "update" and (
+                events[-1][1]["turn_id"] == data["turn_id"]
+            ):
+                events[-1] = (event, {**events[-1][1], "delta": events[-1][1]["delta"] + data["delta"]})
+            else:
+                events.append((event, data))
+        self.events = events
+
+    @property
+    def history(self) -> list[dict[str, Any]]:
+        """Messages of the debate still held in memory."""
+        if self.transcript is None:
+            return []
+        return [entry.to_message() for entry in self.transcript.recent]
+
+    def iter_markdown(self) -> Iterable[str]:
+        """Stream the transcript as Markdown."""
+        if self.transcript is None:
+            return iter_markdown(self.topic, [])
+        return self.transcript.iter_markdown()
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "id": self.id,
+            "topic": self.topic,
+            "max_rounds": self.max_rounds,
+            "scheduler": self.scheduler,
+            "status": self.status,
+            "result": self.result,
+            "error": self.error,
+            "history": self.history,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
+
+
+class DebateService:
+    """Runs submitted debates on a fixed number of workers.
+
+    Submissions wait in a bounded queue; when it is full ``submit`` raises
+    ``QueueFullError`` instead of letting work pile up, so callers can back
+    off. Finished jobs are kept (up to ``max_finished``) for late readers.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int = 4,
+        max_queue: int = 32,
+        registry: AgentRegistry | None = None,
+        cache: ResponseCache | None = None,
+        max_finished: int = 1000,
+        transcript_store: SQLiteTranscriptStore | None = None,
+        history_window: int = DEFAULT_WINDOW,
+    ):
+        """Initialize the service.
+
+        Args:
+            max_concurrent: Debates running at once
+            max_queue: Debates waiting for a worker before submissions are rejected
+            registry: Source of agents and clients (defaults to the shared registry)
+            cache: Optional response cache shared by all debates
+            max_finished: Finished debates kept in memory
+            transcript_store: Append every debate's messages to this log, so
+                transcripts outlive ``max_finished``
+            history_window: Messages of each debate kept in memory
+        """
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.registry = registry
+        self.cache = cache
+        self.max_finished = max_finished
+        self.transcript_store = transcript_store
+        self.history_window = history_window
+        self.jobs: dict[str, DebateJob] = {}
+        self.in_flight = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self._queue: asyncio.Queue[DebateJob] = asyncio.Queue(maxsize=max_queue)
+        self._workers: list[asyncio.Task] = []
+
+    def start(self) -> None:
+        """Start the worker tasks (must be called inside a running loop)."""
+        if not self._workers:
+            self._workers = [
+                asyncio.create_task(self._worker()) for _ in range(self.max_concurrent)
+            ]
+
+    async def close(self) -> None:
+        """Stop the workers; running debates are cancelled."""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    def submit(self, topic: str, max_rounds: int = 5, scheduler: str | None = None) -> DebateJob:
+        """Queue a debate.
+
+        Raises:
+            QueueFullError: If ``max_queue`` debates are already waiting
+        """
+        job = DebateJob(id=uuid.uuid4().hex, topic=topic, max_rounds=max_rounds, scheduler=scheduler)
+        try:
+            self._queue.put_nowait(job)
+        except asyncio.QueueFull:
+            self.rejected += 1
+            raise QueueFullError(f"{self.max_queue} debates already waiting") from None
+        self.jobs[job.id] = job
+        self._evict()
+        return job
+
+    def stats(self) -> dict[str, int]:
+        """Return queue depth, in-flight debates and totals."""
+        return {
+            "queued": self._queue.qsize(),
+            "in_flight": self.in_flight,
+            "completed": self.completed,
+            "failed": self.failed,
+            "rejected": self.rejected,
+            "max_concurrent": self.max_concurrent,
+            "max_queue": self.max_queue,
+        }
+
+    def _evict(self) -> None:
+        finished = [job_id for job_id, job in self.jobs.items() if job.done]
+        for job_id in finished[: max(0, len(finished) - self.max_finished)]:
+            del self.jobs[job_id]
+
+    async def _worker(self) -> None:
+        while True:
+            job = await self._queue.get()
+            self.in_flight += 1
+            try:
+                await self._run(job)
+            finally:
+                self.in_flight -= 1
+                self._queue.task_done()
+
+    async def _run(self, job: DebateJob) -> None:
+        job.status = "running"
+        job.started_at = time.time()
+        job.publish("status", {"status": "running"})
+        chat = FightClubGroupChat(
+            max_rounds=job.max_rounds,
+            cache=self.cache,
+            registry=self.registry,
+            scheduler=job.scheduler,
+            transcript_store=self.transcript_store,
+            history_window=self.history_window,
+        )
+        try:
+            async for update in chat.stream(job.topic, debate_id=job.id):
+                job.transcript = chat.transcript
+                job.publish(
+                    "update",
+                    {"agent": update.agent, "delta": update.delta, "turn_id": update.turn_id},
+                )
+        except asyncio.CancelledError:
+            job.error = "cancelled"
+            job.status = "failed"
+            self.failed += 1
+            raise
+        except Exception as e:
+            job.error = str(e) or type(e).__name__
+            job.status = "failed"
+            self.failed += 1
+            job.publish("error", {"error": job.error})
+        else:
+            job.result = chat.final_result
+            job.status = "finished"
+            self.completed += 1
+            job.publish("result", {"result": job.result})
+        finally:
+            job.transcript = chat.transcript
+            job.finished_at = time.time()
+            # Wake subscribers so they notice the debate is over
+            job.publish("status", {"status": job.status})
+            job.compact()
+
+
+class _HTTPError(Exception):
+    def __init__(self, status: int, message: str, headers: dict[str, str] | None = None):
+        super().__init__(message)
+        self.status = status
+        self.headers = headers or {}
+
+
+class DebateServer:
+    """Minimal HTTP/1.1 front end for a DebateService."""
+
+    def __init__(self, service: DebateService, host: str = "127.0.0.1", port: int = 8000):
+        """Initialize the server.
+
+        Args:
+            service: Runs the debates
+            host: Interface to bind
+            port: Port to bind (0 = any free port)
+        """
+        self.service = service
+        self.host = host
+        self.port = port
+        self._server: asyncio.Server | None = None
+
+    async def start(self) -> None:
+        """Start the workers and begin accepting connections."""
+        self.service.start()
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def close(self) -> None:
+        """Stop accepting connections and stop the service."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        await self.service.close()
+
+    async def serve_forever(self) -> None:
+        await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            method, path, body = await self._read_request(reader)
+            await self._route(method, path, body, writer)
+        except _HTTPError as e:
+            await self._send_json(writer, e.status, {"error": str(e)}, e.headers)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def _read_request(self, reader: asyncio.StreamReader) -> tuple[str, str, bytes]:
+        try:
+            head = await reader.readuntil(b"\r\n\r\n")
+        except asyncio.LimitOverrunError:
+            raise _HTTPError(413, "Headers too large") from None
+        lines = head.decode("latin-1").split("\r\n")
+        try:
+            method, target, _ = lines[0].split(" ", 2)
+        except ValueError:
+            raise _HTTPError(400, "Malformed request line") from None
+        headers = {}
+        for line in lines[1:]:
+            if ":" in line:
+                name, value = line.split(":", 1)
+                headers[name.strip().lower()] = value.strip()
+        declared = headers.get("content-length") or "0"
+        # Digits only: int() would also accept signs, spaces and underscores
+        if not (declared.isascii() and declared.isdigit()):
+            raise _HTTPError(400, "Invalid Content-Length")
+        length = int(declared)
+        if length > _MAX_BODY:
+            raise _HTTPError(413, "Body too large")
+        body = await reader.readexactly(length) if length else b""
+        return method.upper(), target.split("?", 1)[0].rstrip("/") or "/", body
+
+    async def _route(self, method: str, path: str, body: bytes, writer: asyncio.StreamWriter) -> None:
+        parts = path.strip("/").split("/")
+        if path == "/health":
+            await self._send_json(writer, 200, {"status": "ok"})
+        elif path == "/stats":
+            await self._send_json(writer, 200, self.service.stats())
+        elif parts[0] == "debates" and len(parts) == 1:
+            if method != "POST":
+                raise _HTTPError(405, "Use POST to start a debate")
+            await self._create(body, writer)
+        elif parts[0] == "debates" and len(parts) in (2, 3):
+            job = self.service.jobs.get(parts[1])
+            if job is None and parts[2:] == ["transcript"]:
+                await self._send_stored_transcript(parts[1], writer)
+                return
+            if job is None:
+                raise _HTTPError(404, f"Unknown debate: {parts[1]}")
+            if len(parts) == 2:
+                await self._send_json(writer, 200, job.to_dict())
+            elif parts[2] == "events":
+                await self._stream(job, writer)
+            elif parts[2] == "transcript":
+                await self._send_markdown(writer, job.iter_markdown())
+            else:
+                raise _HTTPError(404, f"Not found: {path}")
+        else:
+            raise _HTTPError(404, f"Not found: {path}")
+
+    async def _create(self, body: bytes, writer: asyncio.StreamWriter) -> None:
+        try:
+            request = json.loads(body or b"{}")
+        except json.JSONDecodeError:
+            raise _HTTPError(400, "Body must be JSON") from None
+        topic = request.get("topic") if isinstance(request, dict) else None
+        if not isinstance(topic, str) or not topic.strip():
+            raise _HTTPError(400, "'topic' is required")
+        max_rounds = request.get("max_rounds", 5)
+        if isinstance(max_rounds, bool) or not isinstance(max_rounds, int) or not 1 <= max_rounds <= 50:
+            raise _HTTPError(400, "'max_rounds' must be an integer between 1 and 50")
+        scheduler = request.get("scheduler")
+        if scheduler is not None:
+            try:
+                get_scheduler(scheduler if isinstance(scheduler, str) else "")
+            except ValueError:
+                raise _HTTPError(
+                    400,
+                    f"'scheduler' must be one of {', '.join(SCHEDULERS)} "
+                    "(weights as \"weighted:GPT=3,Claude=2\")",
+                ) from None
+
+        try:
+            job = self.service.submit(topic, max_rounds=max_rounds, scheduler=scheduler)
+        except QueueFullError as e:
+            raise _HTTPError(429, str(e), {"Retry-After": "5"}) from None
+        await self._send_json(
+            writer,
+            202,
+            {"id": job.id, "status": job.status, "position": self.service.stats()["queued"]},
+            {"Location": f"/debates/{job.id}"},
+        )
+
+    async def _stream(self, job: DebateJob, writer: asyncio.StreamWriter) -> None:
+        writer.write(
+            b"HTTP/1.1 200 OK\r\n"
+            b"Content-Type: text/event-stream; charset=utf-8\r\n"
+            b"Cache-Control: no-cache\r\n"
+            b"Connection: close\r\n\r\n"
+        )
+        async for item in job.subscribe(timeout=_KEEPALIVE_SECONDS):
+            if item is None:
+                writer.write(b": keep-alive\n\n")
+            else:
+                event, data = item
+                writer.write(f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n".encode())
+            # Slow clients hold up only their own stream, never the debate
+            await writer.drain()
+
+    async def _send_stored_transcript(self, debate_id: str, writer: asyncio.StreamWriter) -> None:
+        store = self.service.transcript_store
+        header = store.header(debate_id) if store is not None else None
+        if header is None:
+            raise _HTTPError(404, f"Unknown debate: {debate_id}")
+        topic, final_result = header
+        await self._send_markdown(writer, iter_markdown(topic, store.entries(debate_id), final_result))
+
+    async def _send_markdown(self, writer: asyncio.StreamWriter, blocks: Iterable[str]) -> None:
+        writer.write(
+            b"HTTP/1.1 200 OK\r\n"
+            b"Content-Type: text/markdown; charset=utf-8\r\n"
+            b"Connection: close\r\n\r\n"
+        )
+        for block in blocks:
+            writer.write(block.encode())
+            await writer.drain()
+
+    async def _send_json(
+        self,
+        writer: asyncio.StreamWriter,
+        status: int,
+        payload: Any,
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        body = json.dumps(payload, ensure_ascii=False).encode()
+        head = [
+            f"HTTP/1.1 {status} {_REASONS.get(status, '')}",
+            "Content-Type: application/json; charset=utf-8",
+            f"Content-Length: {len(body)}",
+            "Connection: close",
+            *(f"{name}: {value}" for name, value in (headers or {}).items()),
+        ]
+        writer.write(("\r\n".join(head) + "\r\n\r\n").encode() + body)
+        await writer.drain()
+
+
+def main() -> None:
+    """Entry point: ``python -m llm_fight_club.server``."""
+    parser = argparse.ArgumentParser(description="Serve LLM Fight Club debates over HTTP")
+    parser.add_argument("--host", type=str, default="127.0.0.1", help="Interface to bind (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8000, help="Port to bind (default: 8000)")
+    parser.add_argument("--concurrency", "-c", type=int, default=4, help="Debates running at once (default: 4)")
+    parser.add_argument("--queue", type=int, default=32, help="Debates waiting before 429s (default: 32)")
+    parser.add_argument("--cache", type=str, default=None, metavar="PATH", help="Cache LLM responses in a SQLite file")
+    parser.add_argument(
+        "--transcripts", type=str, default=None, metavar="PATH", help="Append debate transcripts to a SQLite file"
+    )
+    args = parser.parse_args()
+
+    missing = config.validate()
+    if missing:
+        print(f"Error: Missing API keys: {', '.join(missing)}")
+        raise SystemExit(1)
+
+    service = DebateService(
+        max_concurrent=args.concurrency,
+        max_queue=args.queue,
+        cache=SQLiteResponseCache(args.cache) if args.cache else None,
+        transcript_store=SQLiteTranscriptStore(args.transcripts) if args.transcripts else None,
+    )
+    server = DebateServer(service, host=args.host, port=args.port)
+    print(f"Serving debates on http://{args.host}:{args.port} (concurrency {args.concurrency}, queue {args.queue})")
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,292 @@
+"""Span tracing of debates, exportable as a timeline.
+
+Metrics say how long calls took on average; a trace shows where the time
+of one debate went. Spans are recorded around the whole debate, the time
+the workflow took to produce each event (orchestrator planning, a
+participant's turn), every LLM call and every user callback, and can be
+written as Chrome trace JSON (chrome://tracing, https://ui.perfetto.dev) or
+sent to an OpenTelemetry collector as OTLP/HTTP JSON.
+
+Tracing is off by default; enable ``default_tracer`` (``--trace`` on the
+command line) or pass an enabled ``Tracer`` to the workflow and clients.
+"""
+
+import hashlib
+import json
+import random
+import re
+import time
+import urllib.request
+from collections import deque
+from collections.abc import Callable, Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext, suppress
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from llm_fight_club.metrics import current_debate
+
+# Monotonic clock shifted to Unix time, so spans order correctly and still
+# carry wall-clock timestamps for OTLP
+_EPOCH_OFFSET_NS = time.time_ns() - time.perf_counter_ns()
+
+_HEX_TRACE_ID = re.compile(r"[0-9a-f]{32}")
+
+
+def _now_ns() -> int:
+    return _EPOCH_OFFSET_NS + time.perf_counter_ns()
+
+
+@dataclass
+class Span:
+    """A timed operation within a debate."""
+
+    name: str
+    category: str  # "workflow", "llm" or "callback"
+    track: str  # Timeline row, e.g. the agent making an LLM call
+    start_ns: int
+    end_ns: int | None = None
+    span_id: str = field(default_factory=lambda: f"{random.getrandbits(64):016x}")
+    parent_id: str | None = None
+    debate_id: str | None = None
+    attributes: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def duration(self) -> float:
+        """Length of the span in seconds (0 while it is open)."""
+        return (self.end_ns - self.start_ns) / 1e9 if self.end_ns is not None else 0.0
+
+
+_current_span: ContextVar[Span | None] = ContextVar("current_span", default=None)
+
+SpanHook = Callable[[Span], None]
+
+
+class Tracer:
+    """Records finished spans and forwards them to registered hooks."""
+
+    def __init__(self, enabled: bool = True, max_spans: int = 100_000):
+        """Initialize the tracer.
+
+        Args:
+            enabled: Record spans; a disabled tracer costs almost nothing
+            max_spans: Number of most recent spans kept for export
+        """
+        self.enabled = enabled
+        self.spans: deque[Span] = deque(maxlen=max_spans)
+        self._hooks: list[SpanHook] = []
+        self._trace_id = f"{random.getrandbits(128):032x}"  # For spans outside any debate
+
+    def add_hook(self, hook: SpanHook) -> None:
+        """Call ``hook`` for every finished span."""
+        self._hooks.append(hook)
+
+    def remove_hook(self, hook: SpanHook) -> None:
+        """Stop calling ``hook``."""
+        self._hooks.remove(hook)
+
+    @contextmanager
+    def hooked(self, hook: SpanHook) -> Iterator[None]:
+        """Call ``hook`` for every span finished inside the block."""
+        self.add_hook(hook)
+        try:
+            yield
+        finally:
+            self.remove_hook(hook)
+
+    def start(self, name: str, category: str, track: str | None = None, **attributes: Any) -> Span | None:
+        """Open a span without making it the parent of later spans.
+
+        Suits operations that outlive a ``with`` block, such as a streamed
+        LLM call; close it with ``finish``.
+
+        Args:
+            name: What is being timed
+            category: Kind of operation ("workflow", "llm", "callback")
+            track: Timeline row (defaults to the parent's)
+            **attributes: Details shown with the span
+
+        Returns:
+            The open span, or None when tracing is disabled.
+        """
+        if not self.enabled:
+            return None
+        parent = _current_span.get()
+        debate = current_debate()
+        if debate is not None:
+            attributes.setdefault("round", debate.round)
+        return Span(
+            name=name,
+            category=category,
+            track=track or (parent.track if parent is not None else "main"),
+            start_ns=_now_ns(),
+            parent_id=parent.span_id if parent is not None else None,
+            debate_id=debate.debate_id if debate is not None else None,
+            attributes=attributes,
+        )
+
+    def finish(self, span: Span, **attributes: Any) -> None:
+        """Close a span opened with ``start`` and record it (None attributes are skipped)."""
+        span.end_ns = _now_ns()
+        span.attributes.update((key, value) for key, value in attributes.items() if value is not None)
+        self.record(span)
+
+    def record(self, span: Span) -> None:
+        """Store a finished span and notify hooks."""
+        self.spans.append(span)
+        for hook in self._hooks:
+            hook(span)
+
+    def span(
+        self, name: str, category: str, track: str | None = None, **attributes: Any
+    ) -> AbstractContextManager[Span | None]:
+        """Time the block as a span that parents spans opened inside it.
+
+        The span records the type of an exception escaping the block as
+        its ``error`` attribute.
+        """
+        if not self.enabled:
+            return nullcontext()
+        return self._scope(name, category, track, attributes)
+
+    @contextmanager
+    def _scope(
+        self, name: str, category: str, track: str | None, attributes: dict[str, Any]
+    ) -> Iterator[Span | None]:
+        span = self.start(name, category, track, **attributes)
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.attributes["error"] = type(e).__name__
+            raise
+        finally:
+            # An abandoned async generator may be finalized from another context
+            with suppress(ValueError):
+                _current_span.reset(token)
+            self.finish(span)
+
+    def clear(self) -> None:
+        """Forget all recorded spans."""
+        self.spans.clear()
+
+    def to_chrome_trace(self) -> dict[str, Any]:
+        """Render recorded spans in the Chrome trace event format.
+
+        Each debate is shown as a process and each track as a thread, so a
+        batch of debates can be compared side by side.
+        """
+        spans = sorted(self.spans, key=lambda span: span.start_ns)
+        origin = spans[0].start_ns if spans else 0
+        pids: dict[str | None, int] = {}
+        tids: dict[tuple[int, str], int] = {}
+        events: list[dict[str, Any]] = []
+        for span in spans:
+            pid = pids.setdefault(span.debate_id, len(pids) + 1)
+            tid = tids.setdefault((pid, span.track), len(tids) + 1)
+            events.append({
+                "name": span.name,
+                "cat": span.category,
+                "ph": "X",
+                "ts": (span.start_ns - origin) / 1000,
+                "dur": ((span.end_ns or span.start_ns) - span.start_ns) / 1000,
+                "pid": pid,
+                "tid": tid,
+                "args": span.attributes,
+            })
+        metadata = [
+            {
+                "name": "process_name",
+                "ph": "M",
+                "pid": pid,
+                "args": {"name": f"debate {debate_id}" if debate_id else "outside debates"},
+            }
+            for debate_id, pid in pids.items()
+        ] + [
+            {"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": track}}
+            for (pid, track), tid in tids.items()
+        ]
+        return {"traceEvents": metadata + events, "displayTimeUnit": "ms"}
+
+    def write_chrome_trace(self, path: str | Path) -> None:
+        """Write recorded spans to a Chrome trace JSON file."""
+        Path(path).write_text(json.dumps(self.to_chrome_trace(), ensure_ascii=False), encoding="utf-8")
+
+    def to_otlp(self, service_name: str = "llm-fight-club") -> dict[str, Any]:
+        """Render recorded spans as an OTLP/JSON ``ExportTraceServiceRequest``.
+
+        Spans of a debate share a trace ID derived from its ``debate_id``.
+        """
+        spans = []
+        for span in self.spans:
+            attributes = {"category": span.category, "track": span.track, **span.attributes}
+            otlp_span: dict[str, Any] = {
+                "traceId": self._otlp_trace_id(span.debate_id),
+                "spanId": span.span_id,
+                "name": span.name,
+                "kind": 1,  # SPAN_KIND_INTERNAL
+                "startTimeUnixNano": str(span.start_ns),
+                "endTimeUnixNano": str(span.end_ns or span.start_ns),
+                "attributes": _otlp_attributes(attributes),
+            }
+            if span.parent_id is not None:
+                otlp_span["parentSpanId"] = span.parent_id
+            if "error" in span.attributes:
+                otlp_span["status"] = {"code": 2, "message": str(span.attributes["error"])}
+            spans.append(otlp_span)
+        return {
+            "resourceSpans": [{
+                "resource": {"attributes": _otlp_attributes({"service.name": service_name})},
+                "scopeSpans": [{"scope": {"name": "llm_fight_club"}, "spans": spans}],
+            }]
+        }
+
+    def _otlp_trace_id(self, debate_id: str | None) -> str:
+        if debate_id is None:
+            return self._trace_id
+        if _HEX_TRACE_ID.fullmatch(debate_id):
+            return debate_id
+        return hashlib.md5(debate_id.encode("utf-8")).hexdigest()
+
+    def export_otlp(self, endpoint: str, timeout: float = 10.0, service_name: str = "llm-fight-club") -> None:
+        """Send recorded spans to an OTLP/HTTP collector.
+
+        Args:
+            endpoint: Traces URL, e.g. ``http://localhost:4318/v1/traces``
+            timeout: Seconds to wait for the collector
+            service_name: ``service.name`` of the exported resource
+
+        Raises:
+            urllib.error.URLError: If the collector cannot be reached or
+                rejects the spans
+        """
+        request = urllib.request.Request(
+            endpoint,
+            data=json.dumps(self.to_otlp(service_name)).encode("utf-8"),
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        with urllib.request.urlopen(request, timeout=timeout):
+            pass
+
+
+def _otlp_value(value: Any) -> dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def _otlp_attributes(attributes: dict[str, Any]) -> list[dict[str, Any]]:
+    return [
+        {"key": key, "value": _otlp_value(value)}
+        for key, value in attributes.items()
+        if value is not None
+    ]
+
+
+default_tracer = Tracer(enabled=False)
@@ -1,13 +1,109 @@
 """LLM Fight Club workflows."""
 
-from llm_fight_club.workflows.group_chat import (
-    FightClubGroupChat,
-    create_fight_club_workflow,
-    run_fight_club,
-)
-
-__all__ = [
-    "FightClubGroupChat",
-    "create_fight_club_workflow",
-    "run_fight_club",
-]
+from typing import TYPE_CHECKING
+
+from llm_fight_club._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llm_fight_club.workflows.batch import (
+        BatchResult,
+        BatchTopic,
+        load_topics,
+        run_batch,
+    )
+    from llm_fight_club.workflows.budget import (
+        Budget,
+        BudgetedMagenticManager,
+        BudgetTracker,
+        BudgetUsage,
+    )
+    from llm_fight_club.workflows.checkpoint import (
+        DebateRecord,
+        SQLiteCheckpointStorage,
+    )
+    from llm_fight_club.workflows.group_chat import (
+        FightClubGroupChat,
+        StreamUpdate,
+        create_fight_club_workflow,
+        run_fight_club,
+    )
+    from llm_fight_club.workflows.result_cache import (
+        CachedDebate,
+        DebateResultCache,
+        ResultCacheStats,
+        normalize_topic,
+        open_result_cache,
+    )
+    from llm_fight_club.workflows.scheduler import (
+        MentionScheduler,
+        RoundRobinScheduler,
+        ScheduledMagenticManager,
+        SpeakerScheduler,
+        WeightedScheduler,
+        get_scheduler,
+    )
+    from llm_fight_club.workflows.semantic_cache import (
+        BruteForceIndex,
+        HashingEmbedder,
+        LSHIndex,
+        SemanticResultCache,
+    )
+    from llm_fight_club.workflows.speculation import (
+        SpeculationStats,
+        SpeculativeMagenticManager,
+        Speculator,
+    )
+    from llm_fight_club.workflows.transcript import (
+        SQLiteTranscriptStore,
+        Transcript,
+        TranscriptEntry,
+        export_markdown,
+        iter_markdown,
+    )
+    from llm_fight_club.workflows.worker_pool import run_batch_workers
+
+# Public name -> submodule; submodules are imported on first use
+_EXPORTS = {
+    "FightClubGroupChat": "group_chat",
+    "StreamUpdate": "group_chat",
+    "create_fight_club_workflow": "group_chat",
+    "run_fight_club": "group_chat",
+    "BatchTopic": "batch",
+    "BatchResult": "batch",
+    "load_topics": "batch",
+    "run_batch": "batch",
+    "CachedDebate": "result_cache",
+    "DebateResultCache": "result_cache",
+    "ResultCacheStats": "result_cache",
+    "normalize_topic": "result_cache",
+    "open_result_cache": "result_cache",
+    "SemanticResultCache": "semantic_cache",
+    "HashingEmbedder": "semantic_cache",
+    "BruteForceIndex": "semantic_cache",
+    "LSHIndex": "semantic_cache",
+    "SpeakerScheduler": "scheduler",
+    "RoundRobinScheduler": "scheduler",
+    "WeightedScheduler": "scheduler",
+    "MentionScheduler": "scheduler",
+    "ScheduledMagenticManager": "scheduler",
+    "get_scheduler": "scheduler",
+    "DebateRecord": "checkpoint",
+    "SQLiteCheckpointStorage": "checkpoint",
+    "Budget": "budget",
+    "BudgetTracker": "budget",
+    "BudgetUsage": "budget",
+    "BudgetedMagenticManager": "budget",
+    "SpeculationStats": "speculation",
+    "SpeculativeMagenticManager": "speculation",
+    "Speculator": "speculation",
+    "SQLiteTranscriptStore": "transcript",
+    "Transcript": "transcript",
+    "TranscriptEntry": "transcript",
+    "export_markdown": "transcript",
+    "iter_markdown": "transcript",
+    "run_batch_workers": "worker_pool",
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
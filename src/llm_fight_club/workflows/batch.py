@@ -0,0 +1,170 @@
+"""Concurrent batch runner for many Fight Club discussions."""
+
+import asyncio
+import json
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, TextIO
+
+from llm_fight_club.agents import AgentRegistry
+from llm_fight_club.clients import ResponseCache
+from llm_fight_club.workflows.budget import Budget
+from llm_fight_club.workflows.group_chat import FightClubGroupChat
+from llm_fight_club.workflows.result_cache import DebateResultCache
+from llm_fight_club.workflows.scheduler import SpeakerScheduler
+
+
+@dataclass
+class BatchTopic:
+    """A single topic to debate in a batch."""
+
+    id: str
+    topic: str
+    max_rounds: int | None = None
+
+
+@dataclass
+class BatchResult:
+    """Outcome of one debate in a batch."""
+
+    id: str
+    topic: str
+    result: str = ""
+    history: list[dict[str, Any]] = field(default_factory=list)
+    error: str | None = None
+    elapsed_seconds: float = 0.0
+
+
+def load_topics(path: str | Path) -> list[BatchTopic]:
+    """Load topics from a JSONL file.
+
+    Each line is either a JSON string or an object with a ``topic`` key and
+    optional ``id`` and ``max_rounds``. Blank lines are skipped.
+
+    Args:
+        path: JSONL file to read
+
+    Returns:
+        Topics in file order.
+    """
+    topics: list[BatchTopic] = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line_no, line in enumerate(f, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            entry = json.loads(line)
+            if isinstance(entry, str):
+                entry = {"topic": entry}
+            if "topic" not in entry:
+                raise ValueError(f"Line {line_no}: missing 'topic' in {path}")
+            topics.append(BatchTopic(
+                id=str(entry.get("id", line_no)),
+                topic=entry["topic"],
+                max_rounds=entry.get("max_rounds"),
+            ))
+    return topics
+
+
+def as_batch(topics: Iterable[BatchTopic | str]) -> list[BatchTopic]:
+    """Number plain topic strings; pass BatchTopics through."""
+    return [
+        t if isinstance(t, BatchTopic) else BatchTopic(id=str(i), topic=t)
+        for i, t in enumerate(topics, start=1)
+    ]
+
+
+async def run_debate(item: BatchTopic, max_rounds: int, **chat_options: Any) -> BatchResult:
+    """Run one batch debate, capturing a failure as the result's error.
+
+    Args:
+        item: Topic to debate
+        max_rounds: Maximum rounds unless the topic sets its own
+        **chat_options: Further FightClubGroupChat arguments
+
+    Returns:
+        The finished debate.
+    """
+    chat = FightClubGroupChat(max_rounds=item.max_rounds or max_rounds, **chat_options)
+    result = BatchResult(id=item.id, topic=item.topic)
+    start = time.perf_counter()
+    try:
+        result.result = await chat.run(item.topic)
+    except Exception as e:
+        result.error = str(e)
+    result.elapsed_seconds = time.perf_counter() - start
+    result.history = chat.conversation_history
+    return result
+
+
+def write_result(out: TextIO, result: BatchResult) -> None:
+    """Append a result to a JSONL output file."""
+    out.write(json.dumps(asdict(result), ensure_ascii=False) + "\n")
+    out.flush()
+
+
+async def run_batch(
+    topics: Iterable[BatchTopic | str],
+    output_path: str | Path,
+    *,
+    max_concurrency: int = 4,
+    max_rounds: int = 10,
+    cache: ResponseCache | None = None,
+    registry: AgentRegistry | None = None,
+    on_result: Callable[[BatchResult], None] | None = None,
+    scheduler: SpeakerScheduler | str | None = None,
+    budget: Budget | None = None,
+    result_cache: DebateResultCache | None = None,
+    refresh: bool = False,
+) -> list[BatchResult]:
+    """Run many discussions concurrently and write results as they finish.
+
+    Every finished debate is appended to ``output_path`` as one JSON line,
+    so partial results survive if the batch is interrupted. Failed debates
+    are recorded with their error instead of aborting the batch.
+
+    Args:
+        topics: Topics (or plain topic strings) to debate
+        output_path: JSONL file receiving one result per line
+        max_concurrency: Maximum number of debates running at once
+        max_rounds: Default maximum rounds per debate
+        cache: Optional response cache shared by all debates
+        registry: Source of reusable agents and clients
+        on_result: Callback invoked as each debate finishes
+        scheduler: Rule-based speaker scheduler (None = orchestrator LLM)
+        budget: Token, cost and time limits applied to each debate
+        result_cache: Reuse finished debates with the same topic and settings
+        refresh: Hold every debate even when ``result_cache`` has it
+
+    Returns:
+        Results in completion order.
+    """
+    batch = as_batch(topics)
+    semaphore = asyncio.Semaphore(max_concurrency)
+    results: list[BatchResult] = []
+
+    with open(output_path, "w", encoding="utf-8") as out:
+
+        async def run_one(item: BatchTopic) -> None:
+            async with semaphore:
+                result = await run_debate(
+                    item,
+                    max_rounds,
+                    cache=cache,
+                    registry=registry,
+                    scheduler=scheduler,
+                    budget=budget,
+                    result_cache=result_cache,
+                    refresh=refresh,
+                )
+
+            write_result(out, result)
+            results.append(result)
+            if on_result:
+                on_result(result)
+
+        await asyncio.gather(*(run_one(item) for item in batch))
+
+    return results
@@ -0,0 +1,187 @@
+"""Per-debate token, cost and time budgets.
+
+A ``BudgetTracker`` adds up the usage that LiteLLM reports for every call
+of one debate. Once a share of any limit is used (``downgrade_at``), the
+debate's calls are moved to cheaper models; once a limit is reached, the
+``BudgetedMagenticManager`` ends the discussion, either by asking for the
+final synthesis straight away or by stopping without one.
+"""
+
+import time
+from dataclasses import dataclass, field
+from typing import Any, Literal
+
+from agent_framework import ChatMessage, MagenticContext, MagenticManagerBase
+from agent_framework._workflows._magentic import MAGENTIC_MANAGER_NAME, _MagenticProgressLedger
+
+from llm_fight_club.metrics import CallMetrics, DebateContext, MetricsCollector, default_metrics
+from llm_fight_club.workflows.scheduler import _item
+
+
+# Cheaper model of the same provider, so the configured API key still applies
+DEFAULT_DOWNGRADES = {
+    "openai/gpt-4o": "openai/gpt-4o-mini",
+    "anthropic/claude-3-5-sonnet-20241022": "anthropic/claude-3-5-haiku-20241022",
+    "gemini/gemini-1.5-pro": "gemini/gemini-2.0-flash",
+}
+
+BUDGET_ACTIONS = ("synthesize", "stop")
+
+STOPPED_MESSAGE = "予算の上限に達したため、議論を打ち切りました。"
+
+
+@dataclass
+class Budget:
+    """Limits for a single debate (None = unlimited)."""
+
+    max_tokens: int | None = None
+    max_cost: float | None = None  # USD
+    max_seconds: float | None = None  # Wall-clock time since the debate started
+    on_exceeded: Literal["synthesize", "stop"] = "synthesize"
+    downgrade_at: float | None = 0.8  # Share of a limit after which models are downgraded
+    downgrades: dict[str, str] = field(default_factory=lambda: dict(DEFAULT_DOWNGRADES))
+
+    def __post_init__(self) -> None:
+        if self.on_exceeded not in BUDGET_ACTIONS:
+            raise ValueError(
+                f"Unknown budget action: {self.on_exceeded!r} (choose from {', '.join(BUDGET_ACTIONS)})"
+            )
+
+    @property
+    def limited(self) -> bool:
+        """Whether any limit is set."""
+        return any(limit is not None for limit in (self.max_tokens, self.max_cost, self.max_seconds))
+
+
+@dataclass
+class BudgetUsage:
+    """What one debate has spent so far."""
+
+    calls: int = 0
+    tokens: int = 0
+    cost: float = 0.0
+    latency: float = 0.0  # Summed call latency
+    seconds: float = 0.0  # Wall-clock time since the debate started
+    downgraded: bool = False
+    exceeded: str | None = None  # Name of the first limit that was reached
+
+
+class BudgetTracker:
+    """Accumulates a debate's usage from metrics and enforces its budget."""
+
+    def __init__(
+        self,
+        budget: Budget,
+        debate: DebateContext,
+        metrics: MetricsCollector | None = None,
+    ):
+        """Initialize the tracker.
+
+        Args:
+            budget: Limits to enforce
+            debate: Debate whose calls are counted; its ``models`` map
+                receives the downgrades
+            metrics: Collector the LLM clients record to (defaults to the
+                process-wide one)
+        """
+        self.budget = budget
+        self.debate = debate
+        self.metrics = metrics or default_metrics
+        self.usage = BudgetUsage()
+        self._start = time.monotonic()
+
+    def __enter__(self) -> "BudgetTracker":
+        self.metrics.add_hook(self.add)
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.metrics.remove_hook(self.add)
+
+    def add(self, call: CallMetrics) -> None:
+        """Count a finished call if it belongs to the tracked debate."""
+        if call.debate_id != self.debate.debate_id:
+            return
+        self.usage.calls += 1
+        self.usage.tokens += call.prompt_tokens + call.completion_tokens
+        self.usage.cost += call.cost
+        self.usage.latency += call.latency
+        self.check()
+
+    def check(self) -> bool:
+        """Update the usage state and apply downgrades.
+
+        Returns:
+            True once any limit has been reached
+        """
+        self.usage.seconds = time.monotonic() - self._start
+        budget = self.budget
+        shares = {
+            "max_tokens": _share(self.usage.tokens, budget.max_tokens),
+            "max_cost": _share(self.usage.cost, budget.max_cost),
+            "max_seconds": _share(self.usage.seconds, budget.max_seconds),
+        }
+        if self.usage.exceeded is None:
+            self.usage.exceeded = next((name for name, share in shares.items() if share >= 1), None)
+        if (
+            not self.usage.downgraded
+            and budget.downgrade_at is not None
+            and max(shares.values()) >= budget.downgrade_at
+        ):
+            self.debate.models.update(budget.downgrades)
+            self.usage.downgraded = True
+        return self.usage.exceeded is not None
+
+
+def _share(value: float, limit: float | None) -> float:
+    if limit is None:
+        return 0.0
+    return value / limit if limit > 0 else float("inf")
+
+
+class BudgetedMagenticManager(MagenticManagerBase):
+    """Wraps a manager so the discussion ends when the budget is spent."""
+
+    def __init__(self, manager: MagenticManagerBase, tracker: BudgetTracker):
+        """Initialize the wrapper.
+
+        Args:
+            manager: Manager whose decisions are followed within the budget
+            tracker: Usage of the running debate
+        """
+        super().__init__(
+            max_stall_count=manager.max_stall_count,
+            max_reset_count=manager.max_reset_count,
+            max_round_count=manager.max_round_count,
+        )
+        self.task_ledger_full_prompt = manager.task_ledger_full_prompt
+        self.manager = manager
+        self.tracker = tracker
+
+    async def plan(self, magentic_context: MagenticContext) -> ChatMessage:
+        return await self.manager.plan(magentic_context)
+
+    async def replan(self, magentic_context: MagenticContext) -> ChatMessage:
+        return await self.manager.replan(magentic_context)
+
+    async def create_progress_ledger(self, magentic_context: MagenticContext) -> _MagenticProgressLedger:
+        if self.tracker.check():
+            reason = f"budget {self.tracker.usage.exceeded} reached"
+            return _MagenticProgressLedger(
+                is_request_satisfied=_item(True, reason),
+                is_in_loop=_item(False, reason),
+                is_progress_being_made=_item(True, reason),
+                next_speaker=_item("", reason),
+                instruction_or_question=_item("", reason),
+            )
+        return await self.manager.create_progress_ledger(magentic_context)
+
+    async def prepare_final_answer(self, magentic_context: MagenticContext) -> ChatMessage:
+        if self.tracker.check() and self.tracker.budget.on_exceeded == "stop":
+            return ChatMessage(role="assistant", text=STOPPED_MESSAGE, author_name=MAGENTIC_MANAGER_NAME)
+        return await self.manager.prepare_final_answer(magentic_context)
+
+    def on_checkpoint_save(self) -> dict[str, Any]:
+        return self.manager.on_checkpoint_save()
+
+    def on_checkpoint_restore(self, state: dict[str, Any]) -> None:
+        self.manager.on_checkpoint_restore(state)
@@ -0,0 +1,289 @@
+"""Durable checkpoint storage for resumable debates.
+
+MAF writes a full checkpoint after every superstep, and each one repeats
+the whole chat history, so storage grows quadratically with debate length.
+``SQLiteCheckpointStorage`` keeps a full snapshot only every
+``keyframe_interval`` checkpoints and stores the rest as deltas against the
+previous checkpoint of the same workflow, all zlib-compressed.
+"""
+
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+from agent_framework import WorkflowCheckpoint
+
+# Delta nodes: {"v": value} replaces, {"a": items} appends to a list,
+# {"d": {key: node}, "r": [keys]} patches a dict.
+_VALUE, _APPEND, _DICT, _REMOVED = "v", "a", "d", "r"
+
+
+def diff(old: Any, new: Any) -> dict[str, Any] | None:
+    """Describe how to turn ``old`` into ``new`` (None if they are equal).
+
+    Args:
+        old: Previous JSON-compatible value
+        new: Current JSON-compatible value
+
+    Returns:
+        A delta node for ``patch``, or None when nothing changed
+    """
+    if old == new:
+        return None
+    if isinstance(old, dict) and isinstance(new, dict):
+        changes = {}
+        for key, value in new.items():
+            if key not in old:
+                changes[key] = {_VALUE: value}
+            else:
+                node = diff(old[key], value)
+                if node is not None:
+                    changes[key] = node
+        delta: dict[str, Any] = {_DICT: changes}
+        removed = [key for key in old if key not in new]
+        if removed:
+            delta[_REMOVED] = removed
+        return delta
+    if isinstance(old, list) and isinstance(new, list) and new[: len(old)] == old:
+        return {_APPEND: new[len(old):]}
+    return {_VALUE: new}
+
+
+def patch(old: Any, delta: dict[str, Any] | None) -> Any:
+    """Apply a delta produced by ``diff``.
+
+    Args:
+        old: Value the delta was computed against
+        delta: Delta node (None = unchanged)
+
+    Returns:
+        The new value; ``old`` is not modified
+    """
+    if delta is None:
+        return old
+    if _VALUE in delta:
+        return delta[_VALUE]
+    if _APPEND in delta:
+        return [*old, *delta[_APPEND]]
+    result = {key: value for key, value in old.items() if key not in delta.get(_REMOVED, ())}
+    for key, node in delta[_DICT].items():
+        result[key] = patch(old.get(key), node)
+    return result
+
+
+def _encode(value: Any) -> bytes:
+    return zlib.compress(json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode())
+
+
+def _decode(payload: bytes) -> Any:
+    return json.loads(zlib.decompress(payload))
+
+
+@dataclass
+class DebateRecord:
+    """What is needed to rebuild and resume a debate."""
+
+    debate_id: str
+    workflow_id: str
+    topic: str
+    max_rounds: int
+    scheduler: str | None = None
+    status: str = "running"  # "running" or "finished"
+    final_result: str = ""
+    created_at: float = field(default_factory=time.time)
+    updated_at: float = field(default_factory=time.time)
+
+
+class SQLiteCheckpointStorage:
+    """Checkpoint storage in a SQLite file with compressed, delta-encoded snapshots.
+
+    Implements MAF's ``CheckpointStorage`` protocol, so it can be passed to
+    ``with_checkpointing``, and also keeps one ``DebateRecord`` per debate.
+    """
+
+    def __init__(self, path: str | Path, keyframe_interval: int = 8):
+        """Initialize the storage.
+
+        Args:
+            path: Database file (created if missing)
+            keyframe_interval: Store a full snapshot every N checkpoints of a
+                workflow (1 = no deltas); loading replays at most N-1 deltas
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.keyframe_interval = max(1, keyframe_interval)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.executescript(
+            "CREATE TABLE IF NOT EXISTS checkpoints ("
+            "checkpoint_id TEXT PRIMARY KEY, workflow_id TEXT NOT NULL, seq INTEGER NOT NULL, "
+            "keyframe INTEGER NOT NULL, payload BLOB NOT NULL, created_at REAL NOT NULL);"
+            "CREATE INDEX IF NOT EXISTS checkpoints_workflow ON checkpoints (workflow_id, seq);"
+            "CREATE TABLE IF NOT EXISTS debates ("
+            "debate_id TEXT PRIMARY KEY, workflow_id TEXT NOT NULL, topic TEXT NOT NULL, "
+            "max_rounds INTEGER NOT NULL, scheduler TEXT, status TEXT NOT NULL, "
+            "final_result TEXT NOT NULL, created_at REAL NOT NULL, updated_at REAL NOT NULL);"
+        )
+        self._conn.commit()
+        # Last checkpoint written per workflow, so saving never re-reads it
+        self._latest: dict[str, tuple[int, dict[str, Any]]] = {}
+
+    def _materialize(self, workflow_id: str, seq: int) -> dict[str, Any]:
+        """Rebuild a checkpoint dict from its keyframe and the deltas after it."""
+        rows = self._conn.execute(
+            "SELECT keyframe, payload FROM checkpoints WHERE workflow_id = ? AND seq <= ? "
+            "AND seq >= (SELECT MAX(seq) FROM checkpoints "
+            "WHERE workflow_id = ? AND seq <= ? AND keyframe = 1) ORDER BY seq",
+            (workflow_id, seq, workflow_id, seq),
+        ).fetchall()
+        state: dict[str, Any] = {}
+        for keyframe, payload in rows:
+            state = _decode(payload) if keyframe else patch(state, _decode(payload))
+        return state
+
+    def _latest_state(self, workflow_id: str) -> tuple[int, dict[str, Any]] | None:
+        if workflow_id not in self._latest:
+            row = self._conn.execute(
+                "SELECT MAX(seq) FROM checkpoints WHERE workflow_id = ?", (workflow_id,)
+            ).fetchone()
+            if row[0] is None:
+                return None
+            self._latest[workflow_id] = (row[0], self._materialize(workflow_id, row[0]))
+        return self._latest[workflow_id]
+
+    def _save(self, checkpoint: WorkflowCheckpoint) -> None:
+        state = asdict(checkpoint)
+        with self._lock:
+            previous = self._latest_state(checkpoint.workflow_id)
+            seq = 0 if previous is None else previous[0] + 1
+            keyframe = previous is None or seq % self.keyframe_interval == 0
+            payload = _encode(state if keyframe else diff(previous[1], state))
+            self._conn.execute(
+                "INSERT OR REPLACE INTO checkpoints "
+                "(checkpoint_id, workflow_id, seq, keyframe, payload, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (checkpoint.checkpoint_id, checkpoint.workflow_id, seq, int(keyframe), payload, time.time()),
+            )
+            self._conn.commit()
+            # Round-trip through JSON so the next diff compares like with like
+            self._latest[checkpoint.workflow_id] = (seq, json.loads(json.dumps(state)))
+
+    def _load(self, checkpoint_id: str) -> WorkflowCheckpoint | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT workflow_id, seq FROM checkpoints WHERE checkpoint_id = ?", (checkpoint_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            return WorkflowCheckpoint(**self._materialize(*row))
+
+    def _ids(self, workflow_id: str | None) -> list[str]:
+        with self._lock:
+            if workflow_id is None:
+                rows = self._conn.execute(
+                    "SELECT checkpoint_id FROM checkpoints ORDER BY workflow_id, seq"
+                ).fetchall()
+            else:
+                rows = self._conn.execute(
+                    "SELECT checkpoint_id FROM checkpoints WHERE workflow_id = ? ORDER BY seq",
+                    (workflow_id,),
+                ).fetchall()
+        return [row[0] for row in rows]
+
+    def _delete(self, checkpoint_id: str) -> bool:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT workflow_id, seq FROM checkpoints WHERE checkpoint_id = ?", (checkpoint_id,)
+            ).fetchone()
+            if row is None:
+                return False
+            workflow_id, seq = row
+            # The next checkpoint may be a delta against this one: make it a keyframe
+            following = self._conn.execute(
+                "SELECT seq, keyframe FROM checkpoints WHERE workflow_id = ? AND seq > ? "
+                "ORDER BY seq LIMIT 1",
+                (workflow_id, seq),
+            ).fetchone()
+            if following is not None and not following[1]:
+                state = self._materialize(workflow_id, following[0])
+                self._conn.execute(
+                    "UPDATE checkpoints SET keyframe = 1, payload = ? WHERE workflow_id = ? AND seq = ?",
+                    (_encode(state), workflow_id, following[0]),
+                )
+            self._conn.execute("DELETE FROM checkpoints WHERE checkpoint_id = ?", (checkpoint_id,))
+            self._conn.commit()
+            self._latest.pop(workflow_id, None)
+        return True
+
+    async def save_checkpoint(self, checkpoint: WorkflowCheckpoint) -> str:
+        """Save a checkpoint and return its ID."""
+        await asyncio.to_thread(self._save, checkpoint)
+        return checkpoint.checkpoint_id
+
+    async def load_checkpoint(self, checkpoint_id: str) -> WorkflowCheckpoint | None:
+        """Load a checkpoint by ID."""
+        return await asyncio.to_thread(self._load, checkpoint_id)
+
+    async def list_checkpoint_ids(self, workflow_id: str | None = None) -> list[str]:
+        """List checkpoint IDs, oldest first. If workflow_id is provided, filter by that workflow."""
+        return await asyncio.to_thread(self._ids, workflow_id)
+
+    async def list_checkpoints(self, workflow_id: str | None = None) -> list[WorkflowCheckpoint]:
+        """List checkpoint objects, oldest first. If workflow_id is provided, filter by that workflow."""
+        checkpoints = []
+        for checkpoint_id in await self.list_checkpoint_ids(workflow_id):
+            checkpoint = await self.load_checkpoint(checkpoint_id)
+            if checkpoint is not None:
+                checkpoints.append(checkpoint)
+        return checkpoints
+
+    async def delete_checkpoint(self, checkpoint_id: str) -> bool:
+        """Delete a checkpoint by ID."""
+        return await asyncio.to_thread(self._delete, checkpoint_id)
+
+    async def latest_checkpoint(self, workflow_id: str) -> WorkflowCheckpoint | None:
+        """Return the most recent checkpoint of a workflow, if any."""
+        ids = await self.list_checkpoint_ids(workflow_id)
+        return await self.load_checkpoint(ids[-1]) if ids else None
+
+    def save_debate(self, record: DebateRecord) -> None:
+        """Create or update a debate record."""
+        record.updated_at = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO debates (debate_id, workflow_id, topic, max_rounds, "
+                "scheduler, status, final_result, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    record.debate_id,
+                    record.workflow_id,
+                    record.topic,
+                    record.max_rounds,
+                    record.scheduler,
+                    record.status,
+                    record.final_result,
+                    record.created_at,
+                    record.updated_at,
+                ),
+            )
+            self._conn.commit()
+
+    def load_debate(self, debate_id: str) -> DebateRecord | None:
+        """Return a debate record by ID."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT debate_id, workflow_id, topic, max_rounds, scheduler, status, "
+                "final_result, created_at, updated_at FROM debates WHERE debate_id = ?",
+                (debate_id,),
+            ).fetchone()
+        return DebateRecord(*row) if row else None
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self._conn.close()
@@ -1,36 +1,75 @@
 """MAF-based group chat workflow for LLM Fight Club."""
 
-from collections.abc import Callable
+import asyncio
+import time
+import uuid
+from collections.abc import AsyncIterator, Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
 from typing import Any
 
 from agent_framework import (
+    ChatAgent,
     ChatMessage,
+    CheckpointStorage,
     InMemoryCheckpointStorage,
     MagenticBuilder,
+    MagenticAgentDeltaEvent,
     MagenticAgentMessageEvent,
     MagenticOrchestratorMessageEvent,
     MagenticFinalResultEvent,
+    StandardMagenticManager,
+    WorkflowCheckpoint,
 )
+from agent_framework._workflows._magentic import MAGENTIC_MANAGER_NAME
 
-from llm_fight_club.agents import (
-    create_all_agents,
-    create_orchestrator_client,
-)
+from llm_fight_club.agents import AgentRegistry, agent_registry
+from llm_fight_club.clients import ResponseCache
+from llm_fight_club.metrics import DebateContext, debate_context, default_metrics
 from llm_fight_club.prompts import get_system_prompt
+from llm_fight_club.tracing import Tracer, default_tracer
+from llm_fight_club.workflows.budget import Budget, BudgetedMagenticManager, BudgetTracker, BudgetUsage
+from llm_fight_club.workflows.checkpoint import DebateRecord, SQLiteCheckpointStorage
+from llm_fight_club.workflows.result_cache import CachedDebate, DebateResultCache
+from llm_fight_club.workflows.scheduler import (
+    ScheduledMagenticManager,
+    SpeakerScheduler,
+    get_scheduler,
+    scheduler_name,
+)
+from llm_fight_club.workflows.speculation import (
+    SpeculationStats,
+    SpeculativeAgent,
+    SpeculativeMagenticManager,
+    Speculator,
+)
+from llm_fight_club.workflows.transcript import DEFAULT_WINDOW, SQLiteTranscriptStore, Transcript
 
+# Rounds without progress before the orchestrator LLM replans
+MAX_STALL_COUNT = 3
 
-def create_fight_club_workflow():
+
+def create_fight_club_workflow(
+    registry: AgentRegistry | None = None,
+    checkpoint_storage: CheckpointStorage | None = None,
+):
     """Create a Fight Club workflow for DevUI registration.
-    
+
+    Args:
+        registry: Source of agents and clients (defaults to the shared registry)
+        checkpoint_storage: Where checkpoints are kept (defaults to memory;
+            pass a SQLiteCheckpointStorage to survive restarts)
+
     Returns:
         A MagenticBuilder workflow that can be registered with DevUI.
     """
-    orchestrator_client = create_orchestrator_client()
-    agents = create_all_agents()
+    registry = registry or agent_registry
+    orchestrator_client = registry.get_orchestrator_client()
+    agents = registry.get_agents()
     participants = {agent.name: agent for agent in agents}
-    orchestrator_instructions = get_system_prompt("orchestrator")
+    orchestrator_instructions = get_system_prompt("orchestrator", participants=" → ".join(participants))
     
-    checkpoint_storage = InMemoryCheckpointStorage()
+    checkpoint_storage = checkpoint_storage or InMemoryCheckpointStorage()
     
     workflow = (
         MagenticBuilder()
@@ -38,7 +77,7 @@ def create_fight_club_workflow():
             chat_client=orchestrator_client,
             instructions=orchestrator_instructions,
             max_round_count=10,
-            max_stall_count=5,
+            max_stall_count=MAX_STALL_COUNT,
         )
         .participants(**participants)
         .with_checkpointing(checkpoint_storage)
@@ -48,6 +87,15 @@ def create_fight_club_workflow():
     return workflow
 
 
+@dataclass
+class StreamUpdate:
+    """A piece of text produced during a discussion."""
+
+    agent: str
+    delta: str
+    turn_id: int  # Index of the message in conversation_history
+
+
 class FightClubGroupChat:
     """Multi-LLM group chat orchestrated by MAF."""
 
@@ -55,16 +103,80 @@ class FightClubGroupChat:
         self,
         max_rounds: int = 10,
         on_message: Callable[[str, str], None] | None = None,
+        parallel_opening: bool = False,
+        cache: ResponseCache | None = None,
+        registry: AgentRegistry | None = None,
+        on_delta: Callable[[StreamUpdate], None] | None = None,
+        scheduler: SpeakerScheduler | str | None = None,
+        checkpoint_storage: SQLiteCheckpointStorage | None = None,
+        speculate: bool | SpeakerScheduler = False,
+        budget: Budget | None = None,
+        transcript_store: SQLiteTranscriptStore | None = None,
+        history_window: int = DEFAULT_WINDOW,
+        result_cache: DebateResultCache | None = None,
+        refresh: bool = False,
+        tracer: Tracer | None = None,
     ):
         """Initialize group chat.
 
         Args:
             max_rounds: Maximum discussion rounds
             on_message: Callback when an agent sends a message
+            parallel_opening: Collect every participant's opening statement
+                concurrently before the orchestrator takes over
+            cache: Optional response cache shared by all LLM clients
+            registry: Source of reusable agents and clients (defaults to
+                the process-wide registry)
+            on_delta: Callback for every streamed token of a participant turn
+            scheduler: Pick speakers locally ("round_robin", "mention" or a
+                SpeakerScheduler) instead of asking the orchestrator LLM every
+                round; the LLM then only writes the final answer
+            checkpoint_storage: Checkpoint every superstep so the debate can
+                be continued with ``resume(debate_id)`` after a crash
+            speculate: Start the likely next speaker's turn while the
+                orchestrator LLM is still choosing, trading tokens for
+                latency; pass a SpeakerScheduler to control the guess. Has
+                no effect with ``scheduler``, which decides instantly
+            budget: Token, cost and time limits per debate; past
+                ``budget.downgrade_at`` calls move to cheaper models, and at a
+                limit the discussion ends (see ``budget_usage``)
+            transcript_store: Append every message, with timestamps and
+                token counts, to this on-disk log as it is produced
+            history_window: Messages kept in memory per discussion; older
+                ones are only available from ``transcript_store``
+            result_cache: Replay a finished debate on the same topic with
+                the same prompts, models and settings instead of holding it
+                again (see ``cached_debate``)
+            refresh: Hold the debate even on a ``result_cache`` hit and
+                replace the stored one
+            tracer: Records spans for the debate, each workflow event and
+                each callback (defaults to the process-wide one)
         """
         self.max_rounds = max_rounds
         self.on_message = on_message
-        self._messages: list[dict[str, Any]] = []
+        self.parallel_opening = parallel_opening
+        self.cache = cache
+        self.registry = registry or agent_registry
+        self.on_delta = on_delta
+        self.scheduler = get_scheduler(scheduler) if isinstance(scheduler, str) else scheduler
+        self.checkpoint_storage = checkpoint_storage
+        self.speculate = speculate
+        self.speculation_stats: SpeculationStats | None = None
+        self._speculator: Speculator | None = None
+        self.budget = budget
+        self.budget_usage: BudgetUsage | None = None
+        self._budget_tracker: BudgetTracker | None = None
+        self.transcript_store = transcript_store
+        self.history_window = history_window
+        self.result_cache = result_cache
+        self.refresh = refresh
+        self.tracer = tracer or default_tracer
+        self.cached_debate: CachedDebate | None = None  # What the last discussion replayed
+        # Replaced by the transcript of each discussion
+        self.transcript = Transcript("", "", window=history_window)
+        self._turn_started: float | None = None
+        self._final_result = ""
+        self.debate_id: str | None = None
 
     async def run(self, topic: str) -> str:
         """Run a group discussion on the given topic.
@@ -75,72 +187,440 @@ class FightClubGroupChat:
         Returns:
             Final synthesized answer from the discussion
         """
-        orchestrator_client = create_orchestrator_client()
-        agents = create_all_agents()
+        async for _ in self.stream(topic):
+            pass
+        return self.final_result
 
-        participants = {agent.name: agent for agent in agents}
+    async def stream(self, topic: str, debate_id: str | None = None) -> AsyncIterator[StreamUpdate]:
+        """Run a group discussion and yield text as soon as it is produced.
+
+        Participant turns arrive token by token; orchestrator messages and
+        opening statements arrive as a single update each. After the
+        iterator is exhausted the synthesized answer is in ``final_result``.
+        LLM calls made meanwhile are attributed to ``debate_id`` in metrics,
+        with the round advancing on each orchestrator instruction. A debate
+        replayed from ``result_cache`` yields one update per message.
+
+        Args:
+            topic: The topic to discuss
+            debate_id: ID for the discussion (generated when omitted)
+
+        Yields:
+            StreamUpdate for every piece of text, in order
+        """
+        debate_id = debate_id or uuid.uuid4().hex
+        self.cached_debate = None
+        if self.result_cache is None:
+            async for update in self._stream(topic, debate_id):
+                yield update
+            return
+
+        fingerprint = self._fingerprint()
+        cached = None if self.refresh else self.result_cache.get(topic, fingerprint)
+        if cached is not None:
+            for update in self._replay(topic, debate_id, cached):
+                yield update
+            return
+        async for update in self._stream(topic, debate_id):
+            yield update
+        # A debate cut short by its budget depends on timing and prices, not just settings
+        if self._final_result and not (self.budget_usage and self.budget_usage.exceeded):
+            history = [entry.to_message() for entry in self.transcript]
+            self.result_cache.set(topic, fingerprint, CachedDebate(self._final_result, history, topic))
+
+    def _fingerprint(self) -> dict[str, Any]:
+        """Everything besides the topic that shapes the outcome of a debate."""
+        agents = self.registry.get_agents(self.cache)
+        return {
+            "participants": [
+                {
+                    "name": agent.name,
+                    "instructions": agent.chat_options.instructions,
+                    "models": _models(agent.chat_client),
+                }
+                for agent in agents
+            ],
+            "orchestrator": {
+                "instructions": get_system_prompt(
+                    "orchestrator", participants=" → ".join(agent.name for agent in agents)
+                ),
+                "models": _models(self.registry.get_orchestrator_client(self.cache)),
+            },
+            "max_rounds": self.max_rounds,
+            # Name with options (e.g. weights), falling back to the class of a custom scheduler
+            "scheduler": scheduler_name(self.scheduler)
+            or (type(self.scheduler).__name__ if self.scheduler is not None else None),
+            "parallel_opening": self.parallel_opening,
+            "budget": asdict(self.budget) if self.budget is not None else None,
+        }
+
+    def _replay(self, topic: str, debate_id: str, cached: CachedDebate) -> Iterator[StreamUpdate]:
+        """Play a cached debate back as if it had just been held."""
+        self.debate_id = debate_id
+        self.transcript = self._open_transcript(debate_id, topic)
+        self._final_result = cached.final_result
+        for message in cached.history:
+            yield StreamUpdate(agent=message["agent"], delta=message["content"], turn_id=len(self.transcript))
+            self._record(message["agent"], message["content"])
+        self.transcript.finish(cached.final_result)
+        self.cached_debate = cached
+
+    @property
+    def result_cached(self) -> bool:
+        """Whether the last discussion was replayed from ``result_cache``."""
+        return self.cached_debate is not None
 
-        orchestrator_instructions = get_system_prompt("orchestrator")
+    async def resume(self, debate_id: str) -> str:
+        """Continue a checkpointed debate from its last completed turn.
+
+        Args:
+            debate_id: ``debate_id`` of the interrupted discussion
+
+        Returns:
+            Final synthesized answer from the discussion
+        """
+        async for _ in self.stream_resume(debate_id):
+            pass
+        return self.final_result
+
+    async def stream_resume(self, debate_id: str) -> AsyncIterator[StreamUpdate]:
+        """Continue a checkpointed debate, yielding only the new text.
+
+        The workflow is rebuilt with the debate's original settings and
+        restored from its latest checkpoint, so finished turns are neither
+        re-run nor re-billed; ``conversation_history`` is restored from the
+        checkpoint first. A finished debate yields nothing and keeps its
+        stored answer.
+
+        Args:
+            debate_id: ``debate_id`` of the interrupted discussion
+
+        Yields:
+            StreamUpdate for every piece of text produced after the checkpoint
+
+        Raises:
+            ValueError: If no checkpoint storage is configured or the debate
+                is unknown
+        """
+        if self.checkpoint_storage is None:
+            raise ValueError("Resuming a debate requires checkpoint_storage")
+        record = self.checkpoint_storage.load_debate(debate_id)
+        if record is None:
+            raise ValueError(f"Unknown debate: {debate_id}")
+
+        self.max_rounds = record.max_rounds
+        if self.scheduler is None and record.scheduler:
+            self.scheduler = get_scheduler(record.scheduler)
+        checkpoint = await self.checkpoint_storage.latest_checkpoint(record.workflow_id)
+        history = _history_from_checkpoint(checkpoint) if checkpoint else []
+
+        if record.status == "finished":
+            self.debate_id = debate_id
+            self.transcript = self._open_transcript(debate_id, record.topic, history)
+            self._final_result = record.final_result
+            return
+        async for update in self._stream(record.topic, debate_id, checkpoint, history):
+            yield update
+
+    def _builder(self, orchestrator_client: Any, participants: dict[str, ChatAgent]) -> MagenticBuilder:
+        """Configure the Magentic workflow for one discussion."""
+        orchestrator_instructions = get_system_prompt(
+            "orchestrator", participants=" → ".join(participants)
+        )
+        if self.scheduler is not None:
+            manager = ScheduledMagenticManager(
+                self.scheduler,
+                orchestrator_client,
+                instructions=orchestrator_instructions,
+                turns=self.max_rounds,
+            )
+        else:
+            manager = StandardMagenticManager(
+                orchestrator_client,
+                instructions=orchestrator_instructions,
+                max_round_count=self.max_rounds,
+                max_stall_count=MAX_STALL_COUNT,
+            )
+            if self.speculate:
+                self._speculator = Speculator(
+                    participants,
+                    self.speculate if isinstance(self.speculate, SpeakerScheduler) else None,
+                )
+                self.speculation_stats = self._speculator.stats
+                manager = SpeculativeMagenticManager(manager, self._speculator)
+                participants = {
+                    name: SpeculativeAgent(agent, self._speculator)
+                    for name, agent in participants.items()
+                }
+        if self._budget_tracker is not None:
+            manager = BudgetedMagenticManager(manager, self._budget_tracker)
+        builder = MagenticBuilder().with_standard_manager(manager)
+        builder = builder.participants(**participants)
+        if self.checkpoint_storage is not None:
+            builder = builder.with_checkpointing(self.checkpoint_storage)
+        return builder
+
+    async def _stream(
+        self,
+        topic: str,
+        debate_id: str,
+        checkpoint: WorkflowCheckpoint | None = None,
+        history: list[dict[str, Any]] | None = None,
+    ) -> AsyncIterator[StreamUpdate]:
+        """Run a new discussion, or continue one from ``checkpoint``.
+
+        ``history`` holds the messages restored from the checkpoint when
+        resuming (None for a new discussion).
+        """
+        orchestrator_client = self.registry.get_orchestrator_client(self.cache)
+        agents = self.registry.get_agents(self.cache)
+
+        participants = {agent.name: agent for agent in agents}
 
         task_message = ChatMessage(
             role="user",
             text=f"トピック: {topic}\n\n参加者全員でこのトピックについて議論してください。",
         )
-        
-        workflow = (
-            MagenticBuilder()
-            .with_standard_manager(
-                chat_client=orchestrator_client,
-                instructions=orchestrator_instructions,
-                max_round_count=self.max_rounds,
-                max_stall_count=3,
+
+        self._final_result = ""
+
+        self.debate_id = debate_id
+        self.transcript = transcript = self._open_transcript(debate_id, topic, history)
+        with (
+            debate_context(self.debate_id) as debate,
+            self._track_budget(debate),
+            default_metrics.hooked(transcript.add_usage),
+            self.tracer.span("debate", "workflow", track="workflow", topic=topic),
+        ):
+            workflow = self._builder(orchestrator_client, participants).start_with_message(
+                task_message
             )
-            .participants(**participants)
-            .start_with_message(task_message)
+            record = None
+            if self.checkpoint_storage is not None:
+                record = self.checkpoint_storage.load_debate(debate_id) or DebateRecord(
+                    debate_id=debate_id,
+                    workflow_id=workflow.workflow.id,
+                    topic=topic,
+                    max_rounds=self.max_rounds,
+                    scheduler=scheduler_name(self.scheduler),
+                )
+                if checkpoint is None:
+                    # Interrupted before its first checkpoint: this run starts over
+                    record.workflow_id = workflow.workflow.id
+                self.checkpoint_storage.save_debate(record)
+
+            if checkpoint is not None:
+                debate.round = _magentic_context(checkpoint).get("round_count", 0)
+                events = workflow.workflow.run_stream(checkpoint_id=checkpoint.checkpoint_id)
+            else:
+                opening_messages: list[ChatMessage] = []
+                if self.parallel_opening:
+                    with self.tracer.span("opening_round", "workflow"):
+                        opening_messages = await self._run_opening_round(agents, topic)
+                    first_turn = len(transcript) - len(opening_messages)
+                    for turn_id, msg in enumerate(opening_messages, start=first_turn):
+                        yield StreamUpdate(agent=msg.author_name, delta=msg.text, turn_id=turn_id)
+                events = workflow.run_stream([*opening_messages, task_message])
+
+            streamed = False
+
+            try:
+                async for event in self._traced(events):
+                    if isinstance(event, MagenticAgentDeltaEvent):
+                        if event.text:
+                            if not streamed:
+                                self._turn_started = time.time()
+                            streamed = True
+                            update = StreamUpdate(
+                                agent=event.agent_id or "Agent",
+                                delta=event.text,
+                                turn_id=len(transcript),
+                            )
+                            if self.on_delta:
+                                with self.tracer.span("on_delta", "callback", agent=update.agent):
+                                    self.on_delta(update)
+                            yield update
+
+                    elif isinstance(event, MagenticAgentMessageEvent):
+                        agent_id = getattr(event, 'agent_id', 'Agent')
+                        msg = event.message
+                        content = msg.text if msg else ""
+                        if not streamed and content:
+                            yield StreamUpdate(agent=agent_id, delta=content, turn_id=len(transcript))
+                        streamed = False
+                        self._record(agent_id, content)
+
+                    elif isinstance(event, MagenticOrchestratorMessageEvent):
+                        if getattr(event, "kind", None) == "instruction":
+                            debate.round += 1
+                        msg = event.message
+                        content = msg.text if msg else ""
+                        if content:
+                            yield StreamUpdate(agent="Orchestrator", delta=content, turn_id=len(transcript))
+                            self._record("Orchestrator", content)
+
+                    elif isinstance(event, MagenticFinalResultEvent):
+                        msg = event.message
+                        if msg:
+                            self._final_result = msg.text or ""
+                        transcript.finish(self._final_result)
+                        if record is not None:
+                            record.status = "finished"
+                            record.final_result = self._final_result
+                            self.checkpoint_storage.save_debate(record)
+            finally:
+                if self._speculator is not None:
+                    # Cancel a guess still running when the discussion ends or is abandoned
+                    self._speculator.discard()
+
+    async def _traced(self, events: AsyncIterator[Any]) -> AsyncIterator[Any]:
+        """Yield workflow events, tracing how long the workflow took to produce each.
+
+        A span runs from the moment the previous event was handled until
+        the next event other than a streamed token arrives, so it covers
+        the orchestrator's planning or a participant's whole turn; tokens
+        streamed meanwhile are counted on it.
+        """
+        if not self.tracer.enabled:
+            async for event in events:
+                yield event
+            return
+
+        span = self.tracer.start("workflow", "workflow")
+        async for event in events:
+            if isinstance(event, MagenticAgentDeltaEvent):
+                span.attributes["deltas"] = span.attributes.get("deltas", 0) + 1
+                yield event
+                continue
+            span.name = type(event).__name__
+            if getattr(event, "agent_id", None):
+                span.attributes["agent"] = event.agent_id
+            if getattr(event, "kind", None):
+                span.attributes["kind"] = event.kind
+            if getattr(event, "executor_id", None):
+                span.attributes["executor"] = event.executor_id
+            self.tracer.finish(span)
+            yield event
+            span = self.tracer.start("workflow", "workflow")
+
+    @contextmanager
+    def _track_budget(self, debate: DebateContext) -> Iterator[None]:
+        """Count the debate's LLM usage against ``budget`` while active."""
+        if self.budget is None or not self.budget.limited:
+            self._budget_tracker = self.budget_usage = None
+            yield
+            return
+        self._budget_tracker = BudgetTracker(self.budget, debate)
+        self.budget_usage = self._budget_tracker.usage
+        with self._budget_tracker:
+            yield
+
+    @property
+    def final_result(self) -> str:
+        """Return the synthesized answer of the last discussion."""
+        return self._final_result or "議論が終了しました。"
+
+    async def _run_opening_round(
+        self,
+        agents: list[ChatAgent],
+        topic: str,
+    ) -> list[ChatMessage]:
+        """Ask every participant for an opening statement concurrently.
+
+        Agents that fail are skipped; the orchestrator can still call on
+        them during the regular rounds.
+
+        Args:
+            agents: Participant agents
+            topic: The topic to discuss
+
+        Returns:
+            Opening statements to seed the shared history with
+        """
+        prompt = f"トピック: {topic}\n\nこのトピックについて、あなたの最初の見解を述べてください。"
+        responses = await asyncio.gather(
+            *(agent.run(prompt) for agent in agents),
+            return_exceptions=True,
         )
 
-        final_result = ""
-        
-        async for event in workflow.run_stream():
-            if isinstance(event, MagenticAgentMessageEvent):
-                agent_id = getattr(event, 'agent_id', 'Agent')
-                msg = event.message
-                content = msg.text if msg else ""
-                self._messages.append({
-                    "agent": agent_id,
-                    "content": content,
-                })
-                if self.on_message and content:
-                    self.on_message(agent_id, content)
-
-            elif isinstance(event, MagenticOrchestratorMessageEvent):
-                msg = event.message
-                content = msg.text if msg else ""
-                if content:
-                    self._messages.append({
-                        "agent": "Orchestrator",
-                        "content": content,
-                    })
-                    if self.on_message:
-                        self.on_message("Orchestrator", content)
-            
-            elif isinstance(event, MagenticFinalResultEvent):
-                msg = event.message
-                if msg:
-                    final_result = msg.text or ""
-
-        return final_result or "議論が終了しました。"
+        opening_messages: list[ChatMessage] = []
+        for agent, response in zip(agents, responses):
+            if isinstance(response, BaseException):
+                continue
+            content = response.text or ""
+            self._record(agent.name, content)
+            opening_messages.append(
+                ChatMessage(role="assistant", text=content, author_name=agent.name)
+            )
+        return opening_messages
+
+    def _open_transcript(
+        self, debate_id: str, topic: str, history: list[dict[str, Any]] | None = None
+    ) -> Transcript:
+        """Start the transcript of a discussion, seeded with restored messages when resuming."""
+        transcript = Transcript(debate_id, topic, self.transcript_store, self.history_window)
+        if history is not None:
+            transcript.restore(history)
+        return transcript
+
+    def _record(self, agent: str, content: str) -> None:
+        """Append a message to the transcript and notify the callback."""
+        self.transcript.append(agent, content, self._turn_started)
+        self._turn_started = None
+        if self.on_message and content:
+            with self.tracer.span("on_message", "callback", agent=agent):
+                self.on_message(agent, content)
 
     @property
     def conversation_history(self) -> list[dict[str, Any]]:
-        """Return the conversation history."""
-        return self._messages
+        """Return the messages of the last discussion still held in memory.
+
+        At most ``history_window`` messages are kept; iterate
+        ``transcript`` to stream all of them from ``transcript_store``.
+        """
+        return [entry.to_message() for entry in self.transcript.recent]
+
+
+def _models(client: Any) -> list[str]:
+    """Models a client may call, in order of preference."""
+    router = getattr(client, "router", None)
+    return [route.model for route in router.routes] if router is not None else [client.model]
+
+
+def _magentic_context(checkpoint: WorkflowCheckpoint) -> dict[str, Any]:
+    """Serialized orchestrator context stored in a checkpoint."""
+    executors = checkpoint.shared_state.get("_executor_state", {})
+    return executors.get("magentic_orchestrator", {}).get("magentic_context", {})
+
+
+def _history_from_checkpoint(checkpoint: WorkflowCheckpoint) -> list[dict[str, Any]]:
+    """Rebuild ``conversation_history`` from the orchestrator's chat history."""
+    context = _magentic_context(checkpoint)
+    task = ChatMessage.from_dict(context["task"]).text if context.get("task") else None
+    history = []
+    for data in context.get("chat_history", []):
+        msg = ChatMessage.from_dict(data)
+        if msg.author_name == MAGENTIC_MANAGER_NAME:
+            history.append({"agent": "Orchestrator", "content": msg.text})
+        elif msg.author_name:
+            history.append({"agent": msg.author_name, "content": msg.text})
+        elif msg.text == task:
+            # Other user messages are hand-off notices ("Transferred to ...")
+            history.append({"agent": "Orchestrator", "content": msg.text})
+    return history
 
 
 async def run_fight_club(
     topic: str,
     max_rounds: int = 10,
     on_message: Callable[[str, str], None] | None = None,
+    parallel_opening: bool = False,
+    cache: ResponseCache | None = None,
+    scheduler: SpeakerScheduler | str | None = None,
+    checkpoint_storage: SQLiteCheckpointStorage | None = None,
+    budget: Budget | None = None,
+    result_cache: DebateResultCache | None = None,
+    refresh: bool = False,
 ) -> str:
     """Convenience function to run a Fight Club discussion.
 
@@ -148,9 +628,26 @@ async def run_fight_club(
         topic: The topic to discuss
         max_rounds: Maximum discussion rounds
         on_message: Callback when an agent sends a message
+        parallel_opening: Collect opening statements concurrently
+        cache: Optional response cache shared by all LLM clients
+        scheduler: Rule-based speaker scheduler (None = orchestrator LLM)
+        checkpoint_storage: Checkpoint the debate so it can be resumed
+        budget: Token, cost and time limits for the debate
+        result_cache: Reuse a finished debate with the same topic and settings
+        refresh: Hold the debate even when ``result_cache`` has it
 
     Returns:
         Final synthesized answer from the discussion
     """
-    chat = FightClubGroupChat(max_rounds=max_rounds, on_message=on_message)
+    chat = FightClubGroupChat(
+        max_rounds=max_rounds,
+        on_message=on_message,
+        parallel_opening=parallel_opening,
+        cache=cache,
+        scheduler=scheduler,
+        checkpoint_storage=checkpoint_storage,
+        budget=budget,
+        result_cache=result_cache,
+        refresh=refresh,
+    )
     return await chat.run(topic)
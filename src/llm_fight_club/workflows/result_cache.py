@@ -0,0 +1,119 @@
+"""Cache of finished debates keyed on topic and configuration.
+
+A debate takes a minute of LLM calls, yet the same topic is often debated
+again with the same settings (benchmark topics, repeated batch runs). A
+``DebateResultCache`` stores the final answer and the transcript of each
+finished debate under its normalized topic and a fingerprint of everything
+that shapes the outcome: the participants' prompts and models, the
+orchestrator's, and the round, scheduler and budget settings. Changing any
+of them, e.g. editing a prompt file, is a miss.
+"""
+
+import re
+import unicodedata
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from llm_fight_club.clients import ResponseCache, SQLiteResponseCache, make_cache_key
+
+_WHITESPACE = re.compile(r"\s+")
+
+# Bump when the stored entry or the fingerprint changes shape
+_FORMAT_VERSION = 1
+
+
+def normalize_topic(topic: str) -> str:
+    """Canonical form of a topic: NFKC, case-folded, whitespace collapsed."""
+    return _WHITESPACE.sub(" ", unicodedata.normalize("NFKC", topic)).strip().casefold()
+
+
+@dataclass
+class CachedDebate:
+    """A finished debate as stored in the cache."""
+
+    final_result: str
+    history: list[dict[str, Any]] = field(default_factory=list)
+    topic: str | None = None  # Topic as it was debated
+    similarity: float = 1.0  # To the requested topic (below 1.0 for paraphrases)
+
+
+@dataclass
+class ResultCacheStats:
+    """Lookups of a DebateResultCache by outcome."""
+
+    exact_hits: int = 0
+    semantic_hits: int = 0  # Paraphrased topics (SemanticResultCache only)
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups answered from the cache."""
+        total = self.exact_hits + self.semantic_hits + self.misses
+        return (self.exact_hits + self.semantic_hits) / total if total else 0.0
+
+
+class DebateResultCache:
+    """Finished debates stored in a ResponseCache."""
+
+    def __init__(self, cache: ResponseCache):
+        """Initialize the cache.
+
+        Args:
+            cache: Where entries are kept; its ``ttl`` decides how long a
+                debate is reused
+        """
+        self.cache = cache
+        self.stats = ResultCacheStats()
+
+    @staticmethod
+    def key(topic: str, fingerprint: dict[str, Any]) -> str:
+        """Cache key of a topic debated under a configuration."""
+        return make_cache_key({
+            "debate_result": _FORMAT_VERSION,
+            "topic": normalize_topic(topic),
+            "config": fingerprint,
+        })
+
+    def get(self, topic: str, fingerprint: dict[str, Any]) -> CachedDebate | None:
+        """Return the stored debate, if any."""
+        debate = self._load(topic, fingerprint)
+        if debate is None:
+            self.stats.misses += 1
+        else:
+            self.stats.exact_hits += 1
+        return debate
+
+    def _load(self, topic: str, fingerprint: dict[str, Any]) -> CachedDebate | None:
+        entry = self.cache.get(self.key(topic, fingerprint))
+        if entry is None:
+            return None
+        return CachedDebate(entry["final_result"], entry["history"], entry.get("topic"))
+
+    def set(self, topic: str, fingerprint: dict[str, Any], debate: CachedDebate) -> None:
+        """Store a finished debate."""
+        self.cache.set(
+            self.key(topic, fingerprint),
+            {"final_result": debate.final_result, "history": debate.history, "topic": debate.topic},
+        )
+
+
+def open_result_cache(
+    path: str | Path,
+    ttl: float | None = None,
+    semantic_threshold: float | None = None,
+) -> DebateResultCache:
+    """Open a debate cache stored in a SQLite file.
+
+    Args:
+        path: Database file (created if missing)
+        ttl: Seconds a finished debate is reused (None = forever)
+        semantic_threshold: Also reuse debates on paraphrased topics at
+            least this similar (None = exact topics only)
+    """
+    cache = SQLiteResponseCache(path, ttl=ttl)
+    if semantic_threshold is None:
+        return DebateResultCache(cache)
+    from llm_fight_club.workflows.semantic_cache import SemanticResultCache
+
+    return SemanticResultCache(cache, threshold=semantic_threshold)
@@ -0,0 +1,237 @@
+"""Rule-based speaker scheduling for the Magentic debate workflow."""
+
+import re
+from abc import ABC, abstractmethod
+
+from agent_framework import (
+    ChatClientProtocol,
+    ChatMessage,
+    MagenticContext,
+    MagenticManagerBase,
+    StandardMagenticManager,
+)
+
+# The ledger types are not exported publicly, but they are what the
+# orchestrator expects create_progress_ledger to return.
+from agent_framework._workflows._magentic import (
+    MAGENTIC_MANAGER_NAME,
+    _MagenticProgressLedger,
+    _MagenticProgressLedgerItem,
+)
+
+
+class SpeakerScheduler(ABC):
+    """Chooses who speaks next without asking an LLM."""
+
+    @abstractmethod
+    def next_speaker(self, turn: int, participants: list[str], history: list[ChatMessage]) -> str:
+        """Return the participant who takes turn number ``turn`` (0-based).
+
+        Args:
+            turn: Index of the upcoming participant turn
+            participants: Participant names in registration order
+            history: Conversation so far, oldest first
+        """
+
+    def describe(self, participants: list[str]) -> str:
+        """One-line description of the speaking order."""
+        return "発言順: " + " → ".join(participants)
+
+
+class RoundRobinScheduler(SpeakerScheduler):
+    """Participants speak in a fixed cycle (GPT → Claude → Gemini → Grok → ...)."""
+
+    def next_speaker(self, turn: int, participants: list[str], history: list[ChatMessage]) -> str:
+        return participants[turn % len(participants)]
+
+
+class WeightedScheduler(SpeakerScheduler):
+    """Participants speak in proportion to their weights.
+
+    Uses smooth weighted round-robin, so the order is deterministic and
+    heavier participants' turns are spread out rather than bunched; the
+    same participant never speaks twice in a row.
+    """
+
+    def __init__(self, weights: dict[str, float] | None = None):
+        """Initialize the scheduler.
+
+        Args:
+            weights: Relative share of turns per participant (missing = 1.0)
+        """
+        self.weights = weights or {}
+
+    def next_speaker(self, turn: int, participants: list[str], history: list[ChatMessage]) -> str:
+        weights = {name: self.weights.get(name, 1.0) for name in participants}
+        total = sum(weights.values())
+        current = dict.fromkeys(participants, 0.0)
+        chosen = None
+        for _ in range(turn + 1):
+            for name in participants:
+                current[name] += weights[name]
+            # Nobody answers themselves, even if their weight says so
+            candidates = [name for name in participants if name != chosen] or participants
+            chosen = max(candidates, key=current.__getitem__)
+            current[chosen] -= total
+        return chosen
+
+    def describe(self, participants: list[str]) -> str:
+        shares = ", ".join(f"{name}×{self.weights.get(name, 1.0):g}" for name in participants)
+        return f"発言比率: {shares}"
+
+
+class MentionScheduler(SpeakerScheduler):
+    """The participant named last in the previous reply answers next.
+
+    Falls back to another scheduler (round-robin by default) when the last
+    reply mentions nobody but its own author.
+    """
+
+    def __init__(self, fallback: SpeakerScheduler | None = None):
+        """Initialize the scheduler.
+
+        Args:
+            fallback: Scheduler used when no one is mentioned
+        """
+        self.fallback = fallback or RoundRobinScheduler()
+
+    def next_speaker(self, turn: int, participants: list[str], history: list[ChatMessage]) -> str:
+        last = next((m for m in reversed(history) if m.author_name in participants), None)
+        if last is not None and last.text:
+            mentions = [
+                (match.start(), name)
+                for name in participants
+                if name != last.author_name
+                for match in re.finditer(re.escape(name), last.text, flags=re.IGNORECASE)
+            ]
+            if mentions:
+                return max(mentions)[1]
+        return self.fallback.next_speaker(turn, participants, history)
+
+    def describe(self, participants: list[str]) -> str:
+        return "発言順: 直前の発言で名前を挙げられた参加者（なければ " + " → ".join(participants) + "）"
+
+
+SCHEDULERS: dict[str, type[SpeakerScheduler]] = {
+    "round_robin": RoundRobinScheduler,
+    "mention": MentionScheduler,
+    "weighted": WeightedScheduler,
+}
+
+
+def parse_weights(text: str) -> dict[str, float]:
+    """Parse ``"GPT=3,Claude=2"`` into participant weights.
+
+    Raises:
+        ValueError: If an entry is not ``name=positive number``
+    """
+    weights = {}
+    for entry in filter(None, (part.strip() for part in text.split(","))):
+        name, sep, value = entry.partition("=")
+        try:
+            weight = float(value) if sep and name.strip() else -1.0
+        except ValueError:
+            weight = -1.0
+        if not weight > 0:
+            raise ValueError(f"Invalid weight {entry!r} (expected e.g. GPT=3)")
+        weights[name.strip()] = weight
+    return weights
+
+
+def get_scheduler(name: str) -> SpeakerScheduler:
+    """Return a scheduler by name.
+
+    Args:
+        name: "round_robin", "mention" or "weighted"; weights follow a
+            colon, e.g. "weighted:GPT=3,Claude=2" (unlisted participants
+            weigh 1)
+
+    Raises:
+        ValueError: If the name or the weights are invalid
+    """
+    name, sep, options = name.partition(":")
+    if name not in SCHEDULERS:
+        raise ValueError(f"Unknown scheduler: {name} (choose from {', '.join(SCHEDULERS)})")
+    if name == "weighted":
+        return WeightedScheduler(parse_weights(options))
+    if sep:
+        raise ValueError(f"Scheduler {name} takes no options")
+    return SCHEDULERS[name]()
+
+
+def scheduler_name(scheduler: SpeakerScheduler | None) -> str | None:
+    """Name under which ``get_scheduler`` rebuilds ``scheduler``, if any."""
+    name = next((key for key, cls in SCHEDULERS.items() if type(scheduler) is cls), None)
+    if name == "weighted" and scheduler.weights:
+        return name + ":" + ",".join(f"{key}={value:g}" for key, value in scheduler.weights.items())
+    return name
+
+
+def _item(answer: str | bool, reason: str = "rule-based scheduler") -> _MagenticProgressLedgerItem:
+    return _MagenticProgressLedgerItem(reason=reason, answer=answer)
+
+
+class ScheduledMagenticManager(MagenticManagerBase):
+    """Magentic manager that schedules speakers locally.
+
+    Planning and speaker selection happen without LLM calls; the chat
+    client is only used once, to synthesize the final answer after
+    ``turns`` participant turns.
+    """
+
+    def __init__(
+        self,
+        scheduler: SpeakerScheduler,
+        chat_client: ChatClientProtocol,
+        instructions: str | None = None,
+        turns: int = 10,
+    ):
+        """Initialize the manager.
+
+        Args:
+            scheduler: Picks the next speaker
+            chat_client: Client for the final synthesis
+            instructions: System prompt for the final synthesis
+            turns: Participant turns before the final answer
+        """
+        # One extra round for the turn that triggers the final answer, so
+        # the orchestrator's round limit never cuts the synthesis off.
+        super().__init__(max_round_count=turns + 1)
+        self.scheduler = scheduler
+        self.turns = turns
+        self._synthesizer = StandardMagenticManager(chat_client, instructions=instructions)
+
+    async def plan(self, magentic_context: MagenticContext) -> ChatMessage:
+        participants = list(magentic_context.participant_descriptions)
+        return ChatMessage(
+            role="assistant",
+            text=self.scheduler.describe(participants),
+            author_name=MAGENTIC_MANAGER_NAME,
+        )
+
+    async def replan(self, magentic_context: MagenticContext) -> ChatMessage:
+        return await self.plan(magentic_context)
+
+    async def create_progress_ledger(self, magentic_context: MagenticContext) -> _MagenticProgressLedger:
+        participants = list(magentic_context.participant_descriptions)
+        if not participants:
+            raise RuntimeError("No participants configured; cannot determine next speaker.")
+
+        turn = magentic_context.round_count - 1
+        done = turn >= self.turns
+        speaker = "" if done else self.scheduler.next_speaker(
+            turn, participants, magentic_context.chat_history
+        )
+        topic = magentic_context.task.text.split("\n", 1)[0]
+        instruction = f"{speaker}、{topic}について、これまでの議論を踏まえてあなたの意見を述べてください。"
+
+        return _MagenticProgressLedger(
+            is_request_satisfied=_item(done),
+            is_in_loop=_item(False),
+            is_progress_being_made=_item(True),
+            next_speaker=_item(speaker),
+            instruction_or_question=_item("" if done else instruction),
+        )
+
+    async def prepare_final_answer(self, magentic_context: MagenticContext) -> ChatMessage:
+        return await self._synthesizer.prepare_final_answer(magentic_context)
@@ -0,0 +1,246 @@
+"""Reuse finished debates for paraphrased topics.
+
+``SemanticResultCache`` extends the exact-match ``DebateResultCache``: when
+a topic has not been debated verbatim, it looks for the most similar topic
+debated under the same configuration and replays that debate if the cosine
+similarity of their embeddings reaches a threshold.
+
+Embeddings are computed locally from hashed character n-grams, which suits
+short topics in any script (Japanese included) and needs no model download.
+The index is searched exhaustively, with NumPy when it is installed
+(``pip install numpy``) and in plain Python otherwise; ``LSHIndex`` trades
+exactness for sub-linear lookups on large caches.
+"""
+
+import math
+import random
+import zlib
+from collections.abc import Callable, Sequence
+from typing import Any, Protocol
+
+try:
+    import numpy as np
+except ImportError:  # Optional: speeds up the exhaustive search
+    np = None
+
+from llm_fight_club.clients import ResponseCache, make_cache_key
+from llm_fight_club.workflows.result_cache import CachedDebate, DebateResultCache, normalize_topic
+
+# Paraphrases of short topics score about 0.7-0.8 with the default embedder;
+# different questions on the same subject mostly stay below 0.65
+DEFAULT_THRESHOLD = 0.68
+
+Vector = list[float]
+
+
+class HashingEmbedder:
+    """Bag of character n-grams hashed into a fixed-size unit vector."""
+
+    def __init__(self, dim: int = 1024, ngrams: Sequence[int] = (2,)):
+        """Initialize the embedder.
+
+        Args:
+            dim: Vector size; collisions shrink as it grows
+            ngrams: Character n-gram lengths counted
+        """
+        self.dim = dim
+        self.ngrams = tuple(ngrams)
+
+    def __call__(self, text: str) -> Vector:
+        """Embed a text (normalized like topics first)."""
+        text = normalize_topic(text).replace(" ", "")
+        vector = [0.0] * self.dim
+        for n in self.ngrams:
+            for i in range(len(text) - n + 1):
+                # crc32 is stable across processes, unlike hash()
+                h = zlib.crc32(text[i:i + n].encode("utf-8"))
+                vector[h % self.dim] += 1.0 if h & 0x80000000 else -1.0
+        norm = math.sqrt(sum(x * x for x in vector))
+        return [x / norm for x in vector] if norm else vector
+
+
+class VectorIndex(Protocol):
+    """Nearest-neighbour search over unit vectors."""
+
+    def add(self, key: str, vector: Vector) -> None: ...
+
+    def search(self, vector: Vector, k: int = 1) -> list[tuple[str, float]]: ...
+
+    def __len__(self) -> int: ...
+
+
+def _nonzero(vector: Vector) -> list[tuple[int, float]]:
+    return [(i, x) for i, x in enumerate(vector) if x]
+
+
+def _dot(dense: Vector, sparse: list[tuple[int, float]]) -> float:
+    # Hashed n-gram vectors have few non-zero entries, so skip the rest
+    return sum(dense[i] * x for i, x in sparse)
+
+
+class BruteForceIndex:
+    """Exact cosine search over every stored vector."""
+
+    def __init__(self) -> None:
+        self._keys: list[str] = []
+        self._vectors: list[Vector] = []
+        self._matrix: Any = None  # NumPy copy of _vectors, rebuilt after adds
+
+    def add(self, key: str, vector: Vector) -> None:
+        self._keys.append(key)
+        self._vectors.append(vector)
+        self._matrix = None
+
+    def search(self, vector: Vector, k: int = 1) -> list[tuple[str, float]]:
+        """Return up to ``k`` (key, similarity) pairs, most similar first."""
+        if not self._keys:
+            return []
+        if np is not None:
+            if self._matrix is None:
+                self._matrix = np.asarray(self._vectors, dtype=np.float32)
+            scores = (self._matrix @ np.asarray(vector, dtype=np.float32)).tolist()
+        else:
+            nonzero = _nonzero(vector)
+            scores = [_dot(stored, nonzero) for stored in self._vectors]
+        best = sorted(range(len(scores)), key=scores.__getitem__, reverse=True)[:k]
+        return [(self._keys[i], scores[i]) for i in best]
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+
+class LSHIndex:
+    """Approximate cosine search with random-hyperplane hashing.
+
+    Each table buckets vectors by the signs of ``bits`` random projections;
+    a query is compared exactly only with the vectors sharing a bucket in
+    some table, so similar topics are found without scanning the index. The
+    defaults find a topic at similarity 0.7 with about 96% probability
+    while comparing few unrelated ones.
+    """
+
+    def __init__(self, dim: int, bits: int = 8, tables: int = 32, seed: int = 0):
+        """Initialize the index.
+
+        Args:
+            dim: Vector size
+            bits: Hyperplanes per table (more = smaller buckets)
+            tables: Independent hash tables (more = better recall)
+            seed: Seed for the hyperplanes, so indexes are reproducible
+        """
+        rng = random.Random(seed)
+        self.dim = dim
+        self._planes = [
+            [[rng.gauss(0.0, 1.0) for _ in range(dim)] for _ in range(bits)] for _ in range(tables)
+        ]
+        self._buckets: list[dict[int, list[int]]] = [{} for _ in range(tables)]
+        self._keys: list[str] = []
+        self._vectors: list[Vector] = []
+
+    def _signatures(self, nonzero: list[tuple[int, float]]) -> list[int]:
+        signatures = []
+        for planes in self._planes:
+            signature = 0
+            for plane in planes:
+                signature = (signature << 1) | (_dot(plane, nonzero) >= 0.0)
+            signatures.append(signature)
+        return signatures
+
+    def add(self, key: str, vector: Vector) -> None:
+        index = len(self._keys)
+        self._keys.append(key)
+        self._vectors.append(vector)
+        for buckets, signature in zip(self._buckets, self._signatures(_nonzero(vector))):
+            buckets.setdefault(signature, []).append(index)
+
+    def search(self, vector: Vector, k: int = 1) -> list[tuple[str, float]]:
+        """Return up to ``k`` (key, similarity) pairs among the candidates, most similar first."""
+        nonzero = _nonzero(vector)
+        candidates: set[int] = set()
+        for buckets, signature in zip(self._buckets, self._signatures(nonzero)):
+            candidates.update(buckets.get(signature, ()))
+        scored = sorted(((_dot(self._vectors[i], nonzero), i) for i in candidates), reverse=True)[:k]
+        return [(self._keys[i], score) for score, i in scored]
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+
+class SemanticResultCache(DebateResultCache):
+    """Debate cache that also matches paraphrased topics."""
+
+    def __init__(
+        self,
+        cache: ResponseCache,
+        threshold: float = DEFAULT_THRESHOLD,
+        embedder: Callable[[str], Vector] | None = None,
+        index_factory: Callable[[], VectorIndex] | None = None,
+    ):
+        """Initialize the cache.
+
+        Args:
+            cache: Where debates and the topic list of each configuration
+                are kept
+            threshold: Minimum cosine similarity for a paraphrase to count
+            embedder: Text to unit vector (defaults to HashingEmbedder)
+            index_factory: Builds an empty index per configuration
+                (defaults to exact search)
+        """
+        super().__init__(cache)
+        self.threshold = threshold
+        self.embedder = embedder or HashingEmbedder()
+        self.index_factory = index_factory or BruteForceIndex
+        self._indexes: dict[str, VectorIndex] = {}
+        self._indexed: dict[str, set[str]] = {}
+
+    @staticmethod
+    def _topics_key(fingerprint: dict[str, Any]) -> str:
+        return make_cache_key({"debate_topics": 1, "config": fingerprint})
+
+    def _index(self, key: str, topics: list[str]) -> VectorIndex:
+        """Index of a configuration's topics, extended with any not indexed yet."""
+        if key not in self._indexes:
+            self._indexes[key] = self.index_factory()
+            self._indexed[key] = set()
+        index, indexed = self._indexes[key], self._indexed[key]
+        for topic in topics:
+            if topic not in indexed:
+                indexed.add(topic)
+                index.add(topic, self.embedder(topic))
+        return index
+
+    def get(self, topic: str, fingerprint: dict[str, Any]) -> CachedDebate | None:
+        """Return the debate on ``topic``, or on the most similar topic above the threshold."""
+        debate = self._load(topic, fingerprint)
+        if debate is not None:
+            self.stats.exact_hits += 1
+            return debate
+
+        # Re-read the topic list: other processes sharing the cache add to it
+        key = self._topics_key(fingerprint)
+        entry = self.cache.get(key)
+        index = self._index(key, entry["topics"] if entry is not None else [])
+        for match, similarity in index.search(self.embedder(topic), k=3):
+            if similarity < self.threshold:
+                break
+            debate = self._load(match, fingerprint)
+            if debate is not None:  # Otherwise expired
+                self.stats.semantic_hits += 1
+                debate.topic = debate.topic or match
+                debate.similarity = similarity
+                return debate
+        self.stats.misses += 1
+        return None
+
+    def set(self, topic: str, fingerprint: dict[str, Any], debate: CachedDebate) -> None:
+        """Store a finished debate and make its topic findable."""
+        super().set(topic, fingerprint, debate)
+        normalized = normalize_topic(topic)
+
+        def add(entry: dict[str, Any] | None) -> dict[str, Any]:
+            topics = entry["topics"] if entry is not None else []
+            return {"topics": topics if normalized in topics else [*topics, normalized]}
+
+        # Merged into the stored list atomically, keeping topics other processes added
+        key = self._topics_key(fingerprint)
+        self._index(key, self.cache.update(key, add)["topics"])
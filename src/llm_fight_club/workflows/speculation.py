@@ -0,0 +1,214 @@
+"""Speculative execution of the next participant turn.
+
+While the Magentic manager's LLM decides who speaks next, the most likely
+speaker already starts answering on the transcript so far. If the manager
+picks that speaker the reply is replayed instead of requested again;
+otherwise the call is cancelled and its tokens are counted as wasted.
+"""
+
+import asyncio
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from typing import Any
+
+from agent_framework import (
+    AgentRunResponse,
+    AgentRunResponseUpdate,
+    BaseAgent,
+    ChatAgent,
+    ChatMessage,
+    MagenticContext,
+    MagenticManagerBase,
+)
+from agent_framework._workflows._magentic import _MagenticProgressLedger
+
+from llm_fight_club.clients.rate_limit import estimate_tokens
+from llm_fight_club.workflows.scheduler import MentionScheduler, SpeakerScheduler
+
+
+@dataclass
+class SpeculationStats:
+    """Outcome of speculative turns in one discussion."""
+
+    launched: int = 0
+    hits: int = 0
+    wasted_tokens: int = 0  # Estimated prompt + completion tokens of cancelled turns
+
+    @property
+    def misses(self) -> int:
+        return self.launched - self.hits
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.launched if self.launched else 0.0
+
+
+class _SpeculativeRun:
+    """A participant turn running in the background."""
+
+    def __init__(self, agent: ChatAgent, messages: list[ChatMessage]):
+        self.prompt_tokens = estimate_tokens([{"content": m.text} for m in messages])
+        self.text: list[str] = []
+        self._queue: asyncio.Queue[AgentRunResponseUpdate | None] = asyncio.Queue()
+        self.task = asyncio.create_task(self._run(agent, messages))
+
+    async def _run(self, agent: ChatAgent, messages: list[ChatMessage]) -> None:
+        try:
+            async for update in agent.run_stream(messages=messages):
+                self.text.append(update.text)
+                self._queue.put_nowait(update)
+        finally:
+            self._queue.put_nowait(None)
+
+    async def replay(self) -> AsyncIterator[AgentRunResponseUpdate]:
+        """Yield the updates produced so far, then the rest as they arrive."""
+        while (update := await self._queue.get()) is not None:
+            yield update
+        # Surface a failure of the background call
+        await self.task
+
+    def cancel(self) -> int:
+        """Stop the call and return the estimated tokens spent on it."""
+        self.task.cancel()
+        return self.prompt_tokens + estimate_tokens([{"content": "".join(self.text)}])
+
+
+class Speculator:
+    """Starts, commits and cancels speculative participant turns."""
+
+    def __init__(self, agents: dict[str, ChatAgent], predictor: SpeakerScheduler | None = None):
+        """Initialize the speculator.
+
+        Args:
+            agents: Participant agents by name
+            predictor: Guesses the manager's next choice (defaults to the
+                participant named last, then round-robin)
+        """
+        self.agents = agents
+        self.predictor = predictor or MentionScheduler()
+        self.stats = SpeculationStats()
+        self._pending: tuple[str, _SpeculativeRun] | None = None
+        self._committed: tuple[str, _SpeculativeRun] | None = None
+
+    def launch(self, turn: int, history: list[ChatMessage]) -> str | None:
+        """Start the predicted speaker's turn on ``history``.
+
+        Returns:
+            The predicted speaker, or None if it is not a known participant
+        """
+        self.discard()
+        speaker = self.predictor.next_speaker(turn, list(self.agents), history)
+        if speaker not in self.agents:
+            return None
+        self._pending = (speaker, _SpeculativeRun(self.agents[speaker], list(history)))
+        self.stats.launched += 1
+        return speaker
+
+    def resolve(self, speaker: str | None) -> None:
+        """Keep the pending turn if ``speaker`` was predicted, else cancel it."""
+        if self._pending is not None and self._pending[0] == speaker:
+            self._committed, self._pending = self._pending, None
+            self.stats.hits += 1
+        else:
+            self.discard()
+
+    def take(self, name: str) -> _SpeculativeRun | None:
+        """Hand over the committed turn of ``name``, if there is one."""
+        if self._committed is not None and self._committed[0] == name:
+            run, self._committed = self._committed[1], None
+            return run
+        return None
+
+    def discard(self) -> None:
+        """Cancel every turn that has not been handed over."""
+        for entry in (self._pending, self._committed):
+            if entry is not None:
+                self.stats.wasted_tokens += entry[1].cancel()
+        if self._committed is not None:
+            # Committed but never used: the manager went on to replan
+            self.stats.hits -= 1
+        self._pending = self._committed = None
+
+
+class SpeculativeAgent(BaseAgent):
+    """Participant that replays a committed speculative turn when one exists."""
+
+    def __init__(self, agent: ChatAgent, speculator: Speculator):
+        """Initialize the wrapper.
+
+        Args:
+            agent: Agent that answers when no speculative turn is committed
+            speculator: Source of committed turns
+        """
+        super().__init__(name=agent.name, description=agent.description)
+        self.agent = agent
+        self.speculator = speculator
+
+    async def run(self, messages: Any = None, **kwargs: Any) -> AgentRunResponse:
+        return await AgentRunResponse.from_agent_response_generator(self.run_stream(messages, **kwargs))
+
+    async def run_stream(self, messages: Any = None, **kwargs: Any) -> AsyncIterator[AgentRunResponseUpdate]:
+        run = self.speculator.take(self.agent.name)
+        if run is not None:
+            yielded = False
+            try:
+                async for update in run.replay():
+                    yielded = True
+                    yield update
+                return
+            except Exception:
+                if yielded:
+                    raise
+                # The early call failed before producing anything: ask again normally
+        async for update in self.agent.run_stream(messages, **kwargs):
+            yield update
+
+
+class SpeculativeMagenticManager(MagenticManagerBase):
+    """Wraps a manager so the likely next speaker starts while it decides."""
+
+    def __init__(self, manager: MagenticManagerBase, speculator: Speculator):
+        """Initialize the wrapper.
+
+        Args:
+            manager: Manager whose decisions are followed
+            speculator: Runs the speculative turns
+        """
+        super().__init__(
+            max_stall_count=manager.max_stall_count,
+            max_reset_count=manager.max_reset_count,
+            max_round_count=manager.max_round_count,
+        )
+        self.task_ledger_full_prompt = manager.task_ledger_full_prompt
+        self.manager = manager
+        self.speculator = speculator
+
+    async def plan(self, magentic_context: MagenticContext) -> ChatMessage:
+        return await self.manager.plan(magentic_context)
+
+    async def replan(self, magentic_context: MagenticContext) -> ChatMessage:
+        self.speculator.discard()
+        return await self.manager.replan(magentic_context)
+
+    async def create_progress_ledger(self, magentic_context: MagenticContext) -> _MagenticProgressLedger:
+        self.speculator.launch(magentic_context.round_count - 1, magentic_context.chat_history)
+        try:
+            ledger = await self.manager.create_progress_ledger(magentic_context)
+        except BaseException:
+            self.speculator.discard()
+            raise
+        if ledger.is_request_satisfied.answer:
+            self.speculator.discard()
+        else:
+            self.speculator.resolve(str(ledger.next_speaker.answer))
+        return ledger
+
+    async def prepare_final_answer(self, magentic_context: MagenticContext) -> ChatMessage:
+        self.speculator.discard()
+        return await self.manager.prepare_final_answer(magentic_context)
+
+    def on_checkpoint_save(self) -> dict[str, Any]:
+        return self.manager.on_checkpoint_save()
+
+    def on_checkpoint_restore(self, state: dict[str, Any]) -> None:
+        self.manager.on_checkpoint_restore(state)
@@ -0,0 +1,289 @@
+"""Append-only debate transcripts with a bounded in-memory window.
+
+Every message of a debate becomes a ``TranscriptEntry``. A ``Transcript``
+keeps only the most recent entries in memory and, when given a
+``SQLiteTranscriptStore``, appends each entry to disk as it is produced, so
+complete transcripts survive the process and can be streamed back or
+exported to Markdown without loading them whole.
+"""
+
+import sqlite3
+import threading
+import time
+from collections import defaultdict, deque
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, TextIO
+
+from llm_fight_club.metrics import CallMetrics
+
+DEFAULT_WINDOW = 1000
+
+
+@dataclass
+class TranscriptEntry:
+    """One message of a debate."""
+
+    debate_id: str
+    seq: int
+    agent: str
+    role: str  # "orchestrator" or "participant"
+    content: str
+    started_at: float = field(default_factory=time.time)
+    finished_at: float = field(default_factory=time.time)
+    prompt_tokens: int = 0  # LLM usage of the agent since its previous message
+    completion_tokens: int = 0
+
+    def to_message(self) -> dict[str, Any]:
+        """Return the entry in ``conversation_history`` form."""
+        return {"agent": self.agent, "content": self.content}
+
+
+class SQLiteTranscriptStore:
+    """Append-only transcript log in a SQLite file."""
+
+    def __init__(self, path: str | Path):
+        """Initialize the store.
+
+        Args:
+            path: Database file (created if missing)
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.executescript(
+            "CREATE TABLE IF NOT EXISTS transcripts ("
+            "debate_id TEXT PRIMARY KEY, topic TEXT NOT NULL, final_result TEXT, "
+            "created_at REAL NOT NULL);"
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "debate_id TEXT NOT NULL, seq INTEGER NOT NULL, agent TEXT NOT NULL, "
+            "role TEXT NOT NULL, content TEXT NOT NULL, started_at REAL NOT NULL, "
+            "finished_at REAL NOT NULL, prompt_tokens INTEGER NOT NULL, "
+            "completion_tokens INTEGER NOT NULL, PRIMARY KEY (debate_id, seq)) WITHOUT ROWID;"
+        )
+        self._conn.commit()
+
+    def start(self, debate_id: str, topic: str) -> int:
+        """Register a debate (once) and return the next free sequence number."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR IGNORE INTO transcripts (debate_id, topic, created_at) VALUES (?, ?, ?)",
+                (debate_id, topic, time.time()),
+            )
+            self._conn.commit()
+            (count,) = self._conn.execute(
+                "SELECT COUNT(*) FROM entries WHERE debate_id = ?", (debate_id,)
+            ).fetchone()
+        return count
+
+    def append(self, entry: TranscriptEntry) -> None:
+        """Write one entry."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    entry.debate_id,
+                    entry.seq,
+                    entry.agent,
+                    entry.role,
+                    entry.content,
+                    entry.started_at,
+                    entry.finished_at,
+                    entry.prompt_tokens,
+                    entry.completion_tokens,
+                ),
+            )
+            self._conn.commit()
+
+    def finish(self, debate_id: str, final_result: str) -> None:
+        """Store the synthesized answer of a debate."""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE transcripts SET final_result = ? WHERE debate_id = ?",
+                (final_result, debate_id),
+            )
+            self._conn.commit()
+
+    def header(self, debate_id: str) -> tuple[str, str | None] | None:
+        """Return (topic, final_result) of a debate, or None if unknown."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT topic, final_result FROM transcripts WHERE debate_id = ?", (debate_id,)
+            ).fetchone()
+        return tuple(row) if row else None
+
+    def entries(self, debate_id: str, batch_size: int = 256) -> Iterator[TranscriptEntry]:
+        """Yield a debate's entries in order, reading ``batch_size`` at a time."""
+        seq = -1
+        while True:
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT * FROM entries WHERE debate_id = ? AND seq > ? ORDER BY seq LIMIT ?",
+                    (debate_id, seq, batch_size),
+                ).fetchall()
+            for row in rows:
+                yield TranscriptEntry(*row)
+            if len(rows) < batch_size:
+                return
+            seq = rows[-1][1]
+
+    def debate_ids(self) -> list[str]:
+        """Return every stored debate, oldest first."""
+        with self._lock:
+            rows = self._conn.execute("SELECT debate_id FROM transcripts ORDER BY created_at").fetchall()
+        return [row[0] for row in rows]
+
+    def delete(self, debate_id: str) -> None:
+        """Remove a debate's transcript."""
+        with self._lock:
+            self._conn.execute("DELETE FROM entries WHERE debate_id = ?", (debate_id,))
+            self._conn.execute("DELETE FROM transcripts WHERE debate_id = ?", (debate_id,))
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self._conn.close()
+
+
+class Transcript:
+    """Messages of one debate: recent ones in memory, all of them in the store."""
+
+    def __init__(
+        self,
+        debate_id: str,
+        topic: str,
+        store: SQLiteTranscriptStore | None = None,
+        window: int = DEFAULT_WINDOW,
+    ):
+        """Initialize the transcript.
+
+        Args:
+            debate_id: Debate the messages belong to
+            topic: Topic of the debate
+            store: Where every entry is appended (None = memory only, so
+                entries older than ``window`` are lost)
+            window: Entries kept in memory
+        """
+        self.debate_id = debate_id
+        self.topic = topic
+        self.store = store
+        self.final_result: str | None = None
+        self._recent: deque[TranscriptEntry] = deque(maxlen=window)
+        self._count = 0
+        self._seq = store.start(debate_id, topic) if store is not None else 0
+        self._usage: dict[str, list[int]] = defaultdict(lambda: [0, 0])
+
+    def __len__(self) -> int:
+        """Number of messages so far, including those evicted from memory."""
+        return self._count
+
+    def add_usage(self, call: CallMetrics) -> None:
+        """Metrics hook: attribute a call's tokens to the agent's next message."""
+        if call.debate_id == self.debate_id and call.agent:
+            usage = self._usage[call.agent]
+            usage[0] += call.prompt_tokens
+            usage[1] += call.completion_tokens
+
+    def append(self, agent: str, content: str, started_at: float | None = None) -> TranscriptEntry:
+        """Record a finished message (written through to the store)."""
+        prompt_tokens, completion_tokens = self._usage.pop(agent, (0, 0))
+        entry = TranscriptEntry(
+            debate_id=self.debate_id,
+            seq=self._seq,
+            agent=agent,
+            role="orchestrator" if agent == "Orchestrator" else "participant",
+            content=content,
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+        )
+        if started_at is not None:
+            entry.started_at = started_at
+        if self.store is not None:
+            self.store.append(entry)
+        self._seq += 1
+        self._remember(entry)
+        return entry
+
+    def restore(self, messages: Iterable[dict[str, Any]]) -> None:
+        """Put the messages of a checkpoint back into memory only.
+
+        Later entries are numbered after the restored ones, so turns that
+        were stored after the checkpoint and are run again replace their
+        stored copies instead of being appended twice.
+        """
+        self._seq = 0
+        for message in messages:
+            self._remember(TranscriptEntry(
+                debate_id=self.debate_id,
+                seq=self._seq,
+                agent=message["agent"],
+                role="orchestrator" if message["agent"] == "Orchestrator" else "participant",
+                content=message["content"],
+            ))
+            self._seq += 1
+
+    def finish(self, final_result: str) -> None:
+        """Record the synthesized answer."""
+        self.final_result = final_result
+        if self.store is not None:
+            self.store.finish(self.debate_id, final_result)
+
+    def _remember(self, entry: TranscriptEntry) -> None:
+        self._recent.append(entry)
+        self._count += 1
+
+    @property
+    def recent(self) -> list[TranscriptEntry]:
+        """Entries still held in memory, oldest first."""
+        return list(self._recent)
+
+    def __iter__(self) -> Iterator[TranscriptEntry]:
+        """Stream every entry: from the store if there is one, else from memory."""
+        if self.store is not None:
+            return self.store.entries(self.debate_id)
+        return iter(list(self._recent))
+
+    def iter_markdown(self) -> Iterator[str]:
+        """Stream the transcript as Markdown."""
+        return iter_markdown(self.topic, self, self.final_result)
+
+
+def iter_markdown(
+    topic: str,
+    entries: Iterable[TranscriptEntry],
+    final_result: str | None = None,
+) -> Iterator[str]:
+    """Render a transcript as Markdown, one block at a time.
+
+    Args:
+        topic: Topic of the debate
+        entries: Messages in order
+        final_result: Synthesized answer, if the debate finished
+
+    Yields:
+        Markdown text; the blocks concatenate to the full document
+    """
+    yield f"# {topic}\n\n"
+    for entry in entries:
+        stamp = time.strftime("%H:%M:%S", time.localtime(entry.finished_at))
+        tokens = entry.prompt_tokens + entry.completion_tokens
+        details = f"{stamp}, {tokens} tokens" if tokens else stamp
+        yield f"### [{entry.agent}] ({details})\n\n{entry.content.strip()}\n\n"
+    if final_result:
+        yield f"## Final Summary\n\n{final_result.strip()}\n"
+
+
+def export_markdown(store: SQLiteTranscriptStore, debate_id: str, out: TextIO) -> None:
+    """Write a stored debate to ``out`` as Markdown without loading it whole.
+
+    Raises:
+        ValueError: If the debate is not in the store
+    """
+    header = store.header(debate_id)
+    if header is None:
+        raise ValueError(f"Unknown debate: {debate_id}")
+    topic, final_result = header
+    for block in iter_markdown(topic, store.entries(debate_id), final_result):
+        out.write(block)
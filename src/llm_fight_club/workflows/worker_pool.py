@@ -0,0 +1,213 @@
+"""Batch debates sharded across worker processes.
+
+One event loop runs every debate of ``run_batch``, including response
+parsing, message conversion and callbacks, so a large batch saturates a
+single core. ``run_batch_workers`` starts several worker processes instead,
+each with its own event loop, agents and client pools. Workers pull topics
+from a shared queue as they free up, and the coordinating process writes
+their results and merges their call metrics.
+"""
+
+import asyncio
+import multiprocessing
+import os
+import queue
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from llm_fight_club.agents import AgentRegistry
+from llm_fight_club.clients import SQLiteResponseCache
+from llm_fight_club.metrics import CallMetrics, default_metrics
+from llm_fight_club.tracing import Span, default_tracer
+from llm_fight_club.workflows.batch import BatchResult, BatchTopic, as_batch, run_debate, write_result
+from llm_fight_club.workflows.budget import Budget
+from llm_fight_club.workflows.result_cache import open_result_cache
+
+# How often the coordinator checks that its workers are still alive
+_POLL_INTERVAL = 0.5
+
+
+@dataclass
+class WorkerOptions:
+    """Settings every worker process starts from (must be picklable)."""
+
+    max_concurrency: int = 4
+    max_rounds: int = 10
+    cache_path: str | None = None
+    scheduler: str | None = None
+    budget: Budget | None = None
+    registry_factory: Callable[[], AgentRegistry] | None = None  # Module-level function
+    result_cache_path: str | None = None
+    result_ttl: float | None = None
+    semantic_threshold: float | None = None
+    refresh: bool = False
+    trace: bool = False
+
+
+def _worker_main(tasks: Any, results: Any, options: WorkerOptions) -> None:
+    """Entry point of a worker process."""
+    asyncio.run(_work(tasks, results, options))
+
+
+async def _work(tasks: Any, results: Any, options: WorkerOptions) -> None:
+    """Run debates from ``tasks`` until a ``None`` arrives for every slot."""
+    registry = options.registry_factory() if options.registry_factory else AgentRegistry()
+    cache = SQLiteResponseCache(options.cache_path) if options.cache_path else None
+    result_cache = (
+        open_result_cache(options.result_cache_path, options.result_ttl, options.semantic_threshold)
+        if options.result_cache_path
+        else None
+    )
+    default_tracer.enabled = options.trace
+    loop = asyncio.get_running_loop()
+    calls: list[CallMetrics] = []
+    spans: list[Span] = []
+
+    async def consume() -> None:
+        while (task := await loop.run_in_executor(None, tasks.get)) is not None:
+            index, item = task
+            result = await run_debate(
+                item,
+                options.max_rounds,
+                cache=cache,
+                registry=registry,
+                scheduler=options.scheduler,
+                budget=options.budget,
+                result_cache=result_cache,
+                refresh=options.refresh,
+            )
+            # Ship the calls and spans since the last result, whichever debate made them
+            shipped = calls[:], spans[:]
+            calls.clear()
+            spans.clear()
+            results.put((index, result, *shipped))
+
+    with default_metrics.hooked(calls.append), default_tracer.hooked(spans.append):
+        await asyncio.gather(*(consume() for _ in range(options.max_concurrency)))
+
+
+async def run_batch_workers(
+    topics: Iterable[BatchTopic | str],
+    output_path: str | Path,
+    *,
+    workers: int | None = None,
+    max_concurrency: int = 4,
+    max_rounds: int = 10,
+    cache_path: str | None = None,
+    on_result: Callable[[BatchResult], None] | None = None,
+    scheduler: str | None = None,
+    budget: Budget | None = None,
+    registry_factory: Callable[[], AgentRegistry] | None = None,
+    result_cache_path: str | None = None,
+    result_ttl: float | None = None,
+    semantic_threshold: float | None = None,
+    refresh: bool = False,
+) -> list[BatchResult]:
+    """Run many discussions across worker processes.
+
+    Behaves like ``run_batch``: results are appended to ``output_path`` as
+    they finish and failed debates are recorded with their error. The calls
+    made by the workers are recorded with ``default_metrics`` here, and
+    their spans with ``default_tracer`` when it is enabled, so summaries
+    and traces cover the whole batch. Debates still queued or running when a
+    worker process dies are recorded as failed.
+
+    Args:
+        topics: Topics (or plain topic strings) to debate
+        output_path: JSONL file receiving one result per line
+        workers: Number of worker processes (None = one per CPU)
+        max_concurrency: Maximum debates running at once in each worker
+        max_rounds: Default maximum rounds per debate
+        cache_path: SQLite response cache shared by the workers
+        on_result: Callback invoked as each debate finishes
+        scheduler: Name of a rule-based speaker scheduler (None = orchestrator LLM)
+        budget: Token, cost and time limits applied to each debate
+        registry_factory: Module-level function building each worker's
+            agents (defaults to a plain ``AgentRegistry``)
+        result_cache_path: SQLite file of finished debates shared by the workers
+        result_ttl: Seconds a finished debate is reused (None = forever)
+        semantic_threshold: Also reuse debates on paraphrased topics at
+            least this similar (None = exact topics only)
+        refresh: Hold every debate even when the result cache has it
+
+    Returns:
+        Results in completion order.
+    """
+    batch = as_batch(topics)
+    workers = max(1, min(workers or os.cpu_count() or 1, len(batch)))
+    options = WorkerOptions(
+        max_concurrency=max_concurrency,
+        max_rounds=max_rounds,
+        cache_path=cache_path,
+        scheduler=scheduler,
+        budget=budget,
+        registry_factory=registry_factory,
+        result_cache_path=result_cache_path,
+        result_ttl=result_ttl,
+        semantic_threshold=semantic_threshold,
+        refresh=refresh,
+        trace=default_tracer.enabled,
+    )
+
+    # Workers start from a fresh interpreter: forking a process with
+    # running threads and event loops is unsafe
+    context = multiprocessing.get_context("spawn")
+    tasks, finished = context.Queue(), context.Queue()
+    for task in enumerate(batch):
+        tasks.put(task)
+    for _ in range(workers * max_concurrency):
+        tasks.put(None)
+    processes = [
+        context.Process(
+            target=_worker_main,
+            args=(tasks, finished, options),
+            name=f"fight-club-worker-{i}",
+            daemon=True,
+        )
+        for i in range(workers)
+    ]
+    for process in processes:
+        process.start()
+
+    loop = asyncio.get_running_loop()
+    pending = set(range(len(batch)))
+    results: list[BatchResult] = []
+
+    def collect(result: BatchResult) -> None:
+        write_result(out, result)
+        results.append(result)
+        if on_result:
+            on_result(result)
+
+    try:
+        with open(output_path, "w", encoding="utf-8") as out:
+            while pending:
+                alive = any(process.is_alive() for process in processes)
+                try:
+                    index, result, calls, spans = await loop.run_in_executor(
+                        None, finished.get, True, _POLL_INTERVAL
+                    )
+                except queue.Empty:
+                    if alive:
+                        continue
+                    break  # Every worker is gone and nothing was left in the queue
+                pending.discard(index)
+                for call in calls:
+                    default_metrics.record(call)
+                for span in spans:
+                    default_tracer.record(span)
+                collect(result)
+
+            for index in sorted(pending):
+                item = batch[index]
+                collect(BatchResult(id=item.id, topic=item.topic, error="worker process exited"))
+    finally:
+        tasks.cancel_join_thread()  # Leftover end markers must not block our exit
+        for process in processes:
+            process.join(timeout=_POLL_INTERVAL)
+            if process.is_alive():
+                process.terminate()
+
+    return results
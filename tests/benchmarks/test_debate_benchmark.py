@@ -0,0 +1,35 @@
+"""Offline benchmarks for the debate workflow.
+
+These run full Magentic debates against FakeLLM, so they need no network
+or API keys. Run ``scripts/benchmark.py`` for detailed numbers.
+"""
+
+import pytest
+
+from llm_fight_club.benchmark import benchmark_debates
+from llm_fight_club.clients.fake import FakeLLM
+
+
+@pytest.mark.benchmark
+class TestDebateBenchmark:
+    """Throughput and overhead of FightClubGroupChat."""
+
+    @pytest.mark.asyncio
+    async def test_zero_latency_overhead(self):
+        result = await benchmark_debates(debates=4, rounds=4, concurrency=2, measure_memory=True)
+
+        assert result.errors == 0
+        assert result.turns > 0
+        # Generous ceiling: catches pathological regressions, not noise
+        assert result.ms_per_turn < 250
+        assert result.peak_memory_bytes < 64 * 1024 * 1024
+
+    @pytest.mark.asyncio
+    async def test_concurrent_debates_overlap_latency(self):
+        llm = FakeLLM(latency=0.02, chunk_interval=0.001)
+
+        serial = await benchmark_debates(llm, debates=4, rounds=2, concurrency=1)
+        parallel = await benchmark_debates(llm, debates=4, rounds=2, concurrency=4)
+
+        assert parallel.errors == serial.errors == 0
+        assert parallel.debates_per_second > serial.debates_per_second * 1.5
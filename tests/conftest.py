@@ -1,5 +1,8 @@
 """Pytest configuration and fixtures."""
 
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
 import pytest
 
 from llm_fight_club.config import config
@@ -16,6 +19,19 @@ def api_keys():
     }
 
 
+@pytest.fixture
+def mock_acompletion():
+    """Replace LiteLLM's acompletion with a canned, non-streaming response."""
+    response = SimpleNamespace(
+        id="mock-id",
+        model="test/model",
+        choices=[SimpleNamespace(message=SimpleNamespace(content="This is a mock response."))],
+    )
+    mock = AsyncMock(return_value=response)
+    with patch("llm_fight_club.clients.litellm_client.acompletion", mock):
+        yield mock
+
+
 @pytest.fixture
 def skip_if_no_openai_key():
     """Skip test if OpenAI API key is not set."""
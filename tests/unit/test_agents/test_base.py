@@ -1,8 +1,12 @@
 """Tests for the base agent class."""
 
 import pytest
+from agent_framework import ChatMessage
 
 from llm_fight_club.agents.base import AgentResponse, BaseAgent, Message
+from llm_fight_club.clients.cache import InMemoryResponseCache
+from llm_fight_club.clients.litellm_client import to_litellm_messages
+from llm_fight_club.metrics import MetricsCollector
 
 
 class ConcreteAgent(BaseAgent):
@@ -68,6 +72,15 @@ class TestBaseAgent:
         agent = ConcreteAgent()
         assert agent.get_api_key_param() == {}
 
+    def test_client_uses_api_key_param(self):
+        class ProxiedAgent(ConcreteAgent):
+            def get_api_key_param(self) -> dict[str, str]:
+                return {"api_key": "proxy-key"}
+
+        assert ConcreteAgent(api_key="test-key").client.api_key == "test-key"
+        assert ConcreteAgent().client.api_key is None
+        assert ProxiedAgent(api_key="test-key").client.api_key == "proxy-key"
+
     def test_build_messages_simple(self):
         agent = ConcreteAgent()
         messages = agent._build_messages("Hello")
@@ -109,3 +122,39 @@ class TestBaseAgent:
         call_args = mock_acompletion.call_args
         messages = call_args.kwargs["messages"]
         assert len(messages) == 3  # system + history + new message
+
+    @pytest.mark.asyncio
+    async def test_respond_goes_through_shared_client(self, mock_acompletion):
+        metrics = MetricsCollector()
+        agent = ConcreteAgent(api_key="test-key", cache=InMemoryResponseCache())
+        agent.client.metrics = metrics
+
+        first = await agent.respond("Same question")
+        second = await agent.respond("Same question")
+
+        assert first.raw_response.id == "mock-id"
+        assert second.content == first.content
+        mock_acompletion.assert_called_once()
+        assert [(c.agent, c.cached) for c in metrics.calls] == [("TestAgent", False), ("TestAgent", True)]
+
+
+class TestToLiteLLMMessages:
+    """Tests for the message conversion shared by every call path."""
+
+    def test_mixed_inputs(self):
+        messages = to_litellm_messages([
+            {"role": "system", "content": "rules"},
+            "question",
+            ChatMessage(role="assistant", text="answer"),
+            Message(role="assistant", content="rebuttal", name="Claude"),
+        ])
+
+        assert messages == [
+            {"role": "system", "content": "rules"},
+            {"role": "user", "content": "question"},
+            {"role": "assistant", "content": "answer"},
+            {"role": "assistant", "content": "[Claude]: rebuttal"},
+        ]
+
+    def test_single_message(self):
+        assert to_litellm_messages("hi") == [{"role": "user", "content": "hi"}]
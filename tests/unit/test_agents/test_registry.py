@@ -0,0 +1,58 @@
+"""Tests for the agent registry."""
+
+from llm_fight_club.agents.registry import AgentRegistry
+from llm_fight_club.clients import InMemoryResponseCache
+from llm_fight_club.prompts import prompt_registry
+
+
+class TestAgentRegistry:
+    """Tests for AgentRegistry class."""
+
+    def test_agents_are_reused(self):
+        registry = AgentRegistry()
+        first = registry.get_agents()
+        second = registry.get_agents()
+
+        assert [agent.name for agent in first] == ["GPT", "Claude", "Gemini", "Grok"]
+        assert all(a is b for a, b in zip(first, second))
+
+    def test_orchestrator_client_is_reused(self):
+        registry = AgentRegistry()
+        assert registry.get_orchestrator_client() is registry.get_orchestrator_client()
+
+    def test_separate_instances_per_cache(self):
+        registry = AgentRegistry()
+        cache = InMemoryResponseCache()
+
+        cached = registry.get_orchestrator_client(cache)
+        uncached = registry.get_orchestrator_client()
+
+        assert cached is not uncached
+        assert cached.cache is cache
+        assert registry.get_agents(cache)[0].chat_client.cache is cache
+
+    def test_refresh_rebuilds(self):
+        registry = AgentRegistry()
+        agents = registry.get_agents()
+        client = registry.get_orchestrator_client()
+
+        registry.refresh()
+
+        assert registry.get_agents()[0] is not agents[0]
+        assert registry.get_orchestrator_client() is not client
+
+    def test_compactor_is_shared(self):
+        registry = AgentRegistry()
+        agents = registry.get_agents()
+        compactor = registry.get_orchestrator_client().compactor
+
+        assert compactor is not None
+        assert all(agent.chat_client.compactor is compactor for agent in agents)
+
+    def test_prompt_change_rebuilds(self, monkeypatch):
+        registry = AgentRegistry()
+        agents = registry.get_agents()
+
+        monkeypatch.setattr(prompt_registry, "_version", prompt_registry.version + 1)
+
+        assert registry.get_agents()[0] is not agents[0]
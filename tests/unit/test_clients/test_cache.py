@@ -0,0 +1,123 @@
+"""Tests for the LLM response caches."""
+
+import pytest
+
+from llm_fight_club.agents.base import BaseAgent
+from llm_fight_club.clients import (
+    InMemoryResponseCache,
+    LiteLLMChatClient,
+    SQLiteResponseCache,
+    make_cache_key,
+)
+
+
+class CachedAgent(BaseAgent):
+    """Concrete agent for cache tests."""
+
+    name = "CachedAgent"
+    model = "test/model"
+    prompt_name = "gemini"
+
+
+class TestMakeCacheKey:
+    """Tests for canonical cache keys."""
+
+    def test_key_ignores_dict_order(self):
+        a = {"model": "m", "messages": [{"role": "user", "content": "hi"}], "temperature": 0.5}
+        b = {"temperature": 0.5, "messages": [{"content": "hi", "role": "user"}], "model": "m"}
+        assert make_cache_key(a) == make_cache_key(b)
+
+    def test_key_ignores_api_key_and_stream(self):
+        base = {"model": "m", "messages": []}
+        assert make_cache_key(base) == make_cache_key({**base, "api_key": "x", "stream": True})
+
+    def test_key_changes_with_params(self):
+        base = {"model": "m", "messages": []}
+        assert make_cache_key(base) != make_cache_key({**base, "max_tokens": 10})
+
+
+class TestInMemoryResponseCache:
+    """Tests for the LRU cache."""
+
+    def test_hit_and_miss_counters(self):
+        cache = InMemoryResponseCache()
+        assert cache.get("k") is None
+        cache.set("k", {"content": "v"})
+        assert cache.get("k") == {"content": "v"}
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 1
+        assert cache.stats.hit_rate == 0.5
+
+    def test_evicts_least_recently_used(self):
+        cache = InMemoryResponseCache(max_size=2)
+        cache.set("a", {"content": "a"})
+        cache.set("b", {"content": "b"})
+        cache.get("a")
+        cache.set("c", {"content": "c"})
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert len(cache) == 2
+
+    def test_ttl_expiry(self):
+        cache = InMemoryResponseCache(ttl=0)
+        cache.set("k", {"content": "v"})
+        assert cache.get("k") is None
+
+
+class TestSQLiteResponseCache:
+    """Tests for the persistent cache."""
+
+    def test_persists_across_instances(self, tmp_path):
+        path = tmp_path / "cache.db"
+        cache = SQLiteResponseCache(path)
+        cache.set("k", {"content": "日本語"})
+        cache.close()
+
+        reopened = SQLiteResponseCache(path)
+        assert reopened.get("k") == {"content": "日本語"}
+        reopened.close()
+
+    def test_ttl_expiry(self, tmp_path):
+        cache = SQLiteResponseCache(tmp_path / "cache.db", ttl=0)
+        cache.set("k", {"content": "v"})
+        assert cache.get("k") is None
+        cache.close()
+
+    def test_update_builds_on_other_instances_writes(self, tmp_path):
+        first, second = SQLiteResponseCache(tmp_path / "cache.db"), SQLiteResponseCache(tmp_path / "cache.db")
+
+        def append(item):
+            return lambda entry: {"items": [*(entry["items"] if entry else []), item]}
+
+        first.update("k", append("a"))
+        second.update("k", append("b"))
+
+        assert first.update("k", append("c")) == {"items": ["a", "b", "c"]}
+        first.close()
+        second.close()
+
+
+class TestClientCaching:
+    """Tests for cache integration in the clients."""
+
+    @pytest.mark.asyncio
+    async def test_chat_client_reuses_cached_response(self, mock_acompletion):
+        client = LiteLLMChatClient(model="test/model", cache=InMemoryResponseCache())
+
+        first = await client.get_response("Hello")
+        second = await client.get_response("Hello")
+
+        assert first.text == second.text == "This is a mock response."
+        mock_acompletion.assert_called_once()
+        assert client.cache.stats.hits == 1
+
+    @pytest.mark.asyncio
+    async def test_base_agent_reuses_cached_response(self, mock_acompletion):
+        agent = CachedAgent(api_key="test-key", cache=InMemoryResponseCache())
+
+        await agent.respond("Question")
+        response = await agent.respond("Question")
+
+        assert response.content == "This is a mock response."
+        assert response.raw_response is None
+        mock_acompletion.assert_called_once()
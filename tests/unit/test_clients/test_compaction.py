@@ -0,0 +1,103 @@
+"""Tests for conversation history compaction."""
+
+import pytest
+
+from llm_fight_club.clients.compaction import (
+    SUMMARY_PREFIX,
+    HistoryCompactor,
+    count_message_tokens,
+)
+
+MODEL = "openai/gpt-4o-mini"
+
+
+def conversation(turns: int) -> list[dict[str, str]]:
+    """System prompt, ``turns`` history messages and a final prompt."""
+    history = [
+        {"role": "assistant", "content": f"[Agent{i % 4}]: " + "議論の発言です。" * 20}
+        for i in range(turns)
+    ]
+    return [
+        {"role": "system", "content": "You are a debater."},
+        *history,
+        {"role": "user", "content": "次の意見をどうぞ。"},
+    ]
+
+
+def total_tokens(messages: list[dict[str, str]]) -> int:
+    return sum(count_message_tokens(MODEL, m) for m in messages)
+
+
+class RecordingSummarizer:
+    """Summarizer that records what it was asked to fold in."""
+
+    def __init__(self):
+        self.calls: list[tuple[str | None, int]] = []
+
+    async def __call__(self, previous, messages):
+        self.calls.append((previous, len(messages)))
+        return f"summary {len(self.calls)}"
+
+
+class TestHistoryCompactor:
+    """Tests for HistoryCompactor."""
+
+    @pytest.mark.asyncio
+    async def test_short_history_is_unchanged(self):
+        messages = conversation(2)
+        assert await HistoryCompactor(max_tokens=10_000).compact(messages, MODEL) is messages
+
+    @pytest.mark.asyncio
+    async def test_sliding_window_fits_budget(self):
+        messages = conversation(40)
+        budget = total_tokens(messages) // 4
+
+        compacted = await HistoryCompactor(max_tokens=budget).compact(messages, MODEL)
+
+        assert total_tokens(compacted) <= budget
+        assert compacted[0] == messages[0]
+        assert compacted[-1] == messages[-1]
+        assert compacted[-2] == messages[-2]
+
+    @pytest.mark.asyncio
+    async def test_summary_replaces_old_history(self):
+        messages = conversation(40)
+        summarizer = RecordingSummarizer()
+        compactor = HistoryCompactor(max_tokens=total_tokens(messages) // 4, summarizer=summarizer)
+
+        compacted = await compactor.compact(messages, MODEL)
+
+        assert compacted[1] == {"role": "system", "content": SUMMARY_PREFIX + "summary 1"}
+        assert summarizer.calls == [(None, summarizer.calls[0][1])]
+
+    @pytest.mark.asyncio
+    async def test_summaries_are_reused_and_rolled_forward(self):
+        messages = conversation(40)
+        summarizer = RecordingSummarizer()
+        compactor = HistoryCompactor(max_tokens=total_tokens(messages) // 4, summarizer=summarizer)
+
+        await compactor.compact(messages, MODEL)
+        # The next turn adds one message: the existing summary still fits
+        history = messages[:-1] + [{"role": "assistant", "content": "短い発言"}]
+        await compactor.compact([*history, messages[-1]], MODEL)
+        assert len(summarizer.calls) == 1
+
+        # Much later the window overflows and the summary is extended
+        longer = [*messages[:-1], *conversation(40)[1:-1], messages[-1]]
+        compacted = await compactor.compact(longer, MODEL)
+        assert len(summarizer.calls) == 2
+        assert summarizer.calls[1][0] == "summary 1"
+        assert compacted[1]["content"] == SUMMARY_PREFIX + "summary 2"
+
+    @pytest.mark.asyncio
+    async def test_failed_summary_falls_back_to_window(self):
+        async def failing(previous, messages):
+            raise RuntimeError("summarizer down")
+
+        messages = conversation(40)
+        compactor = HistoryCompactor(max_tokens=total_tokens(messages) // 4, summarizer=failing)
+
+        compacted = await compactor.compact(messages, MODEL)
+
+        assert not any(m["content"].startswith(SUMMARY_PREFIX) for m in compacted)
+        assert compacted[-1] == messages[-1]
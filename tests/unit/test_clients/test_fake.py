@@ -0,0 +1,84 @@
+"""Tests for the offline fake LLM backend."""
+
+import json
+
+import pytest
+
+from llm_fight_club.agents.base import BaseAgent
+from llm_fight_club.clients import LiteLLMChatClient, RetryPolicy
+from llm_fight_club.clients.fake import FakeLLM, FakeServiceUnavailableError
+
+
+class FakeBackedAgent(BaseAgent):
+    """Concrete agent for fake backend tests."""
+
+    name = "FakeBacked"
+    model = "fake/model"
+    prompt_name = "gemini"
+
+
+class TestFakeLLM:
+    """Tests for FakeLLM."""
+
+    @pytest.mark.asyncio
+    async def test_response_shape_and_usage(self):
+        llm = FakeLLM(completion_tokens=5)
+        response = await llm(model="fake/model", messages=[{"role": "user", "content": "hi"}])
+
+        assert response.choices[0].message.content == "lorem lorem lorem lorem lorem"
+        assert response.usage.completion_tokens == 5
+        assert llm.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_progress_ledger_prompt_gets_json(self):
+        prompt = "Who should speak next? (select from: GPT, Claude)"
+        response = await FakeLLM()(model="fake/model", messages=[{"role": "user", "content": prompt}])
+
+        ledger = json.loads(response.choices[0].message.content)
+        assert ledger["next_speaker"]["answer"] in {"GPT", "Claude"}
+        assert ledger["is_request_satisfied"]["answer"] is False
+
+    @pytest.mark.asyncio
+    async def test_error_rate(self):
+        with pytest.raises(FakeServiceUnavailableError):
+            await FakeLLM(error_rate=1.0)(model="fake/model", messages=[])
+
+    def test_latency_is_seeded(self):
+        a = FakeLLM(latency=1.0, latency_sigma=0.5, seed=7)
+        b = FakeLLM(latency=1.0, latency_sigma=0.5, seed=7)
+        assert [a._sample(1.0) for _ in range(3)] == [b._sample(1.0) for _ in range(3)]
+
+
+class TestFakeBackedClients:
+    """Tests plugging FakeLLM into the real clients."""
+
+    @pytest.mark.asyncio
+    async def test_chat_client_streams_from_fake(self):
+        client = LiteLLMChatClient(model="fake/model", completion_fn=FakeLLM(completion_tokens=10))
+
+        updates = [u async for u in client.get_streaming_response("hi")]
+
+        assert "".join(u.text for u in updates).split() == ["lorem"] * 10
+        assert len(updates) > 1
+
+    @pytest.mark.asyncio
+    async def test_transient_fake_errors_are_retried(self):
+        llm = FakeLLM(error_rate=0.5, seed=1)
+        client = LiteLLMChatClient(
+            model="fake/model",
+            completion_fn=llm,
+            retry_policy=RetryPolicy(max_attempts=20, base_delay=0),
+        )
+
+        for _ in range(5):
+            await client.get_response("hi")
+        assert llm.calls > 5
+
+    @pytest.mark.asyncio
+    async def test_base_agent_uses_fake(self):
+        agent = FakeBackedAgent()
+        agent.completion_fn = FakeLLM(completion_tokens=3)
+
+        response = await agent.respond("hi")
+
+        assert response.content == "lorem lorem lorem"
@@ -0,0 +1,91 @@
+"""Tests for provider prompt caching."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from llm_fight_club.clients import LiteLLMChatClient
+from llm_fight_club.clients.litellm_client import mark_cache_breakpoints
+from llm_fight_club.metrics import MetricsCollector
+
+
+def cache_control(message: dict) -> dict | None:
+    content = message["content"]
+    return content[0].get("cache_control") if isinstance(content, list) else None
+
+
+class TestMarkCacheBreakpoints:
+    """Tests for where breakpoints are placed."""
+
+    def test_marks_system_prompt_and_transcript_prefix(self):
+        messages = [
+            {"role": "system", "content": "persona"},
+            {"role": "user", "content": "topic"},
+            {"role": "assistant", "content": "[GPT]: opening"},
+            {"role": "user", "content": "your turn"},
+        ]
+
+        marked = mark_cache_breakpoints(messages)
+
+        assert [cache_control(m) is not None for m in marked] == [True, False, True, False]
+        assert marked[0]["content"][0]["text"] == "persona"
+        assert isinstance(messages[0]["content"], str)
+
+    def test_never_marks_the_newest_message(self):
+        marked = mark_cache_breakpoints([{"role": "user", "content": "only"}])
+
+        assert marked == [{"role": "user", "content": "only"}]
+
+
+class TestCachedUsage:
+    """Tests for requests and usage reporting of LiteLLMChatClient."""
+
+    @staticmethod
+    def client(model: str, cached_tokens: int = 0) -> LiteLLMChatClient:
+        async def completion(**params):
+            completion.params = params
+            return SimpleNamespace(
+                id="r",
+                model=params["model"],
+                choices=[SimpleNamespace(message=SimpleNamespace(content="ok"))],
+                usage=SimpleNamespace(
+                    prompt_tokens=2000,
+                    completion_tokens=10,
+                    total_tokens=2010,
+                    prompt_tokens_details=SimpleNamespace(cached_tokens=cached_tokens),
+                ),
+            )
+
+        return LiteLLMChatClient(model=model, completion_fn=completion, metrics=MetricsCollector())
+
+    @pytest.mark.asyncio
+    async def test_anthropic_requests_are_marked(self):
+        client = self.client("anthropic/claude-3-5-haiku-20241022")
+
+        await client.get_response(["first", "second"])
+
+        sent = client.completion_fn.params["messages"]
+        assert cache_control(sent[0]) == {"type": "ephemeral"}
+        assert sent[1] == {"role": "user", "content": "second"}
+
+    @pytest.mark.asyncio
+    async def test_openai_requests_are_left_alone(self):
+        client = self.client("openai/gpt-4o")
+
+        await client.get_response(["first", "second"])
+
+        assert client.completion_fn.params["messages"][0] == {"role": "user", "content": "first"}
+
+    @pytest.mark.asyncio
+    async def test_cached_tokens_are_reported_and_cheaper(self):
+        uncached = self.client("openai/gpt-4o")
+        cached = self.client("openai/gpt-4o", cached_tokens=1500)
+
+        await uncached.get_response("hi")
+        response = await cached.get_response("hi")
+
+        call = cached.metrics.calls[0]
+        assert call.cached_prompt_tokens == 1500
+        assert call.cost < uncached.metrics.calls[0].cost
+        assert response.usage_details.additional_counts["cached_input_token_count"] == 1500
+        assert cached.metrics.summary()[None].prompt_cache_hit_rate == 0.75
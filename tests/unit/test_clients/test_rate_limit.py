@@ -0,0 +1,123 @@
+"""Tests for per-provider rate limiting."""
+
+import asyncio
+
+import pytest
+
+from llm_fight_club.clients import FakeLLM, LiteLLMChatClient
+from llm_fight_club.clients.rate_limit import (
+    AdaptiveConcurrency,
+    ProviderLimits,
+    ProviderRateLimiter,
+    TokenBucket,
+    is_rate_limit_error,
+)
+from llm_fight_club.config import Config
+
+
+class RateLimitError(Exception):
+    """Mimics litellm.RateLimitError."""
+
+    status_code = 429
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket."""
+
+    @pytest.mark.asyncio
+    async def test_waits_when_empty(self):
+        bucket = TokenBucket(rate_per_minute=600, capacity=1)  # 10 per second
+        await bucket.acquire()
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await bucket.acquire()
+
+        assert loop.time() - start >= 0.05
+
+    def test_consume_allows_overdraft(self):
+        bucket = TokenBucket(rate_per_minute=60)
+        bucket.consume(100)
+        assert bucket.available < 0
+
+
+class TestAdaptiveConcurrency:
+    """Tests for AIMD concurrency."""
+
+    def test_throttle_halves_and_success_grows(self):
+        limiter = AdaptiveConcurrency(initial=8, maximum=16)
+        limiter.on_throttle()
+        assert limiter.slots == 4
+        for _ in range(8):
+            limiter.on_success()
+        assert limiter.slots == 5
+
+    def test_never_below_minimum(self):
+        limiter = AdaptiveConcurrency(initial=1, minimum=1)
+        limiter.on_throttle()
+        assert limiter.slots == 1
+
+    @pytest.mark.asyncio
+    async def test_bounds_in_flight(self):
+        limiter = AdaptiveConcurrency(initial=2, maximum=2)
+        peak = 0
+
+        async def call():
+            nonlocal peak
+            await limiter.acquire()
+            peak = max(peak, limiter.in_flight)
+            await asyncio.sleep(0.01)
+            limiter.release()
+
+        await asyncio.gather(*(call() for _ in range(6)))
+
+        assert peak == 2
+        assert limiter.in_flight == 0
+
+
+class TestProviderRateLimiter:
+    """Tests for ProviderRateLimiter."""
+
+    @pytest.mark.asyncio
+    async def test_429_reduces_only_that_provider(self):
+        limiter = ProviderRateLimiter(default=ProviderLimits(initial_concurrency=8))
+
+        with pytest.raises(RateLimitError):
+            async with limiter.throttle("anthropic"):
+                raise RateLimitError()
+        async with limiter.throttle("openai"):
+            pass
+
+        stats = limiter.stats()
+        assert stats["anthropic"]["concurrency_limit"] == 4
+        assert stats["anthropic"]["throttled"] == 1
+        assert stats["openai"]["concurrency_limit"] > 8
+        assert stats["openai"]["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_streamed_usage_corrects_token_budget(self):
+        limiter = ProviderRateLimiter({"openai": ProviderLimits(tokens_per_minute=100_000)})
+        client = LiteLLMChatClient(
+            model="openai/gpt-4o",
+            completion_fn=FakeLLM(completion_tokens=400),
+            rate_limiter=limiter,
+        )
+
+        async for _ in client.get_streaming_response("hi", max_tokens=4000):
+            pass
+
+        # The 4000-token reservation is refunded down to the ~400 used (less refill)
+        spent = 100_000 - limiter._state("openai").tokens.available
+        assert 300 <= spent < 1000
+
+    def test_from_config(self):
+        cfg = Config(rate_limits={"openai": {"requests_per_minute": 500, "max_concurrency": 4}})
+        limiter = ProviderRateLimiter.from_config(cfg)
+
+        assert limiter.limits["openai"].requests_per_minute == 500
+        assert limiter.limits["openai"].max_concurrency == 4
+        assert limiter.limits["openai"].initial_concurrency == 4
+
+    def test_is_rate_limit_error(self):
+        assert is_rate_limit_error(RateLimitError())
+        assert not is_rate_limit_error(ValueError())
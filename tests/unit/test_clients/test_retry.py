@@ -0,0 +1,169 @@
+"""Tests for retries, timeouts and hedged requests."""
+
+import asyncio
+
+import pytest
+
+from llm_fight_club.clients import FakeLLM, LiteLLMChatClient
+from llm_fight_club.clients.rate_limit import ProviderRateLimiter
+from llm_fight_club.clients.retry import (
+    LatencyTracker,
+    RetryPolicy,
+    call_with_retry,
+    is_transient_error,
+)
+
+
+class ServiceUnavailableError(Exception):
+    """Mimics litellm.ServiceUnavailableError."""
+
+    status_code = 503
+
+
+def flaky(failures: int, exc: Exception, result: str = "ok"):
+    """Return a call that fails ``failures`` times before succeeding."""
+    calls = []
+
+    async def call():
+        calls.append(1)
+        if len(calls) <= failures:
+            raise exc
+        return result
+
+    return call, calls
+
+
+class TestIsTransientError:
+    """Tests for is_transient_error."""
+
+    def test_classification(self):
+        assert is_transient_error(TimeoutError())
+        assert is_transient_error(ServiceUnavailableError())
+        assert not is_transient_error(ValueError("bad request"))
+
+
+class TestCallWithRetry:
+    """Tests for call_with_retry."""
+
+    @pytest.mark.asyncio
+    async def test_retries_transient_errors(self):
+        call, calls = flaky(2, ServiceUnavailableError())
+        policy = RetryPolicy(max_attempts=3, base_delay=0)
+
+        assert await call_with_retry(call, policy) == "ok"
+        assert len(calls) == 3
+
+    @pytest.mark.asyncio
+    async def test_does_not_retry_permanent_errors(self):
+        call, calls = flaky(1, ValueError("bad request"))
+
+        with pytest.raises(ValueError):
+            await call_with_retry(call, RetryPolicy(base_delay=0))
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_attempts(self):
+        call, calls = flaky(5, ServiceUnavailableError())
+        retried = []
+
+        with pytest.raises(ServiceUnavailableError):
+            await call_with_retry(call, RetryPolicy(max_attempts=2, base_delay=0), on_retry=retried.append)
+        assert len(calls) == 2
+        assert len(retried) == 1
+
+    @pytest.mark.asyncio
+    async def test_timeout_is_retried(self):
+        calls = []
+
+        async def call():
+            calls.append(1)
+            if len(calls) == 1:
+                await asyncio.sleep(1)
+            return "ok"
+
+        policy = RetryPolicy(timeout=0.05, base_delay=0)
+        assert await call_with_retry(call, policy) == "ok"
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_hedged_request_wins(self):
+        delays = [1.0, 0.01]
+
+        async def call():
+            delay = delays.pop(0)
+            await asyncio.sleep(delay)
+            return delay
+
+        policy = RetryPolicy(hedge=True, hedge_delay=0.02)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+
+        assert await call_with_retry(call, policy) == 0.01
+        assert loop.time() - start < 0.5
+
+    @pytest.mark.asyncio
+    async def test_percentile_hedging_needs_samples(self):
+        tracker = LatencyTracker()
+        policy = RetryPolicy(hedge=True, hedge_min_samples=3)
+        assert policy.hedge_after(tracker) is None
+
+        for seconds in (0.1, 0.2, 0.3):
+            tracker.record(seconds)
+        assert policy.hedge_after(tracker) == 0.3
+
+
+class FixedBackoff(RetryPolicy):
+    """RetryPolicy with a predictable pause between attempts."""
+
+    def backoff(self, attempt: int) -> float:
+        return 0.1
+
+
+class TestStreamingRetry:
+    """Tests for how LiteLLMChatClient opens streams."""
+
+    @pytest.mark.asyncio
+    async def test_streams_are_not_hedged(self):
+        fake = FakeLLM(first_token_latency=0.05, completion_tokens=4)
+        client = LiteLLMChatClient(
+            model="openai/gpt-4o",
+            completion_fn=fake,
+            retry_policy=RetryPolicy(hedge=True, hedge_delay=0.01),
+            rate_limiter=ProviderRateLimiter(),
+        )
+
+        text = "".join([update.text async for update in client.get_streaming_response("hi")])
+
+        assert fake.calls == 1
+        assert len(text.split()) == 4
+
+    @pytest.mark.asyncio
+    async def test_slot_is_released_during_backoff(self):
+        fake = FakeLLM(completion_tokens=4)
+        failures = []
+
+        async def completion(**params):
+            if not failures:
+                failures.append(1)
+                raise ServiceUnavailableError()
+            return await fake(**params)
+
+        limiter = ProviderRateLimiter()
+        client = LiteLLMChatClient(
+            model="openai/gpt-4o",
+            completion_fn=completion,
+            retry_policy=FixedBackoff(),
+            rate_limiter=limiter,
+        )
+
+        async def consume():
+            return [update.text async for update in client.get_streaming_response("hi")]
+
+        task = asyncio.ensure_future(consume())
+        await asyncio.sleep(0.05)  # First attempt failed, backing off
+        in_flight = limiter.stats()["openai"]["in_flight"]
+
+        assert await task
+        assert in_flight == 0
+        assert limiter.stats()["openai"]["in_flight"] == 0
+
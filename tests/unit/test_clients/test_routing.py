@@ -0,0 +1,160 @@
+"""Tests for model routing and fallback."""
+
+import pytest
+
+from llm_fight_club.clients import FakeLLM, LiteLLMChatClient, RetryPolicy
+from llm_fight_club.clients.routing import ModelHealthRegistry, ModelRoute, ModelRouter, parse_routes
+from llm_fight_club.metrics import CallMetrics, MetricsCollector
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def call(model: str, latency: float = 1.0, error: str | None = None) -> CallMetrics:
+    return CallMetrics(model=model, provider="p", latency=latency, error=error)
+
+
+def make_router(*routes: ModelRoute, clock: Clock | None = None) -> ModelRouter:
+    health = ModelHealthRegistry(failure_threshold=2, cooldown=10.0, min_samples=3, clock=clock or Clock())
+    return ModelRouter(routes, health)
+
+
+def models(router: ModelRouter) -> list[str]:
+    return [route.model for route in router.candidates()]
+
+
+class TestModelRouter:
+    """Tests for route ordering by health."""
+
+    def test_prefers_lower_tier_then_configured_order(self):
+        router = make_router(ModelRoute("b", tier=1), ModelRoute("a1"), ModelRoute("a2"))
+
+        assert models(router) == ["a1", "a2", "b"]
+        assert router.primary.model == "a1"
+
+    def test_fastest_model_of_a_tier_wins(self):
+        router = make_router(ModelRoute("slow"), ModelRoute("fast"))
+        for _ in range(3):
+            router.record(call("slow", latency=5.0))
+            router.record(call("fast", latency=1.0))
+
+        assert models(router) == ["fast", "slow"]
+
+    def test_errors_send_model_into_cooldown(self):
+        clock = Clock()
+        router = make_router(ModelRoute("a"), ModelRoute("b", tier=1), clock=clock)
+        router.record(call("a", error="ServiceUnavailableError"))
+        assert models(router) == ["a", "b"]
+        router.record(call("a", error="ServiceUnavailableError"))
+        assert models(router) == ["b", "a"]
+
+        clock.now = 10.0
+        assert models(router) == ["a", "b"]
+
+    def test_slow_p95_breaches_slo(self):
+        router = make_router(ModelRoute("a", max_latency=2.0), ModelRoute("b", tier=1))
+        for _ in range(3):
+            router.record(call("a", latency=3.0))
+
+        assert models(router) == ["b", "a"]
+
+    def test_parse_routes(self):
+        routes = parse_routes("openai/a|xai/b, anthropic/c", api_key_for=lambda p: f"{p}-key", max_latency=9)
+
+        assert [(r.model, r.tier, r.api_key) for r in routes] == [
+            ("openai/a", 0, "openai-key"),
+            ("xai/b", 0, "xai-key"),
+            ("anthropic/c", 1, "anthropic-key"),
+        ]
+        assert all(r.max_latency == 9 for r in routes)
+
+
+class TestRoutedClient:
+    """Tests for LiteLLMChatClient fallback."""
+
+    @staticmethod
+    def client(
+        fake: FakeLLM, down: str, error: type[Exception] = ConnectionError, failures: int | None = None
+    ) -> LiteLLMChatClient:
+        async def completion(**params):
+            completion.models.append(params["model"])
+            if params["model"] == down and (failures is None or completion.models.count(down) <= failures):
+                raise error("provider down")
+            return await fake(**params)
+
+        completion.models = []
+        router = make_router(ModelRoute("openai/a", api_key="ka"), ModelRoute("openai/b", tier=1, api_key="kb"))
+        return LiteLLMChatClient(
+            model="openai/a",
+            router=router,
+            completion_fn=completion,
+            metrics=MetricsCollector(),
+            retry_policy=RetryPolicy(base_delay=0, max_delay=0),
+        )
+
+    @pytest.mark.asyncio
+    async def test_falls_back_on_error(self):
+        client = self.client(FakeLLM(completion_tokens=3), down="openai/a")
+
+        response = await client.get_response("hi")
+
+        assert response.text == "lorem lorem lorem"
+        assert [(c.model, c.error) for c in client.metrics.calls] == [
+            ("openai/a", "ConnectionError"),
+            ("openai/b", None),
+        ]
+        # Each route is retried before falling back
+        assert client.completion_fn.models == ["openai/a"] * 3 + ["openai/b"]
+
+    @pytest.mark.asyncio
+    async def test_transient_error_is_retried_on_the_same_model(self):
+        client = self.client(FakeLLM(completion_tokens=3), down="openai/a", failures=1)
+
+        await client.get_response("hi")
+
+        assert client.completion_fn.models == ["openai/a", "openai/a"]
+        assert [(c.model, c.error) for c in client.metrics.calls] == [("openai/a", None)]
+
+    @pytest.mark.asyncio
+    async def test_non_transient_error_does_not_fall_back(self):
+        client = self.client(FakeLLM(completion_tokens=3), down="openai/a", error=TypeError)
+        streaming = self.client(FakeLLM(completion_tokens=3), down="openai/a", error=TypeError)
+
+        with pytest.raises(TypeError):
+            await client.get_response("hi")
+        with pytest.raises(TypeError):
+            [update async for update in streaming.get_streaming_response("hi")]
+
+        assert client.completion_fn.models == streaming.completion_fn.models == ["openai/a"]
+
+    @pytest.mark.asyncio
+    async def test_ejected_model_falls_back_on_any_error(self):
+        client = self.client(FakeLLM(completion_tokens=3), down="openai/a", error=TypeError)
+        client.router.health.failure_threshold = 1
+
+        response = await client.get_response("hi")
+
+        assert response.text == "lorem lorem lorem"
+        assert client.completion_fn.models == ["openai/a", "openai/b"]
+
+    def test_routes_with_a_fallback_get_a_shorter_deadline(self):
+        client = self.client(FakeLLM(), down="openai/a")
+        client.router.fallback_timeout = 5.0
+
+        assert client._route_policy(last=False).timeout == 5.0
+        assert client._route_policy(last=False).max_attempts == client.retry_policy.max_attempts
+        assert client._route_policy(last=True) is client.retry_policy
+
+    @pytest.mark.asyncio
+    async def test_streaming_falls_back_before_first_chunk(self):
+        client = self.client(FakeLLM(completion_tokens=3), down="openai/a")
+
+        text = "".join([update.text async for update in client.get_streaming_response("hi")])
+
+        assert text.split() == ["lorem"] * 3
+        assert client.metrics.calls[-1].model == "openai/b"
@@ -0,0 +1,39 @@
+"""Tests for lazy package exports and CLI startup."""
+
+import subprocess
+import sys
+
+import pytest
+
+import llm_fight_club.clients
+from llm_fight_club.main import SCHEDULER_CHOICES
+from llm_fight_club.workflows.scheduler import SCHEDULERS
+
+
+class TestLazyExports:
+    """Tests for module-level __getattr__ exports."""
+
+    def test_exports_resolve_to_submodule_objects(self):
+        from llm_fight_club.clients.cache import SQLiteResponseCache
+
+        assert llm_fight_club.clients.SQLiteResponseCache is SQLiteResponseCache
+        assert "FakeLLM" in dir(llm_fight_club.clients)
+
+    def test_unknown_name_raises(self):
+        with pytest.raises(AttributeError):
+            llm_fight_club.clients.DoesNotExist
+
+    def test_cli_scheduler_choices_match_schedulers(self):
+        assert set(SCHEDULER_CHOICES) == {"llm", *SCHEDULERS}
+
+
+class TestStartup:
+    """Tests that the CLI starts without the LLM stack."""
+
+    def test_main_does_not_import_heavy_packages(self):
+        code = (
+            "import sys, llm_fight_club.main; "
+            "print(','.join(m for m in ('litellm', 'agent_framework') if m in sys.modules))"
+        )
+        proc = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        assert proc.stdout.strip() == ""
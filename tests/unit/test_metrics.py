@@ -0,0 +1,95 @@
+"""Tests for per-call metrics."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from llm_fight_club.clients import LiteLLMChatClient
+from llm_fight_club.metrics import (
+    CallMetrics,
+    MetricsCollector,
+    current_debate,
+    debate_context,
+    format_summary,
+)
+
+
+class TestMetricsCollector:
+    """Tests for MetricsCollector."""
+
+    def test_summary_groups_calls(self):
+        collector = MetricsCollector()
+        collector.record(CallMetrics(model="m", provider="p", agent="GPT", round=1, latency=1.0, cost=0.5))
+        collector.record(CallMetrics(model="m", provider="p", agent="GPT", round=2, latency=3.0, cost=0.5))
+        collector.record(CallMetrics(model="m", provider="p", agent="Claude", round=2, prompt_tokens=7))
+
+        by_agent = collector.summary()
+        assert by_agent["GPT"].calls == 2
+        assert by_agent["GPT"].avg_latency == 2.0
+        assert by_agent["GPT"].cost == 1.0
+        assert by_agent["Claude"].prompt_tokens == 7
+        assert collector.summary(by="round")[2].calls == 2
+        assert "Total" in format_summary(by_agent)
+
+    def test_summary_filters_by_debate(self):
+        collector = MetricsCollector()
+        collector.record(CallMetrics(model="m", provider="p", debate_id="a"))
+        collector.record(CallMetrics(model="m", provider="p", debate_id="b"))
+
+        assert collector.summary(by="debate_id", debate_id="a").keys() == {"a"}
+
+    def test_hooks_receive_calls(self):
+        collector = MetricsCollector()
+        seen = []
+        collector.add_hook(seen.append)
+        collector.record(CallMetrics(model="m", provider="p"))
+        collector.remove_hook(seen.append)
+        collector.record(CallMetrics(model="m", provider="p"))
+
+        assert len(seen) == 1
+
+
+class TestDebateContext:
+    """Tests for debate attribution."""
+
+    def test_context_is_scoped(self):
+        assert current_debate() is None
+        with debate_context("d1") as ctx:
+            ctx.round = 3
+            assert current_debate().debate_id == "d1"
+            assert current_debate().round == 3
+        assert current_debate() is None
+
+
+class TestClientMetrics:
+    """Tests for metrics recorded by LiteLLMChatClient."""
+
+    @pytest.mark.asyncio
+    async def test_records_usage_agent_and_debate(self, mock_acompletion):
+        mock_acompletion.return_value.usage = SimpleNamespace(
+            prompt_tokens=12, completion_tokens=5, total_tokens=17
+        )
+        collector = MetricsCollector()
+        client = LiteLLMChatClient(model="openai/gpt-4o-mini", metrics=collector)
+        client._update_agent_name("GPT")
+
+        with debate_context("d1") as ctx:
+            ctx.round = 2
+            response = await client.get_response("hi")
+
+        call = collector.calls[0]
+        assert (call.agent, call.debate_id, call.round) == ("GPT", "d1", 2)
+        assert (call.prompt_tokens, call.completion_tokens) == (12, 5)
+        assert call.cost > 0
+        assert response.usage_details.total_token_count == 17
+
+    @pytest.mark.asyncio
+    async def test_records_errors(self, mock_acompletion):
+        mock_acompletion.side_effect = ValueError("bad request")
+        collector = MetricsCollector()
+        client = LiteLLMChatClient(model="test/model", metrics=collector)
+
+        with pytest.raises(ValueError):
+            await client.get_response("hi")
+
+        assert collector.calls[0].error == "ValueError"
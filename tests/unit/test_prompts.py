@@ -0,0 +1,81 @@
+"""Tests for the prompt registry."""
+
+import os
+import re
+
+import pytest
+
+from llm_fight_club.agents.orchestrator import OrchestratorAgent
+from llm_fight_club.prompts import PromptRegistry, get_system_prompt, prompt_registry
+
+
+def write_prompt(directory, name: str, text: str, mtime: int) -> None:
+    path = directory / f"{name}.yaml"
+    path.write_text(f"name: {name}\nsystem_prompt: |\n  {text}\n", encoding="utf-8")
+    os.utime(path, ns=(mtime, mtime))
+
+
+class TestPromptRegistry:
+    """Tests for caching, reload and templating."""
+
+    def test_parses_each_file_once(self, tmp_path, monkeypatch):
+        write_prompt(tmp_path, "gpt", "You are GPT.", 1_000_000_000)
+        registry = PromptRegistry(tmp_path, check_interval=0)
+        loads = []
+        original = registry._load
+        monkeypatch.setattr(registry, "_load", lambda name: loads.append(name) or original(name))
+
+        for _ in range(5):
+            assert registry.system_prompt("gpt") == "You are GPT.\n"
+
+        assert loads == ["gpt"]
+
+    def test_reloads_changed_file(self, tmp_path):
+        write_prompt(tmp_path, "gpt", "old", 1_000_000_000)
+        registry = PromptRegistry(tmp_path, check_interval=0)
+        assert registry.system_prompt("gpt") == "old\n"
+        version = registry.version
+
+        write_prompt(tmp_path, "gpt", "new", 2_000_000_000)
+
+        assert registry.system_prompt("gpt") == "new\n"
+        assert registry.version > version
+
+    def test_check_interval_delays_reload(self, tmp_path):
+        write_prompt(tmp_path, "gpt", "old", 1_000_000_000)
+        registry = PromptRegistry(tmp_path, check_interval=3600)
+        registry.system_prompt("gpt")
+
+        write_prompt(tmp_path, "gpt", "new", 2_000_000_000)
+
+        assert registry.system_prompt("gpt") == "old\n"
+
+    def test_substitutes_variables(self, tmp_path):
+        write_prompt(tmp_path, "host", "Topic: $topic, order: $participants, cost: $$5, $unknown", 1)
+        registry = PromptRegistry(tmp_path)
+
+        prompt = registry.system_prompt("host", topic="AI", participants="GPT → Claude")
+
+        assert prompt == "Topic: AI, order: GPT → Claude, cost: $5, $unknown\n"
+
+    def test_load_returns_copy(self, tmp_path):
+        write_prompt(tmp_path, "gpt", "x", 1)
+        registry = PromptRegistry(tmp_path)
+
+        registry.load("gpt")["system_prompt"] = "changed"
+
+        assert registry.load("gpt")["system_prompt"] == "x\n"
+
+    def test_missing_prompt(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            PromptRegistry(tmp_path).load("nobody")
+
+    def test_orchestrator_prompt_lists_participants(self):
+        prompt = get_system_prompt("orchestrator", participants="GPT → Claude → Gemini → Grok")
+        assert "GPT → Claude → Gemini → Grok → (repeat)" in prompt
+        assert "$participants" not in prompt
+
+    def test_no_placeholder_left_without_variables(self):
+        for name in prompt_registry.load_all():
+            assert not re.search(r"\$\w", get_system_prompt(name)), name
+        assert "GPT → Claude → Gemini → Grok" in OrchestratorAgent().system_prompt
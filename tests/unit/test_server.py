@@ -0,0 +1,150 @@
+"""Tests for the debate HTTP server."""
+
+import asyncio
+import json
+
+import pytest
+
+from llm_fight_club.agents import AgentRegistry
+from llm_fight_club.clients import FakeLLM
+from llm_fight_club.server import DebateServer, DebateService, QueueFullError
+from llm_fight_club.workflows import SQLiteTranscriptStore
+
+
+async def request(
+    server: DebateServer,
+    method: str,
+    path: str,
+    body: dict | None = None,
+    content_length: str | None = None,
+):
+    reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+    payload = json.dumps(body).encode() if body is not None else b""
+    length = len(payload) if content_length is None else content_length
+    writer.write(
+        f"{method} {path} HTTP/1.1\r\nHost: test\r\nContent-Length: {length}\r\n\r\n".encode()
+        + payload
+    )
+    await writer.drain()
+    raw = await reader.read()
+    writer.close()
+    head, _, content = raw.partition(b"\r\n\r\n")
+    status = int(head.split(b" ")[1])
+    return status, head.decode(), content.decode()
+
+
+def parse_sse(content: str) -> list[tuple[str, dict]]:
+    events = []
+    for block in content.strip().split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in block.split("\n") if not line.startswith(":"))
+        events.append((fields["event"], json.loads(fields["data"])))
+    return events
+
+
+@pytest.fixture
+async def server():
+    registry = AgentRegistry(completion_fn=FakeLLM(completion_tokens=4, latency=0.01))
+    server = DebateServer(DebateService(max_concurrent=2, max_queue=2, registry=registry), port=0)
+    await server.start()
+    yield server
+    await server.close()
+
+
+class TestDebateServer:
+    """Tests for the HTTP endpoints."""
+
+    @pytest.mark.asyncio
+    async def test_streams_debate_over_sse(self, server):
+        status, head, content = await request(
+            server, "POST", "/debates", {"topic": "テスト", "max_rounds": 2, "scheduler": "round_robin"}
+        )
+        assert status == 202
+        debate_id = json.loads(content)["id"]
+
+        status, head, content = await request(server, "GET", f"/debates/{debate_id}/events")
+        events = parse_sse(content)
+
+        assert "text/event-stream" in head
+        assert {"GPT", "Claude"} <= {data["agent"] for event, data in events if event == "update"}
+        assert ("result", {"result": " ".join(["lorem"] * 4)}) in events
+        assert events[-1] == ("status", {"status": "finished"})
+
+        status, _, content = await request(server, "GET", f"/debates/{debate_id}")
+        assert json.loads(content)["status"] == "finished"
+        assert json.loads(content)["history"]
+
+    @pytest.mark.asyncio
+    async def test_rejects_invalid_requests(self, server):
+        assert (await request(server, "POST", "/debates", {"max_rounds": 2}))[0] == 400
+        assert (await request(server, "POST", "/debates", {"topic": "x", "max_rounds": True}))[0] == 400
+        assert (await request(server, "POST", "/debates", {"topic": "x", "scheduler": "?"}))[0] == 400
+        assert (await request(server, "POST", "/debates", {"topic": "x", "scheduler": "weighted:GPT=x"}))[0] == 400
+        assert (await request(server, "GET", "/debates/missing"))[0] == 404
+        assert (await request(server, "GET", "/debates"))[0] == 405
+
+    @pytest.mark.asyncio
+    async def test_rejects_bad_content_length(self, server):
+        for value in ("abc", "-1", "+5", "1_0"):
+            status, _, content = await request(server, "POST", "/debates", {"topic": "x"}, value)
+            assert status == 400, value
+            assert json.loads(content) == {"error": "Invalid Content-Length"}
+        assert (await request(server, "POST", "/debates", {"topic": "x"}, str(10**9)))[0] == 413
+
+
+class TestDebateService:
+    """Tests for admission control."""
+
+    @pytest.mark.asyncio
+    async def test_rejects_when_queue_is_full(self):
+        service = DebateService(max_concurrent=1, max_queue=2)
+
+        service.submit("a")
+        service.submit("b")
+        with pytest.raises(QueueFullError):
+            service.submit("c")
+
+        assert service.stats()["queued"] == 2
+        assert service.stats()["rejected"] == 1
+
+    @pytest.mark.asyncio
+    async def test_bounds_in_flight_debates(self):
+        registry = AgentRegistry(completion_fn=FakeLLM(completion_tokens=4, latency=0.02))
+        service = DebateService(max_concurrent=2, max_queue=8, registry=registry)
+        jobs = [service.submit(f"topic {i}", max_rounds=2, scheduler="round_robin") for i in range(5)]
+        service.start()
+
+        peak = 0
+        while not all(job.done for job in jobs):
+            peak = max(peak, service.stats()["in_flight"])
+            await asyncio.sleep(0.005)
+        await service.close()
+
+        assert peak == 2
+        assert service.stats()["completed"] == 5
+
+    @pytest.mark.asyncio
+    async def test_finished_job_keeps_one_update_per_turn(self, tmp_path):
+        registry = AgentRegistry(completion_fn=FakeLLM(completion_tokens=4))
+        service = DebateService(
+            registry=registry, transcript_store=SQLiteTranscriptStore(tmp_path / "t.db"), max_finished=0
+        )
+        server = DebateServer(service, port=0)
+        await server.start()
+        try:
+            job = service.submit("テスト", max_rounds=2, scheduler="round_robin")
+            while not job.done:
+                await asyncio.sleep(0.005)
+
+            updates = [data for event, data in job.events if event == "update"]
+            assert len({u["turn_id"] for u in updates}) == len(updates)
+            assert len(updates) == len(job.history)
+
+            # Evicted from memory, still served from the transcript store
+            service.submit("次", max_rounds=1, scheduler="round_robin")
+            assert job.id not in service.jobs
+            status, head, content = await request(server, "GET", f"/debates/{job.id}/transcript")
+            assert status == 200
+            assert "text/markdown" in head
+            assert content.startswith("# テスト")
+        finally:
+            await server.close()
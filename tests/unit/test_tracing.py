@@ -0,0 +1,106 @@
+"""Tests for span tracing."""
+
+import json
+
+import pytest
+
+from llm_fight_club.agents import AgentRegistry
+from llm_fight_club.clients import FakeLLM
+from llm_fight_club.metrics import debate_context
+from llm_fight_club.tracing import Tracer, default_tracer
+from llm_fight_club.workflows import FightClubGroupChat
+
+
+class TestTracer:
+    """Tests for recording and exporting spans."""
+
+    def test_spans_nest_and_record_errors(self):
+        tracer = Tracer()
+
+        with debate_context("d1") as debate, tracer.span("debate", "workflow", track="workflow") as root:
+            debate.round = 2
+            call = tracer.start("llm_call", "llm", track="GPT")
+            with pytest.raises(ValueError), tracer.span("on_message", "callback"):
+                raise ValueError("boom")
+            tracer.finish(call, model="m")
+
+        callback, llm_call, recorded_root = tracer.spans
+        assert recorded_root is root and root.parent_id is None
+        assert llm_call.parent_id == callback.parent_id == root.span_id
+        assert callback.track == "workflow" and callback.attributes["error"] == "ValueError"
+        assert llm_call.attributes == {"round": 2, "model": "m"}
+        assert {span.debate_id for span in tracer.spans} == {"d1"}
+        assert root.duration >= llm_call.duration > 0
+
+    def test_disabled_tracer_records_nothing(self):
+        tracer = Tracer(enabled=False)
+
+        with tracer.span("debate", "workflow") as span:
+            assert span is None
+        assert tracer.start("llm_call", "llm") is None
+        assert not tracer.spans
+
+    def test_chrome_trace_has_a_process_per_debate_and_a_thread_per_track(self, tmp_path):
+        tracer = Tracer()
+        for debate_id in ("a", "b"):
+            with debate_context(debate_id), tracer.span("debate", "workflow", track="workflow"):
+                tracer.finish(tracer.start("llm_call", "llm", track="GPT"))
+
+        path = tmp_path / "trace.json"
+        tracer.write_chrome_trace(path)
+        events = json.loads(path.read_text(encoding="utf-8"))["traceEvents"]
+
+        spans = [e for e in events if e["ph"] == "X"]
+        names = {e["args"]["name"] for e in events if e["ph"] == "M"}
+        assert len(spans) == 4 and min(e["ts"] for e in spans) == 0
+        assert len({e["pid"] for e in spans}) == 2 and len({e["tid"] for e in spans}) == 4
+        assert {"debate a", "debate b", "workflow", "GPT"} <= names
+
+    def test_otlp_spans_share_the_debate_trace(self):
+        tracer = Tracer()
+        debate_id = "0123456789abcdef0123456789abcdef"
+        with debate_context(debate_id), tracer.span("debate", "workflow"):
+            tracer.finish(tracer.start("llm_call", "llm"), cached=True, error=None)
+
+        (scope,) = tracer.to_otlp()["resourceSpans"][0]["scopeSpans"]
+        call, root = scope["spans"]
+        assert call["traceId"] == root["traceId"] == debate_id
+        assert call["parentSpanId"] == root["spanId"]
+        assert {"key": "cached", "value": {"boolValue": True}} in call["attributes"]
+        assert all(a["key"] != "error" for a in call["attributes"])
+        assert int(root["endTimeUnixNano"]) >= int(call["endTimeUnixNano"])
+
+
+class TestDebateTracing:
+    """Tests for the spans recorded while a debate runs."""
+
+    @pytest.fixture
+    def tracer(self, monkeypatch):
+        monkeypatch.setattr(default_tracer, "enabled", True)
+        default_tracer.clear()
+        yield default_tracer
+        default_tracer.clear()
+
+    @pytest.mark.asyncio
+    async def test_debate_events_calls_and_callbacks_are_traced(self, tracer):
+        chat = FightClubGroupChat(
+            registry=AgentRegistry(completion_fn=FakeLLM(completion_tokens=4)),
+            scheduler="round_robin",
+            max_rounds=2,
+            on_message=lambda agent, content: None,
+        )
+        await chat.run("テスト")
+
+        (root,) = [span for span in tracer.spans if span.name == "debate"]
+        calls = [span for span in tracer.spans if span.name == "llm_call"]
+        turns = [span for span in tracer.spans if span.name == "MagenticAgentMessageEvent"]
+        callbacks = [span for span in tracer.spans if span.name == "on_message"]
+
+        assert root.debate_id == chat.debate_id and root.attributes["topic"] == "テスト"
+        assert {span.debate_id for span in tracer.spans} == {chat.debate_id}
+        assert all(span.parent_id == root.span_id for span in calls + turns + callbacks)
+        assert {call.track for call in calls} >= {turn.attributes["agent"] for turn in turns}
+        assert len(callbacks) == len(chat.conversation_history)
+        streamed = [call for call in calls if call.attributes.get("stream")]
+        assert streamed and all(call.attributes["chunks"] > 0 for call in streamed)
+        assert all("convert_seconds" in call.attributes for call in streamed)
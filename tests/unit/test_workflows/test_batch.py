@@ -0,0 +1,87 @@
+"""Tests for the batch debate runner."""
+
+import asyncio
+import json
+
+import pytest
+
+from llm_fight_club.workflows.batch import BatchTopic, load_topics, run_batch
+
+
+class FakeChat:
+    """Stand-in for FightClubGroupChat tracking concurrency."""
+
+    active = 0
+    peak = 0
+
+    def __init__(self, max_rounds=10, **kwargs):
+        self.max_rounds = max_rounds
+        self.conversation_history = []
+
+    async def run(self, topic):
+        FakeChat.active += 1
+        FakeChat.peak = max(FakeChat.peak, FakeChat.active)
+        await asyncio.sleep(0.01)
+        FakeChat.active -= 1
+        if topic == "boom":
+            raise RuntimeError("provider down")
+        self.conversation_history = [{"agent": "GPT", "content": topic}]
+        return f"{topic}:{self.max_rounds}"
+
+
+@pytest.fixture
+def fake_chat(monkeypatch):
+    FakeChat.active = 0
+    FakeChat.peak = 0
+    monkeypatch.setattr("llm_fight_club.workflows.batch.FightClubGroupChat", FakeChat)
+    return FakeChat
+
+
+class TestLoadTopics:
+    """Tests for load_topics."""
+
+    def test_accepts_strings_and_objects(self, tmp_path):
+        path = tmp_path / "topics.jsonl"
+        path.write_text(
+            '"AIは人類の仕事を奪うか"\n\n{"id": "x", "topic": "React vs Vue", "max_rounds": 3}\n',
+            encoding="utf-8",
+        )
+
+        topics = load_topics(path)
+
+        assert topics == [
+            BatchTopic(id="1", topic="AIは人類の仕事を奪うか"),
+            BatchTopic(id="x", topic="React vs Vue", max_rounds=3),
+        ]
+
+    def test_missing_topic_raises(self, tmp_path):
+        path = tmp_path / "topics.jsonl"
+        path.write_text('{"id": 1}\n', encoding="utf-8")
+
+        with pytest.raises(ValueError):
+            load_topics(path)
+
+
+class TestRunBatch:
+    """Tests for run_batch."""
+
+    @pytest.mark.asyncio
+    async def test_respects_concurrency_limit(self, fake_chat, tmp_path):
+        topics = [f"t{i}" for i in range(10)]
+
+        results = await run_batch(topics, tmp_path / "out.jsonl", max_concurrency=3)
+
+        assert len(results) == 10
+        assert fake_chat.peak == 3
+
+    @pytest.mark.asyncio
+    async def test_writes_results_and_errors(self, fake_chat, tmp_path):
+        out = tmp_path / "out.jsonl"
+        topics = [BatchTopic(id="a", topic="ok", max_rounds=2), BatchTopic(id="b", topic="boom")]
+
+        await run_batch(topics, out, max_rounds=7)
+
+        lines = {row["id"]: row for row in map(json.loads, out.read_text(encoding="utf-8").splitlines())}
+        assert lines["a"]["result"] == "ok:2"
+        assert lines["a"]["history"] == [{"agent": "GPT", "content": "ok"}]
+        assert lines["b"]["error"] == "provider down"
@@ -0,0 +1,92 @@
+"""Tests for per-debate budgets."""
+
+import pytest
+
+from llm_fight_club.agents import AgentRegistry
+from llm_fight_club.clients import FakeLLM
+from llm_fight_club.metrics import CallMetrics, DebateContext, MetricsCollector, default_metrics
+from llm_fight_club.workflows import Budget, BudgetTracker, FightClubGroupChat
+from llm_fight_club.workflows.budget import STOPPED_MESSAGE
+
+
+def call(debate_id: str, tokens: int, cost: float = 0.0) -> CallMetrics:
+    return CallMetrics(model="m", provider="p", debate_id=debate_id, prompt_tokens=tokens, cost=cost)
+
+
+class TestBudgetTracker:
+    """Tests for usage accounting."""
+
+    def test_counts_only_its_debate(self):
+        metrics = MetricsCollector()
+        with BudgetTracker(Budget(max_tokens=100), DebateContext("a"), metrics) as tracker:
+            metrics.record(call("a", 30))
+            metrics.record(call("b", 500))
+        metrics.record(call("a", 30))
+
+        assert (tracker.usage.calls, tracker.usage.tokens) == (1, 30)
+        assert tracker.usage.exceeded is None
+
+    def test_downgrades_then_exceeds(self):
+        debate = DebateContext("a")
+        tracker = BudgetTracker(Budget(max_cost=1.0, downgrades={"big": "small"}), debate)
+
+        tracker.add(call("a", 0, cost=0.5))
+        assert debate.models == {}
+        tracker.add(call("a", 0, cost=0.35))
+        assert debate.models == {"big": "small"}
+        assert not tracker.check()
+        tracker.add(call("a", 0, cost=0.2))
+        assert tracker.check()
+        assert tracker.usage.exceeded == "max_cost"
+
+    def test_rejects_unknown_action(self):
+        with pytest.raises(ValueError):
+            Budget(on_exceeded="explode")
+
+
+def make_chat(budget: Budget) -> FightClubGroupChat:
+    return FightClubGroupChat(
+        max_rounds=4,
+        registry=AgentRegistry(completion_fn=FakeLLM(completion_tokens=8)),
+        scheduler="round_robin",
+        budget=budget,
+    )
+
+
+def speakers(chat: FightClubGroupChat) -> list[str]:
+    return [m["agent"] for m in chat.conversation_history if m["agent"] != "Orchestrator"]
+
+
+class TestBudgetedDebate:
+    """Tests for ending a debate at its budget."""
+
+    @pytest.mark.asyncio
+    async def test_limit_forces_early_synthesis(self):
+        chat = make_chat(Budget(max_tokens=1))
+
+        result = await chat.run("テスト")
+
+        assert speakers(chat) == ["GPT"]
+        assert result.split() == ["lorem"] * 8
+        assert chat.budget_usage.exceeded == "max_tokens"
+
+    @pytest.mark.asyncio
+    async def test_stop_skips_synthesis(self):
+        chat = make_chat(Budget(max_tokens=1, on_exceeded="stop"))
+
+        result = await chat.run("テスト")
+
+        assert speakers(chat) == ["GPT"]
+        assert result == STOPPED_MESSAGE
+        assert chat.budget_usage.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_downgrade_switches_models(self):
+        chat = make_chat(Budget(max_tokens=10**6, downgrade_at=0.0))
+
+        await chat.run("テスト")
+
+        models = default_metrics.summary(by="model", debate_id=chat.debate_id)
+        assert "openai/gpt-4o-mini" in models
+        assert "openai/gpt-4o" not in models
+        assert speakers(chat) == ["GPT", "Claude", "Gemini", "Grok"]
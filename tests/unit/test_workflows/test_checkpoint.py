@@ -0,0 +1,153 @@
+"""Tests for durable checkpoints and resumable debates."""
+
+import json
+from dataclasses import asdict
+
+import pytest
+from agent_framework import WorkflowCheckpoint
+
+from llm_fight_club.agents import AgentRegistry
+from llm_fight_club.clients import FakeLLM
+from llm_fight_club.workflows import FightClubGroupChat, SQLiteCheckpointStorage, SQLiteTranscriptStore
+from llm_fight_club.workflows.checkpoint import diff, patch
+
+
+def make_checkpoint(step: int, workflow_id: str = "wf") -> WorkflowCheckpoint:
+    history = [{"text": f"turn {i} " * 20} for i in range(step)]
+    return WorkflowCheckpoint(
+        checkpoint_id=f"{workflow_id}-{step}",
+        workflow_id=workflow_id,
+        shared_state={"history": history, "round": step},
+        iteration_count=step,
+        timestamp="2025-01-01T00:00:00+00:00",
+    )
+
+
+class TestDelta:
+    """Tests for the delta encoding."""
+
+    def test_round_trip(self):
+        old = {"a": [1, 2], "b": {"c": 1, "d": 2}, "e": "x"}
+        new = {"a": [1, 2, 3], "b": {"c": 5}, "f": None}
+
+        delta = diff(old, new)
+
+        assert patch(old, delta) == new
+        assert delta["d"]["a"] == {"a": [3]}
+
+    def test_equal_values_have_no_delta(self):
+        assert diff({"a": [1]}, {"a": [1]}) is None
+
+
+class TestSQLiteCheckpointStorage:
+    """Tests for the SQLite checkpoint store."""
+
+    @pytest.mark.asyncio
+    async def test_round_trip_across_keyframes(self, tmp_path):
+        storage = SQLiteCheckpointStorage(tmp_path / "cp.db", keyframe_interval=3)
+        for step in range(7):
+            await storage.save_checkpoint(make_checkpoint(step))
+
+        reopened = SQLiteCheckpointStorage(tmp_path / "cp.db", keyframe_interval=3)
+        for step in range(7):
+            loaded = await reopened.load_checkpoint(f"wf-{step}")
+            assert asdict(loaded) == asdict(make_checkpoint(step))
+        assert await reopened.list_checkpoint_ids("wf") == [f"wf-{step}" for step in range(7)]
+        assert (await reopened.latest_checkpoint("wf")).checkpoint_id == "wf-6"
+
+    @pytest.mark.asyncio
+    async def test_deltas_are_smaller_than_snapshots(self, tmp_path):
+        storage = SQLiteCheckpointStorage(tmp_path / "cp.db")
+        full = 0
+        for step in range(16):
+            checkpoint = make_checkpoint(step)
+            full += len(json.dumps(asdict(checkpoint)))
+            await storage.save_checkpoint(checkpoint)
+
+        (stored,) = storage._conn.execute("SELECT SUM(LENGTH(payload)) FROM checkpoints").fetchone()
+        assert stored * 10 < full
+
+    @pytest.mark.asyncio
+    async def test_delete_keeps_later_checkpoints_loadable(self, tmp_path):
+        storage = SQLiteCheckpointStorage(tmp_path / "cp.db")
+        for step in range(4):
+            await storage.save_checkpoint(make_checkpoint(step))
+
+        assert await storage.delete_checkpoint("wf-1")
+        assert not await storage.delete_checkpoint("wf-1")
+        assert await storage.load_checkpoint("wf-1") is None
+        assert asdict(await storage.load_checkpoint("wf-2")) == asdict(make_checkpoint(2))
+        await storage.save_checkpoint(make_checkpoint(4))
+        assert asdict(await storage.load_checkpoint("wf-4")) == asdict(make_checkpoint(4))
+
+
+class TestResume:
+    """Tests for resuming an interrupted debate."""
+
+    @pytest.mark.asyncio
+    async def test_resume_continues_from_last_turn(self, tmp_path):
+        llm = FakeLLM(completion_tokens=8)
+        registry = AgentRegistry(completion_fn=llm)
+        chat = FightClubGroupChat(
+            max_rounds=4,
+            registry=registry,
+            scheduler="round_robin",
+            checkpoint_storage=SQLiteCheckpointStorage(tmp_path / "cp.db"),
+        )
+        # Simulate a crash while Claude (the second speaker) is talking
+        async for update in chat.stream("テスト"):
+            if update.agent == "Claude":
+                break
+        calls_before = llm.calls
+
+        resumed = FightClubGroupChat(
+            registry=registry,
+            checkpoint_storage=SQLiteCheckpointStorage(tmp_path / "cp.db"),
+        )
+        result = await resumed.resume(chat.debate_id)
+
+        speakers = [m["agent"] for m in resumed.conversation_history if m["agent"] != "Orchestrator"]
+        assert speakers == ["GPT", "Claude", "Gemini", "Grok"]
+        # Claude's interrupted turn is redone; GPT's is not
+        assert llm.calls - calls_before == 4
+        assert result.split() == ["lorem"] * 8
+
+        again = FightClubGroupChat(
+            registry=registry,
+            checkpoint_storage=SQLiteCheckpointStorage(tmp_path / "cp.db"),
+        )
+        assert await again.resume(chat.debate_id) == result
+        assert llm.calls - calls_before == 4
+
+    @pytest.mark.asyncio
+    async def test_resume_does_not_duplicate_stored_transcript(self, tmp_path):
+        registry = AgentRegistry(completion_fn=FakeLLM(completion_tokens=8))
+        store = SQLiteTranscriptStore(tmp_path / "t.db")
+        chat = FightClubGroupChat(
+            max_rounds=4,
+            registry=registry,
+            scheduler="round_robin",
+            checkpoint_storage=SQLiteCheckpointStorage(tmp_path / "cp.db"),
+            transcript_store=store,
+        )
+        # Crash once Claude's turn is stored but before it is checkpointed
+        async for _ in chat.stream("テスト"):
+            if any(entry.agent == "Claude" for entry in store.entries(chat.debate_id)):
+                break
+
+        resumed = FightClubGroupChat(
+            registry=registry,
+            checkpoint_storage=SQLiteCheckpointStorage(tmp_path / "cp.db"),
+            transcript_store=store,
+        )
+        await resumed.resume(chat.debate_id)
+
+        entries = list(store.entries(chat.debate_id))
+        assert [e.to_message() for e in entries] == resumed.conversation_history
+        assert [e.seq for e in entries] == list(range(len(entries)))
+
+    @pytest.mark.asyncio
+    async def test_resume_unknown_debate(self, tmp_path):
+        chat = FightClubGroupChat(checkpoint_storage=SQLiteCheckpointStorage(tmp_path / "cp.db"))
+        with pytest.raises(ValueError):
+            await chat.resume("missing")
@@ -0,0 +1,172 @@
+"""Tests for the group chat workflow."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from agent_framework import (
+    ChatMessage,
+    MagenticAgentDeltaEvent,
+    MagenticAgentMessageEvent,
+    MagenticFinalResultEvent,
+    MagenticOrchestratorMessageEvent,
+)
+
+from llm_fight_club.workflows.group_chat import FightClubGroupChat, StreamUpdate
+
+
+class FakeAgent:
+    """Minimal stand-in for a MAF ChatAgent."""
+
+    def __init__(self, name: str, text: str = "", delay: float = 0.0, fail: bool = False):
+        self.name = name
+        self.text = text
+        self.delay = delay
+        self.fail = fail
+        self.prompts: list[str] = []
+
+    async def run(self, messages):
+        self.prompts.append(messages)
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("provider down")
+        return SimpleNamespace(text=self.text)
+
+
+class TestOpeningRound:
+    """Tests for the parallel opening statements round."""
+
+    @pytest.mark.asyncio
+    async def test_collects_statements_in_agent_order(self):
+        received = []
+        chat = FightClubGroupChat(on_message=lambda agent, content: received.append(agent))
+        agents = [
+            FakeAgent("GPT", "gpt opening", delay=0.02),
+            FakeAgent("Claude", "claude opening"),
+        ]
+
+        messages = await chat._run_opening_round(agents, "テスト")
+
+        assert [m.author_name for m in messages] == ["GPT", "Claude"]
+        assert [m.text for m in messages] == ["gpt opening", "claude opening"]
+        assert received == ["GPT", "Claude"]
+        assert "テスト" in agents[0].prompts[0]
+
+    @pytest.mark.asyncio
+    async def test_runs_agents_concurrently(self):
+        chat = FightClubGroupChat()
+        agents = [FakeAgent(f"A{i}", "ok", delay=0.1) for i in range(4)]
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await chat._run_opening_round(agents, "topic")
+
+        assert loop.time() - start < 0.3
+
+    @pytest.mark.asyncio
+    async def test_skips_failed_agents(self):
+        chat = FightClubGroupChat()
+        agents = [FakeAgent("GPT", "ok"), FakeAgent("Grok", fail=True)]
+
+        messages = await chat._run_opening_round(agents, "topic")
+
+        assert [m.author_name for m in messages] == ["GPT"]
+        assert chat.conversation_history == [{"agent": "GPT", "content": "ok"}]
+
+
+class FakeRegistry:
+    """Registry returning fake agents and no orchestrator client."""
+
+    def __init__(self, agents=None):
+        self.agents = agents or []
+
+    def get_agents(self, cache=None):
+        return self.agents
+
+    def get_orchestrator_client(self, cache=None):
+        return None
+
+
+class FakeWorkflow:
+    """Replays a fixed list of workflow events."""
+
+    def __init__(self, events):
+        self.events = events
+        self.start_messages = None
+
+    def with_standard_manager(self, *args, **kwargs):
+        return self
+
+    def participants(self, **participants):
+        return self
+
+    def start_with_message(self, message):
+        return self
+
+    async def run_stream(self, messages):
+        self.start_messages = messages
+        for event in self.events:
+            yield event
+
+
+@pytest.fixture
+def fake_workflow(monkeypatch):
+    """Patch MagenticBuilder so that run() replays canned events."""
+    workflow = FakeWorkflow([
+        MagenticOrchestratorMessageEvent(message=ChatMessage(role="assistant", text="GPT、どうぞ")),
+        MagenticAgentDeltaEvent(agent_id="GPT", text="Hel"),
+        MagenticAgentDeltaEvent(agent_id="GPT", text="lo"),
+        MagenticAgentMessageEvent(agent_id="GPT", message=ChatMessage(role="assistant", text="Hello")),
+        MagenticAgentMessageEvent(agent_id="Grok", message=ChatMessage(role="assistant", text="Error")),
+        MagenticFinalResultEvent(message=ChatMessage(role="assistant", text="まとめ")),
+    ])
+    monkeypatch.setattr("llm_fight_club.workflows.group_chat.MagenticBuilder", lambda: workflow)
+    return workflow
+
+
+class TestStreaming:
+    """Tests for token-level streaming."""
+
+    @pytest.mark.asyncio
+    async def test_stream_yields_deltas_with_turn_ids(self, fake_workflow):
+        chat = FightClubGroupChat(registry=FakeRegistry())
+
+        updates = [update async for update in chat.stream("topic")]
+
+        assert updates == [
+            StreamUpdate(agent="Orchestrator", delta="GPT、どうぞ", turn_id=0),
+            StreamUpdate(agent="GPT", delta="Hel", turn_id=1),
+            StreamUpdate(agent="GPT", delta="lo", turn_id=1),
+            StreamUpdate(agent="Grok", delta="Error", turn_id=2),
+        ]
+        assert chat.final_result == "まとめ"
+        assert [m["agent"] for m in chat.conversation_history] == ["Orchestrator", "GPT", "Grok"]
+
+    @pytest.mark.asyncio
+    async def test_run_calls_on_delta_and_on_message(self, fake_workflow):
+        deltas = []
+        messages = []
+        chat = FightClubGroupChat(
+            registry=FakeRegistry(),
+            on_delta=deltas.append,
+            on_message=lambda agent, content: messages.append((agent, content)),
+        )
+
+        result = await chat.run("topic")
+
+        assert result == "まとめ"
+        assert [d.delta for d in deltas] == ["Hel", "lo"]
+        assert ("GPT", "Hello") in messages
+
+    @pytest.mark.asyncio
+    async def test_opening_statements_seed_history(self, fake_workflow):
+        agents = [FakeAgent("GPT", "gpt opening"), FakeAgent("Claude", "claude opening")]
+        chat = FightClubGroupChat(registry=FakeRegistry(agents), parallel_opening=True)
+
+        updates = [update async for update in chat.stream("topic")]
+
+        assert updates[0] == StreamUpdate(agent="GPT", delta="gpt opening", turn_id=0)
+        assert updates[1] == StreamUpdate(agent="Claude", delta="claude opening", turn_id=1)
+        start = fake_workflow.start_messages
+        assert [m.author_name for m in start[:2]] == ["GPT", "Claude"]
+        assert "topic" in start[-1].text
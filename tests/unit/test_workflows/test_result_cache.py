@@ -0,0 +1,62 @@
+"""Tests for the finished-debate cache."""
+
+import pytest
+
+from llm_fight_club.agents import AgentRegistry
+from llm_fight_club.clients import FakeLLM, InMemoryResponseCache
+from llm_fight_club.workflows import DebateResultCache, FightClubGroupChat, normalize_topic
+
+
+def test_normalize_topic():
+    assert normalize_topic("  Ｒｅａｃｔ  vs\nVue ") == normalize_topic("react vs vue")
+
+
+class TestDebateResultCache:
+    """Tests for replaying finished debates."""
+
+    @pytest.fixture
+    def fake(self):
+        return FakeLLM(completion_tokens=4)
+
+    @pytest.fixture
+    def cache(self):
+        return DebateResultCache(InMemoryResponseCache())
+
+    @staticmethod
+    def chat(fake: FakeLLM, cache: DebateResultCache, **kwargs) -> FightClubGroupChat:
+        kwargs.setdefault("max_rounds", 2)
+        return FightClubGroupChat(
+            registry=AgentRegistry(completion_fn=fake),
+            scheduler="round_robin",
+            result_cache=cache,
+            **kwargs,
+        )
+
+    @pytest.mark.asyncio
+    async def test_hit_replays_without_llm_calls(self, fake, cache):
+        first = self.chat(fake, cache)
+        result = await first.run("テスト")
+        calls = fake.calls
+
+        replayed = []
+        second = self.chat(fake, cache, on_message=lambda agent, content: replayed.append(agent))
+        assert await second.run(" テスト ") == result
+
+        assert fake.calls == calls
+        assert second.result_cached and not first.result_cached
+        assert second.conversation_history == first.conversation_history
+        assert replayed == [m["agent"] for m in first.conversation_history]
+        assert second.debate_id != first.debate_id
+
+    @pytest.mark.asyncio
+    async def test_settings_change_or_refresh_debates_again(self, fake, cache):
+        await self.chat(fake, cache).run("テスト")
+
+        other_rounds = self.chat(fake, cache, max_rounds=3)
+        await other_rounds.run("テスト")
+        refreshed = self.chat(fake, cache, refresh=True)
+        await refreshed.run("テスト")
+
+        assert not other_rounds.result_cached
+        assert not refreshed.result_cached
+        assert cache.cache.stats.hits == 0
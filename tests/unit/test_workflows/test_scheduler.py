@@ -0,0 +1,85 @@
+"""Tests for rule-based speaker scheduling."""
+
+from collections import Counter
+
+import pytest
+from agent_framework import ChatMessage
+
+from llm_fight_club.agents import AgentRegistry
+from llm_fight_club.clients import FakeLLM
+from llm_fight_club.workflows import FightClubGroupChat
+from llm_fight_club.workflows.scheduler import (
+    MentionScheduler,
+    RoundRobinScheduler,
+    WeightedScheduler,
+    get_scheduler,
+    scheduler_name,
+)
+
+PARTICIPANTS = ["GPT", "Claude", "Gemini", "Grok"]
+
+
+def said(author: str, text: str) -> ChatMessage:
+    return ChatMessage(role="assistant", text=text, author_name=author)
+
+
+class TestSchedulers:
+    """Tests for the scheduling rules."""
+
+    def test_round_robin_cycles(self):
+        scheduler = RoundRobinScheduler()
+        order = [scheduler.next_speaker(turn, PARTICIPANTS, []) for turn in range(6)]
+        assert order == ["GPT", "Claude", "Gemini", "Grok", "GPT", "Claude"]
+
+    def test_weighted_shares_turns(self):
+        scheduler = WeightedScheduler({"GPT": 3})
+        order = [scheduler.next_speaker(turn, PARTICIPANTS, []) for turn in range(12)]
+
+        assert Counter(order) == {"GPT": 6, "Claude": 2, "Gemini": 2, "Grok": 2}
+        assert all(a != b for a, b in zip(order, order[1:]) if a == "GPT")
+
+    def test_mention_picks_last_named_participant(self):
+        history = [said("GPT", "Claudeの意見には反対だが、Grokはどう思う？")]
+        assert MentionScheduler().next_speaker(1, PARTICIPANTS, history) == "Grok"
+
+    def test_mention_ignores_self_and_falls_back(self):
+        history = [said("GPT", "GPTとしては賛成です。")]
+        assert MentionScheduler().next_speaker(1, PARTICIPANTS, history) == "Claude"
+
+    def test_get_scheduler_rejects_unknown(self):
+        with pytest.raises(ValueError):
+            get_scheduler("random")
+
+    def test_weighted_is_selectable_with_weights(self):
+        scheduler = get_scheduler("weighted:GPT=3,Claude=0.5")
+
+        assert isinstance(scheduler, WeightedScheduler)
+        assert scheduler.weights == {"GPT": 3.0, "Claude": 0.5}
+        assert get_scheduler(scheduler_name(scheduler)).weights == scheduler.weights
+        assert scheduler_name(get_scheduler("weighted")) == "weighted"
+
+    @pytest.mark.parametrize("spec", ["weighted:GPT=0", "weighted:GPT", "weighted:GPT=x", "round_robin:GPT=2"])
+    def test_get_scheduler_rejects_bad_options(self, spec):
+        with pytest.raises(ValueError):
+            get_scheduler(spec)
+
+
+class TestScheduledDebate:
+    """Tests for debates driven by ScheduledMagenticManager."""
+
+    @pytest.mark.asyncio
+    async def test_only_final_answer_uses_manager_llm(self):
+        llm = FakeLLM(completion_tokens=8)
+        chat = FightClubGroupChat(
+            max_rounds=5,
+            registry=AgentRegistry(completion_fn=llm),
+            scheduler="round_robin",
+        )
+
+        result = await chat.run("テスト")
+
+        speakers = [m["agent"] for m in chat.conversation_history if m["agent"] in PARTICIPANTS]
+        assert speakers == ["GPT", "Claude", "Gemini", "Grok", "GPT"]
+        # Five participant turns plus one synthesis call
+        assert llm.calls == 6
+        assert result.split() == ["lorem"] * 8
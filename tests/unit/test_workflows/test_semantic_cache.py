@@ -0,0 +1,128 @@
+"""Tests for reusing debates on paraphrased topics."""
+
+import pytest
+
+from llm_fight_club.agents import AgentRegistry
+from llm_fight_club.clients import FakeLLM, InMemoryResponseCache, SQLiteResponseCache
+from llm_fight_club.workflows import (
+    BruteForceIndex,
+    FightClubGroupChat,
+    HashingEmbedder,
+    LSHIndex,
+    SemanticResultCache,
+)
+
+TOPICS = [
+    "Will AI take human jobs?",
+    "Will AI make humans happier?",
+    "Is remote work better than the office?",
+    "AIは人類の仕事を奪うか？",
+]
+
+
+def similarity(embed: HashingEmbedder, a: str, b: str) -> float:
+    return sum(x * y for x, y in zip(embed(a), embed(b)))
+
+
+class TestHashingEmbedder:
+    """Tests for the local topic embeddings."""
+
+    def test_paraphrases_score_above_distractors(self):
+        embed = HashingEmbedder()
+
+        paraphrase = similarity(embed, "Will AI take human jobs?", "Will AI take away human jobs?")
+        distractor = similarity(embed, "Will AI take human jobs?", "Will AI make humans happier?")
+
+        assert paraphrase > 0.8 > 0.65 > distractor
+        assert similarity(embed, "AIは人類の仕事を奪うか？", "AIは人類から仕事を奪うか？") > 0.75
+
+    def test_vectors_are_unit_length_and_stable(self):
+        embed = HashingEmbedder()
+
+        assert similarity(embed, "React vs Vue", "react  VS vue") == pytest.approx(1.0)
+        assert embed("") == [0.0] * embed.dim
+
+
+class TestIndexes:
+    """Tests for exact and approximate nearest-neighbour search."""
+
+    @pytest.mark.parametrize("index", [BruteForceIndex(), LSHIndex(dim=1024)])
+    def test_finds_the_closest_topic(self, index):
+        embed = HashingEmbedder()
+        for topic in TOPICS:
+            index.add(topic, embed(topic))
+
+        (best, score), *_ = index.search(embed("Will AI take away human jobs?"), k=2)
+
+        assert len(index) == len(TOPICS)
+        assert best == "Will AI take human jobs?"
+        assert score > 0.8
+
+    def test_empty_index(self):
+        assert BruteForceIndex().search(HashingEmbedder()("topic")) == []
+
+
+class TestSemanticResultCache:
+    """Tests for replaying a debate on a paraphrased topic."""
+
+    @staticmethod
+    def chat(fake: FakeLLM, cache: SemanticResultCache) -> FightClubGroupChat:
+        return FightClubGroupChat(
+            registry=AgentRegistry(completion_fn=fake),
+            scheduler="round_robin",
+            max_rounds=2,
+            result_cache=cache,
+        )
+
+    @pytest.mark.asyncio
+    async def test_paraphrase_replays_and_distractor_debates(self):
+        fake = FakeLLM(completion_tokens=4)
+        cache = SemanticResultCache(InMemoryResponseCache())
+
+        first = self.chat(fake, cache)
+        result = await first.run("Will AI take human jobs?")
+        calls = fake.calls
+
+        paraphrased = self.chat(fake, cache)
+        assert await paraphrased.run("Will AI take away human jobs?") == result
+        assert fake.calls == calls
+        assert paraphrased.cached_debate.topic == "Will AI take human jobs?"
+        assert 0.8 < paraphrased.cached_debate.similarity < 1.0
+
+        await self.chat(fake, cache).run("Will AI make humans happier?")
+        assert fake.calls > calls
+
+        await self.chat(fake, cache).run("will ai take human jobs?")
+        assert (cache.stats.exact_hits, cache.stats.semantic_hits, cache.stats.misses) == (1, 1, 2)
+        assert cache.stats.hit_rate == 0.5
+
+    @pytest.mark.asyncio
+    async def test_topics_are_shared_through_the_backing_cache(self):
+        fake = FakeLLM(completion_tokens=4)
+        backing = InMemoryResponseCache()
+        await self.chat(fake, SemanticResultCache(backing)).run("Will AI take human jobs?")
+
+        # A fresh instance (e.g. another worker process) rebuilds its index
+        reopened = SemanticResultCache(backing, index_factory=lambda: LSHIndex(dim=1024))
+        replayed = self.chat(fake, reopened)
+        await replayed.run("Will AI take away human jobs?")
+
+        assert replayed.result_cached
+        assert reopened.stats.semantic_hits == 1
+
+    @pytest.mark.asyncio
+    async def test_instances_on_one_file_keep_each_others_topics(self, tmp_path):
+        fake = FakeLLM(completion_tokens=4)
+        path = tmp_path / "results.db"
+        first, second = (SemanticResultCache(SQLiteResponseCache(path)) for _ in range(2))
+        # first's last write starts from a list loaded before second added its topic
+        await self.chat(fake, first).run("Is remote work better than the office?")
+        await self.chat(fake, second).run("Will AI take human jobs?")
+        await self.chat(fake, first).run("Should schools ban smartphones?")
+
+        for cache in (first, second, SemanticResultCache(SQLiteResponseCache(path))):
+            for paraphrase in ("Will AI take away human jobs?", "Is remote work better than an office?"):
+                replayed = self.chat(fake, cache)
+                await replayed.run(paraphrase)
+                assert replayed.result_cached, paraphrase
+
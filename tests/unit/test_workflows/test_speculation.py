@@ -0,0 +1,113 @@
+"""Tests for speculative next-speaker execution."""
+
+import pytest
+from agent_framework import ChatMessage, MagenticContext, MagenticManagerBase
+from agent_framework._workflows._magentic import _MagenticProgressLedger
+
+from llm_fight_club.agents import AgentRegistry
+from llm_fight_club.clients import FakeLLM
+from llm_fight_club.workflows import FightClubGroupChat, RoundRobinScheduler
+from llm_fight_club.workflows.scheduler import _item
+from llm_fight_club.workflows.speculation import (
+    SpeculativeAgent,
+    SpeculativeMagenticManager,
+    Speculator,
+)
+
+
+class FixedManager(MagenticManagerBase):
+    """Manager that always picks the same speaker."""
+
+    def __init__(self, speaker: str):
+        super().__init__(max_round_count=10)
+        self.speaker = speaker
+
+    async def plan(self, magentic_context):
+        return ChatMessage(role="assistant", text="plan")
+
+    async def replan(self, magentic_context):
+        return ChatMessage(role="assistant", text="plan")
+
+    async def create_progress_ledger(self, magentic_context):
+        return _MagenticProgressLedger(
+            is_request_satisfied=_item(False),
+            is_in_loop=_item(False),
+            is_progress_being_made=_item(True),
+            next_speaker=_item(self.speaker),
+            instruction_or_question=_item("go"),
+        )
+
+    async def prepare_final_answer(self, magentic_context):
+        return ChatMessage(role="assistant", text="done")
+
+
+def setup(speaker: str):
+    llm = FakeLLM(completion_tokens=8)
+    agents = {agent.name: agent for agent in AgentRegistry(completion_fn=llm).get_agents()}
+    speculator = Speculator(agents, predictor=RoundRobinScheduler())
+    manager = SpeculativeMagenticManager(FixedManager(speaker), speculator)
+    context = MagenticContext(
+        task=ChatMessage(role="user", text="トピック: テスト"),
+        participant_descriptions=dict.fromkeys(agents, ""),
+        round_count=1,
+    )
+    return llm, agents, speculator, manager, context
+
+
+async def collect(agent: SpeculativeAgent) -> str:
+    return "".join([update.text async for update in agent.run_stream([])])
+
+
+class TestSpeculation:
+    """Tests for committing and cancelling speculative turns."""
+
+    @pytest.mark.asyncio
+    async def test_hit_replays_speculative_turn(self):
+        llm, agents, speculator, manager, context = setup("GPT")
+
+        await manager.create_progress_ledger(context)
+        text = await collect(SpeculativeAgent(agents["GPT"], speculator))
+
+        assert text.split() == ["lorem"] * 8
+        assert llm.calls == 1
+        assert (speculator.stats.launched, speculator.stats.hits) == (1, 1)
+
+    @pytest.mark.asyncio
+    async def test_miss_cancels_and_calls_chosen_speaker(self):
+        _, agents, speculator, manager, context = setup("Claude")
+
+        await manager.create_progress_ledger(context)
+        text = await collect(SpeculativeAgent(agents["Claude"], speculator))
+
+        assert text.split() == ["lorem"] * 8
+        assert (speculator.stats.launched, speculator.stats.hits) == (1, 0)
+        assert speculator.stats.wasted_tokens > 0
+
+    @pytest.mark.asyncio
+    async def test_unused_commit_is_discarded_on_replan(self):
+        _, _, speculator, manager, context = setup("GPT")
+
+        await manager.create_progress_ledger(context)
+        await manager.replan(context)
+
+        assert speculator.take("GPT") is None
+        assert speculator.stats.hits == 0
+
+
+class TestSpeculativeDebate:
+    """Tests for FightClubGroupChat with speculation enabled."""
+
+    @pytest.mark.asyncio
+    async def test_debate_matches_non_speculative_run(self):
+        results = []
+        for speculate in (False, True):
+            chat = FightClubGroupChat(
+                max_rounds=4,
+                registry=AgentRegistry(completion_fn=FakeLLM(completion_tokens=8)),
+                speculate=speculate,
+            )
+            await chat.run("テスト")
+            results.append([m["agent"] for m in chat.conversation_history])
+
+        assert results[0] == results[1]
+        assert chat.speculation_stats.launched == 4
@@ -0,0 +1,65 @@
+"""Tests for debate transcripts."""
+
+import io
+
+import pytest
+
+from llm_fight_club.agents import AgentRegistry
+from llm_fight_club.clients import FakeLLM
+from llm_fight_club.workflows import FightClubGroupChat, SQLiteTranscriptStore, Transcript, export_markdown
+
+
+class TestTranscript:
+    """Tests for the in-memory window and the on-disk log."""
+
+    def test_window_is_bounded_but_store_keeps_everything(self, tmp_path):
+        store = SQLiteTranscriptStore(tmp_path / "t.db")
+        transcript = Transcript("d1", "topic", store, window=2)
+        for i in range(5):
+            transcript.append("GPT", f"message {i}")
+
+        assert len(transcript) == 5
+        assert [e.content for e in transcript.recent] == ["message 3", "message 4"]
+        assert [e.content for e in store.entries("d1", batch_size=2)] == [f"message {i}" for i in range(5)]
+
+    def test_continues_sequence_after_reopening(self, tmp_path):
+        Transcript("d1", "topic", SQLiteTranscriptStore(tmp_path / "t.db")).append("GPT", "a")
+
+        store = SQLiteTranscriptStore(tmp_path / "t.db")
+        Transcript("d1", "topic", store).append("Claude", "b")
+
+        assert [(e.seq, e.agent) for e in store.entries("d1")] == [(0, "GPT"), (1, "Claude")]
+        assert store.debate_ids() == ["d1"]
+
+    def test_export_unknown_debate(self, tmp_path):
+        with pytest.raises(ValueError):
+            export_markdown(SQLiteTranscriptStore(tmp_path / "t.db"), "missing", io.StringIO())
+
+
+class TestDebateTranscript:
+    """Tests for transcripts written by FightClubGroupChat."""
+
+    @pytest.mark.asyncio
+    async def test_debate_is_logged_and_exported(self, tmp_path):
+        store = SQLiteTranscriptStore(tmp_path / "t.db")
+        chat = FightClubGroupChat(
+            max_rounds=2,
+            registry=AgentRegistry(completion_fn=FakeLLM(completion_tokens=8)),
+            scheduler="round_robin",
+            transcript_store=store,
+        )
+
+        await chat.run("テスト")
+
+        entries = list(store.entries(chat.debate_id))
+        assert [e.to_message() for e in entries] == chat.conversation_history
+        participants = [e for e in entries if e.role == "participant"]
+        assert [e.agent for e in participants] == ["GPT", "Claude"]
+        assert all(e.completion_tokens == 8 and e.prompt_tokens > 0 for e in participants)
+
+        out = io.StringIO()
+        export_markdown(store, chat.debate_id, out)
+        markdown = out.getvalue()
+        assert markdown.startswith("# テスト\n")
+        assert "### [Claude]" in markdown
+        assert markdown.endswith("## Final Summary\n\n" + " ".join(["lorem"] * 8) + "\n")
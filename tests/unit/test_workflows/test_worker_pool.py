@@ -0,0 +1,75 @@
+"""Tests for the multi-process batch runner."""
+
+import json
+
+import pytest
+
+from llm_fight_club.agents import AgentRegistry
+from llm_fight_club.clients import FakeLLM
+from llm_fight_club.metrics import default_metrics
+from llm_fight_club.tracing import default_tracer
+from llm_fight_club.workflows import run_batch_workers
+
+
+def fake_registry() -> AgentRegistry:
+    return AgentRegistry(completion_fn=FakeLLM(completion_tokens=4))
+
+
+def broken_registry() -> AgentRegistry:
+    raise RuntimeError("worker cannot start")
+
+
+class TestRunBatchWorkers:
+    """Tests for run_batch_workers."""
+
+    @pytest.mark.asyncio
+    async def test_debates_are_shared_between_workers(self, tmp_path):
+        out = tmp_path / "out.jsonl"
+        default_metrics.clear()
+
+        results = await run_batch_workers(
+            [f"t{i}" for i in range(4)],
+            out,
+            workers=2,
+            max_concurrency=2,
+            max_rounds=2,
+            scheduler="round_robin",
+            registry_factory=fake_registry,
+        )
+
+        assert sorted(r.id for r in results) == ["1", "2", "3", "4"]
+        assert all(r.error is None and r.result.split() == ["lorem"] * 4 for r in results)
+        rows = [json.loads(line) for line in out.read_text(encoding="utf-8").splitlines()]
+        assert sorted(row["topic"] for row in rows) == ["t0", "t1", "t2", "t3"]
+        # Calls made in the workers are merged into this process's metrics
+        assert default_metrics.summary(by="agent")["GPT"].calls == 4
+
+    @pytest.mark.asyncio
+    async def test_dead_workers_fail_their_debates(self, tmp_path):
+        results = await run_batch_workers(
+            ["a", "b"],
+            tmp_path / "out.jsonl",
+            workers=1,
+            registry_factory=broken_registry,
+        )
+
+        assert [(r.topic, r.error) for r in results] == [("a", "worker process exited"), ("b", "worker process exited")]
+
+    @pytest.mark.asyncio
+    async def test_worker_spans_are_merged_when_tracing(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(default_tracer, "enabled", True)
+        default_tracer.clear()
+
+        results = await run_batch_workers(
+            ["t0", "t1"],
+            tmp_path / "out.jsonl",
+            workers=2,
+            max_rounds=2,
+            scheduler="round_robin",
+            registry_factory=fake_registry,
+        )
+
+        debates = {span.debate_id for span in default_tracer.spans if span.name == "debate"}
+        assert len(debates) == len(results) == 2
+        assert any(span.name == "llm_call" for span in default_tracer.spans)
+        default_tracer.clear()